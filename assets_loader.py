@@ -10,6 +10,7 @@ import random
 from typing import Dict, Optional, List
 import settings
 import sound_generator
+from mask_cache import get_mask
 
 
 class AssetsLoader:
@@ -20,11 +21,13 @@ class AssetsLoader:
         self.images: Dict[str, pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.explosion_frames: List[pygame.Surface] = []
+        self.masks: Dict[str, pygame.mask.Mask] = {}
         
         os.makedirs(settings.ASSETS_DIR, exist_ok=True)
         os.makedirs(settings.SFX_DIR, exist_ok=True)
         
         self._generate_images()
+        self._generate_masks()
         self._generate_explosion_frames()
         self._generate_sounds()
     
@@ -37,6 +40,12 @@ class AssetsLoader:
         self._create_tractor_beam()
         self._create_background()
     
+    def _generate_masks(self) -> None:
+        """정밀 충돌용 마스크 미리 생성 (이미지 객체 기준으로 캐시됨)"""
+        for name, surface in self.images.items():
+            if name != 'background':
+                self.masks[name] = get_mask(surface)
+    
     def _create_player_ship(self) -> None:
         """플레이어 우주선 생성"""
         width, height = 40, 48
@@ -341,6 +350,10 @@ class AssetsLoader:
         """이미지 가져오기"""
         return self.images.get(name)
     
+    def get_mask(self, name: str) -> Optional[pygame.mask.Mask]:
+        """정밀 충돌용 마스크 가져오기"""
+        return self.masks.get(name)
+    
     def get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
         """사운드 가져오기"""
         return self.sounds.get(name)
@@ -0,0 +1,452 @@
+# benchmark.py
+"""
+성능 측정 스크립트
+사용법: python benchmark.py [측정 이름 ...]  (생략하면 전체 측정)
+"""
+import os
+import sys
+import math
+import time
+import random
+import numpy as np
+from typing import Callable, Dict, Tuple
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import settings
+from assets_loader import AssetsLoader
+from broadphase import SpatialHash
+from bullet import (Bullet, PlayerBulletGroup, EnemyBulletGroup, get_bullet_velocity,
+                    steer_homing, steer_homing_bullets)
+from bullet_engine import BulletArray
+from player import Player
+from enemy import Enemy
+from wave_manager import WaveManager
+from paths import PATH_SHAPES, PathFollower, get_path_table
+from formation import FormationController
+from enemy_ai import EnemyAI, ROLL_FIRE
+from collision import (check_bullet_enemy_collision, check_player_bullet_collision,
+                       find_enemies_in_radius)
+
+
+def _timed(func: Callable, repeat: int) -> float:
+    """함수를 repeat번 실행한 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def _make_dense_wave(assets: AssetsLoader, wave_number: int, seed: int):
+    """웨이브 12 이상 밀도의 적/탄환 배치 생성 (편대 위치에 정렬)"""
+    random.seed(seed)
+    wave_manager = WaveManager(assets.get_image('enemy'), assets.get_image('boss'),
+                               assets.get_image('enemy_bullet'))
+    enemies = wave_manager.create_wave(wave_number)
+    for enemy in enemies:
+        enemy.rect.x = enemy.formation_x
+        enemy.rect.y = enemy.formation_y
+    
+    # 7방향 멀티샷 연사가 편대 전체에 퍼진 상태
+    player_bullets = PlayerBulletGroup()
+    for volley in range(12):
+        x = random.randint(60, settings.SCREEN_WIDTH - 60)
+        y = 420 - volley * 30
+        for angle in (-45, -30, -15, 0, 15, 30, 45):
+            player_bullets.add(Bullet(x, y, 'player', assets.get_image('player_bullet'),
+                                      angle=angle))
+    
+    enemy_bullets = EnemyBulletGroup()
+    for _ in range(300):
+        enemy_bullets.add(Bullet(random.randint(0, settings.SCREEN_WIDTH),
+                                 random.randint(0, settings.SCREEN_HEIGHT),
+                                 'enemy', assets.get_image('enemy_bullet'),
+                                 angle=random.choice((0, 15, -15, 30, -30))))
+    enemy_bullets.update()
+    return enemies, player_bullets, enemy_bullets
+
+
+def bench_collision_modes(assets: AssetsLoader) -> Dict[str, Tuple[float, float]]:
+    """사각형 전용 / 정밀(마스크) 충돌 모드 비교"""
+    player = Player(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT - 100,
+                    assets.get_image('player'), assets.get_image('player_bullet'))
+    results = {}
+    
+    for wave_number in (13, 14, 16):
+        timings = []
+        for precise in (False, True):
+            settings.PRECISE_COLLISION = precise
+            worlds = [_make_dense_wave(assets, wave_number, seed) for seed in range(20)]
+            spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+            
+            def run_once():
+                enemies, player_bullets, enemy_bullets = worlds.pop()
+                spatial_hash.rebuild(enemies)
+                check_bullet_enemy_collision(player_bullets, enemies, spatial_hash)
+                for bullet in list(enemy_bullets)[::10]:
+                    player.rect.center = bullet.rect.center
+                    check_player_bullet_collision(player, enemy_bullets)
+            
+            timings.append(_timed(run_once, len(worlds)))
+        
+        results[f'wave {wave_number}'] = tuple(timings)
+    
+    settings.PRECISE_COLLISION = False
+    
+    print("충돌 모드 비교 (프레임당 ms)")
+    for name, (rect_ms, mask_ms) in results.items():
+        print(f"  {name}: rect {rect_ms:.3f} / mask {mask_ms:.3f} (x{mask_ms / rect_ms:.2f})")
+    return results
+
+
+def bench_radius_queries(assets: AssetsLoader) -> Dict[str, float]:
+    """동시 폭발 여러 개의 원 범위 질의 (전수 sqrt / NumPy / 공간 해시)"""
+    random.seed(0)
+    enemies = pygame.sprite.Group()
+    for _ in range(500):
+        enemies.add(Enemy(random.randint(0, settings.SCREEN_WIDTH),
+                          random.randint(0, settings.SCREEN_HEIGHT // 2),
+                          Enemy.TYPE_NORMAL, assets.get_image('enemy'),
+                          assets.get_image('enemy_bullet')))
+    spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+    spatial_hash.rebuild(enemies)
+    blasts = [(random.randint(0, settings.SCREEN_WIDTH), random.randint(0, 480),
+               settings.PLASMA_SPLASH_RADIUS) for _ in range(8)]
+    blasts.append((settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT // 2, 400))
+    
+    def brute_force():
+        for x, y, radius in blasts:
+            [enemy for enemy in enemies
+             if math.sqrt((enemy.rect.centerx - x) ** 2 + (enemy.rect.centery - y) ** 2) <= radius]
+    
+    def kernel():
+        for x, y, radius in blasts:
+            find_enemies_in_radius(enemies, x, y, radius)
+    
+    def hashed():
+        for x, y, radius in blasts:
+            find_enemies_in_radius(enemies, x, y, radius, spatial_hash)
+    
+    results = {
+        'brute force': _timed(brute_force, 200),
+        'numpy': _timed(kernel, 200),
+        'spatial hash': _timed(hashed, 200),
+    }
+    
+    print(f"원 범위 질의 (적 {len(enemies)}기, 폭발 {len(blasts)}개, 프레임당 ms)")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f}")
+    return results
+
+
+def bench_wave_spawn(assets: AssetsLoader) -> Dict[str, float]:
+    """웨이브 생성 시간 (타입별 이미지 캐시 비움 / 채움)"""
+    wave_manager = WaveManager(assets.get_image('enemy'), assets.get_image('boss'),
+                               assets.get_image('enemy_bullet'))
+    
+    def cold():
+        Enemy._image_cache.clear()
+        wave_manager.create_wave(13)
+    
+    def warm():
+        wave_manager.create_wave(13)
+    
+    random.seed(0)
+    results = {'cold cache': _timed(cold, 50)}
+    random.seed(0)
+    results['warm cache'] = _timed(warm, 50)
+    
+    print("웨이브 13 생성 (ms)")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f}")
+    return results
+
+
+def bench_homing_retarget(assets: AssetsLoader) -> Dict[str, Tuple[float, float]]:
+    """호밍탄 50발 업데이트: 매 프레임 전수 탐색 / 공간 해시 + 재탐색 주기"""
+    results = {}
+    retarget_frames = settings.HOMING_RETARGET_FRAMES
+    
+    for count in (40, 160, 640):
+        random.seed(count)
+        enemies = pygame.sprite.Group()
+        for _ in range(count):
+            enemies.add(Enemy(random.randint(0, settings.SCREEN_WIDTH),
+                              random.randint(0, settings.SCREEN_HEIGHT // 2),
+                              Enemy.TYPE_NORMAL, assets.get_image('enemy'),
+                              assets.get_image('enemy_bullet')))
+        spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+        spatial_hash.rebuild(enemies)  # 게임에서는 충돌 처리와 공유하는 해시
+        
+        def make_bullets():
+            bullets = PlayerBulletGroup()
+            for i in range(50):
+                bullets.add(Bullet(random.randint(0, settings.SCREEN_WIDTH), 700 + i,
+                                   'player', assets.get_image('player_bullet'),
+                                   weapon_type='homing'))
+            return bullets
+        
+        settings.HOMING_RETARGET_FRAMES = 1
+        bullets = make_bullets()
+        brute_ms = _timed(lambda: bullets.update(enemies), 30)
+        
+        settings.HOMING_RETARGET_FRAMES = retarget_frames
+        bullets = make_bullets()
+        hashed_ms = _timed(lambda: bullets.update(enemies, spatial_hash), 30)
+        results[f'{count} enemies'] = (brute_ms, hashed_ms)
+    
+    print(f"호밍탄 50발 업데이트 (프레임당 ms, 재탐색 주기 {retarget_frames}프레임)")
+    for name, (brute_ms, hashed_ms) in results.items():
+        print(f"  {name}: every frame {brute_ms:.3f} / grid + throttle {hashed_ms:.3f}")
+    return results
+
+
+def bench_homing_steering(assets: AssetsLoader) -> Dict[str, Tuple[float, float, float]]:
+    """호밍탄 조향: 탄환별 steer() / steer_homing_bullets (묶기 포함) / steer_homing 커널만"""
+    random.seed(0)
+    targets = []
+    for _ in range(64):
+        target = pygame.sprite.Sprite()
+        target.rect = pygame.Rect(random.randint(0, settings.SCREEN_WIDTH),
+                                  random.randint(0, settings.SCREEN_HEIGHT // 2), 30, 30)
+        targets.append(target)
+    results = {}
+    
+    for count in (100, 1000, 5000):
+        bullets = []
+        for _ in range(count):
+            bullet = Bullet(random.randint(0, settings.SCREEN_WIDTH),
+                            random.randint(settings.SCREEN_HEIGHT // 2, settings.SCREEN_HEIGHT),
+                            'player', assets.get_image('player_bullet'), weapon_type='homing')
+            bullet.target = random.choice(targets)
+            bullets.append(bullet)
+        
+        arrays = [np.array(values, dtype=dtype) for values, dtype in (
+            ([b.speed_x for b in bullets], np.float64),
+            ([b.speed_y for b in bullets], np.float64),
+            ([b.target.rect.centerx - b.rect.centerx for b in bullets], np.int64),
+            ([b.target.rect.centery - b.rect.centery for b in bullets], np.int64),
+            ([b.base_speed for b in bullets], np.float64))]
+        
+        def per_sprite():
+            for bullet in bullets:
+                bullet.steer()
+        
+        results[f'{count} bullets'] = (_timed(per_sprite, 20),
+                                       _timed(lambda: steer_homing_bullets(bullets), 20),
+                                       _timed(lambda: steer_homing(*arrays), 20))
+    
+    print("호밍탄 조향 (프레임당 ms)")
+    for name, (sprite_ms, batch_ms, kernel_ms) in results.items():
+        print(f"  {name}: per sprite {sprite_ms:.3f} / batched {batch_ms:.3f} / kernel only {kernel_ms:.3f}")
+    return results
+
+
+def bench_entry_paths(assets: AssetsLoader) -> Dict[str, float]:
+    """적 500기 동시 진입: 웨이포인트 추적(sqrt 정규화) / 호 길이 테이블"""
+    random.seed(0)
+    flights = []
+    for i in range(500):
+        table = get_path_table(random.choice(list(PATH_SHAPES)))
+        start = (random.randint(0, settings.SCREEN_WIDTH), -35.0)
+        origin = (start[0] - 15, -50)
+        end = (50 + (i % 20) * 30, 80 + (i // 20) * 20)
+        flights.append((table, start, origin, end))
+    frames = 200
+    
+    def waypoint_chase():
+        # 진입 경로를 웨이포인트 목록으로 두고 매 프레임 다음 점을 향해 정규화 이동하던 방식
+        movers = []
+        for table, start, origin, end in flights:
+            ox, oy = origin if table.relative else (0, 0)
+            waypoints = [(x + ox, y + oy) for x, y in table.points] + [end]
+            movers.append([start[0], start[1], waypoints, 0])
+        for _ in range(frames):
+            for mover in movers:
+                x, y, waypoints, index = mover
+                if index >= len(waypoints):
+                    continue
+                target_x, target_y = waypoints[index]
+                dx = target_x - x
+                dy = target_y - y
+                distance = math.sqrt(dx ** 2 + dy ** 2)
+                if distance < 5:
+                    mover[3] = index + 1
+                else:
+                    mover[0] = x + dx / distance * 2
+                    mover[1] = y + dy / distance * 2
+    
+    def table_lookup():
+        followers = [PathFollower(*flight) for flight in flights]
+        for _ in range(frames):
+            for follower in followers:
+                follower.advance(2)
+    
+    results = {
+        'waypoint chase': _timed(waypoint_chase, 3) / frames,
+        'arc-length table': _timed(table_lookup, 3) / frames,
+    }
+    
+    print(f"적 {len(flights)}기 동시 진입 (프레임당 ms, 스플라인 경로 포함)")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f}")
+    return results
+
+
+def bench_formation_idle(assets: AssetsLoader) -> Dict[str, float]:
+    """편대 대기 적 600기: 적마다 sin 계산 / 편대 컨트롤러 일괄 계산"""
+    image = assets.get_image('enemy')
+    bullet_image = assets.get_image('enemy_bullet')
+    enemies = []
+    for i in range(600):
+        enemy = Enemy(0, -50, Enemy.TYPE_NORMAL, image, bullet_image)
+        enemy.formation_x = 50 + (i % 30) * 20
+        enemy.formation_y = 80 + (i // 30) * 25
+        enemies.append(enemy)
+    frames = 200
+    
+    def per_enemy():
+        # 적마다 get_ticks()와 hash(id())로 위상을 구해 흔들림을 계산하던 방식
+        for frame in range(frames):
+            for enemy in enemies:
+                offset = math.sin(pygame.time.get_ticks() * 0.002 + hash(id(enemy)) % 100) * 2
+                enemy.rect.x = int(enemy.formation_x + offset)
+                enemy.rect.y = int(enemy.formation_y)
+    
+    def batched():
+        formation = FormationController()
+        for enemy in enemies:
+            formation.add(enemy)
+        for frame in range(frames):
+            formation.update(pygame.time.get_ticks())
+            for enemy in enemies:
+                enemy._idle_movement()
+        for enemy in enemies:
+            enemy.formation = None
+    
+    results = {
+        'per-enemy sin': _timed(per_enemy, 3) / frames,
+        'formation controller': _timed(batched, 3) / frames,
+    }
+    
+    print(f"편대 대기 적 {len(enemies)}기 흔들림 (프레임당 ms)")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f}")
+    return results
+
+
+def bench_enemy_ai(assets: AssetsLoader) -> Dict[str, float]:
+    """편대 대기 적 600기 발사 판정: 적마다 shoot + random.random() / 난수 행렬로 고른 발사 후보만 shoot (+ 시분할)"""
+    image = assets.get_image('enemy')
+    bullet_image = assets.get_image('enemy_bullet')
+    types = [Enemy.TYPE_NORMAL, Enemy.TYPE_FAST, Enemy.TYPE_TANK, Enemy.TYPE_KAMIKAZE]
+    enemies = pygame.sprite.Group(Enemy(0, 0, types[i % len(types)], image, bullet_image)
+                                  for i in range(600))
+    frames = 200
+    
+    def per_enemy():
+        # 모든 적이 매 프레임 shoot을 호출해 각자 난수를 뽑던 방식
+        random.seed(0)
+        bullets = EnemyBulletGroup()
+        for frame in range(frames):
+            for enemy in enemies:
+                enemy.shoot(bullets)
+            bullets.empty()
+    
+    def batched(slices):
+        ai = EnemyAI(seed=0, slices=slices)
+        bullets = EnemyBulletGroup()
+        updates = 0
+        for frame in range(frames):
+            listed, rolls, shooters = ai.decide(enemies)
+            fire_rolls = rolls[ROLL_FIRE]
+            for index in shooters:
+                listed[index].shoot(bullets, fire_rolls[index])
+            updates += ai.updates
+            bullets.empty()
+        return updates / frames
+    
+    results = {
+        'per-enemy random': _timed(per_enemy, 3) / frames,
+        'roll matrix': _timed(lambda: batched({}), 3) / frames,
+        'roll matrix + time slices': _timed(lambda: batched(None), 3) / frames,
+    }
+    
+    print(f"편대 대기 적 {len(enemies)}기 발사 판정 (프레임당 ms, 시분할 시 프레임당 판정 {batched(None):.0f}기)")
+    for name, ms in results.items():
+        print(f"  {name}: {ms:.3f}")
+    return results
+
+
+def bench_bullet_engines(assets: AssetsLoader) -> Dict[str, Tuple[float, float]]:
+    """탄막 프레임 (이동 + 그리기 + 플레이어 충돌): 스프라이트 그룹 / NumPy 배열 엔진"""
+    player = Player(settings.SCREEN_WIDTH // 2, settings.SCREEN_HEIGHT - 100,
+                    assets.get_image('player'), assets.get_image('player_bullet'))
+    players = pygame.sprite.Group(player)  # 충돌 검사의 alive() 판정용
+    image = assets.get_image('enemy_bullet')
+    screen = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    results = {}
+    
+    for count in (1000, 10000, 20000):
+        # 화면 위쪽 절반에서 천천히 퍼지는 탄막 (측정 중 화면 밖으로 나가지 않음)
+        random.seed(0)
+        shots = [(random.randint(0, settings.SCREEN_WIDTH), random.randint(0, settings.SCREEN_HEIGHT // 2),
+                  random.randrange(-60, 61, 5)) for _ in range(count)]
+        
+        group = EnemyBulletGroup(*[Bullet(x, y, 'enemy', image, angle=angle) for x, y, angle in shots])
+        array = BulletArray()
+        for x, y, angle in shots:
+            vx, vy, _ = get_bullet_velocity('enemy', 'normal', angle)
+            array.spawn(x, y, vx, vy, image)
+        
+        def frame(bullets):
+            bullets.update()
+            bullets.draw(screen)
+            check_player_bullet_collision(player, bullets)
+        
+        # 첫 프레임은 SweepAndPrune 초기 정렬(미정렬 전체 삽입 정렬)이라 측정에서 제외
+        frame(group)
+        frame(array)
+        results[f'{count} bullets'] = (_timed(lambda: frame(group), 10),
+                                       _timed(lambda: frame(array), 10))
+        group.empty()
+    
+    print("탄막 프레임 (프레임당 ms, 60 FPS 예산 16.7ms)")
+    for name, (sprite_ms, array_ms) in results.items():
+        print(f"  {name}: sprite {sprite_ms:.3f} / array {array_ms:.3f} (x{sprite_ms / array_ms:.1f})")
+    return results
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'collision': bench_collision_modes,
+    'radius': bench_radius_queries,
+    'spawn': bench_wave_spawn,
+    'homing': bench_homing_retarget,
+    'steering': bench_homing_steering,
+    'paths': bench_entry_paths,
+    'formation': bench_formation_idle,
+    'ai': bench_enemy_ai,
+    'bullets': bench_bullet_engines,
+}
+
+
+def main() -> None:
+    """선택한 측정 실행"""
+    names = sys.argv[1:] or list(BENCHMARKS)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets = AssetsLoader()
+    
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"알 수 없는 측정: {name} (가능: {', '.join(BENCHMARKS)})")
+            continue
+        BENCHMARKS[name](assets)
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# boss_patterns.py
+"""
+보스 공격 패턴
+패턴마다 제너레이터(코루틴) 하나로 작성하고, 보스는 매 틱 send(난수)로 한 단계씩 진행합니다.
+코루틴은 보스를 움직인 뒤 이번 틱에 쏠 탄막 목록 [(탄막 설정, x, y, 기준 각도), ...]을 yield하고,
+패턴이 끝나면 return 합니다. (매 프레임 패턴 이름 비교 없음)
+이번 틱 길이는 보스의 dt(시뮬레이션 시계에서 받은 값)로 읽습니다.
+탄막 모양과 발사 간격은 emitter.BARRAGES에 선언합니다.
+
+새 패턴은 같은 모양의 함수를 만들어 BOSS_PATTERNS에 등록하면 됩니다.
+"""
+import math
+import settings
+from typing import Callable, Dict, Generator, List, Tuple
+from emitter import BARRAGES, Emitter
+
+# 탄막 한 번 발사 (탄막 설정, x, y, 기준 각도)
+Volley = Tuple[dict, float, float, float]
+# 보내는 값: 이번 틱 판정 난수, 내보내는 값: 이번 틱 탄막 목록
+PatternCoroutine = Generator[List[Volley], float, None]
+
+# 패턴 지속 시간 (ms, 지나면 편대로 복귀)
+DIVE_DURATION = 5000
+SPIRAL_DURATION = 3000
+STRAFE_DURATION = 4000
+
+
+def dive_pattern(boss, detail: float) -> PatternCoroutine:
+    """
+    돌진 패턴 (스플라인 경로를 따라 내려갔다가 편대로 복귀, 가끔 아래로 발사)
+    
+    Args:
+        boss: 보스
+        detail: 0~1 난수 (돌진 목표 x 좌표)
+    """
+    boss.dive_target_x = 100 + int(detail * (settings.SCREEN_WIDTH - 199))
+    boss.dive_target_y = settings.SCREEN_HEIGHT - 150
+    path = boss._create_dive_path()
+    returning = False
+    emitter = Emitter(BARRAGES['boss_dive'])
+    
+    elapsed = boss.dt  # 패턴을 시작한 틱도 지속 시간에 포함
+    roll = yield []
+    while elapsed < DIVE_DURATION:
+        elapsed += boss.dt
+        speed = boss.speed * (2 if returning else 2.5)
+        x, y, arrived = path.advance(speed)
+        boss.rect.center = (int(x), int(y))
+        if arrived:
+            if returning:
+                return
+            returning = True
+            path = boss._create_return_path()
+        
+        angle = emitter.tick(roll, boss.dt)
+        volleys = [] if angle is None else [(emitter.barrage, boss.rect.centerx, boss.rect.bottom, angle)]
+        roll = yield volleys
+
+
+def spiral_pattern(boss, detail: float) -> PatternCoroutine:
+    """
+    나선형 패턴 (편대 위치 주변을 돌며 회전하는 링 탄막)
+    
+    Args:
+        boss: 보스
+        detail: 사용하지 않음
+    """
+    orbit = 0
+    emitter = Emitter(BARRAGES['boss_spiral'])
+    
+    elapsed = boss.dt  # 패턴을 시작한 틱도 지속 시간에 포함
+    roll = yield []
+    while elapsed < SPIRAL_DURATION:
+        elapsed += boss.dt
+        orbit += 5
+        boss.rect.centerx = boss.formation_x + math.cos(math.radians(orbit)) * 30
+        boss.rect.centery = boss.formation_y + math.sin(math.radians(orbit * 0.5)) * 20
+        
+        angle = emitter.tick(roll, boss.dt)
+        volleys = [] if angle is None else [(emitter.barrage, boss.rect.centerx, boss.rect.centery, angle)]
+        roll = yield volleys
+
+
+def strafe_pattern(boss, detail: float) -> PatternCoroutine:
+    """
+    좌우 이동 패턴 (화면 양 끝에서 방향을 바꾸며 3연발)
+    
+    Args:
+        boss: 보스
+        detail: 0~1 난수 (0.5 초과면 오른쪽부터)
+    """
+    direction = 1 if detail > 0.5 else -1
+    emitter = Emitter(BARRAGES['boss_strafe'])
+    
+    elapsed = boss.dt  # 패턴을 시작한 틱도 지속 시간에 포함
+    roll = yield []
+    while elapsed < STRAFE_DURATION:
+        elapsed += boss.dt
+        boss.rect.x += boss.speed * 2 * direction
+        if boss.rect.left < 50:
+            direction = 1
+        elif boss.rect.right > settings.SCREEN_WIDTH - 50:
+            direction = -1
+        boss.rect.centery = boss.formation_y
+        
+        angle = emitter.tick(roll, boss.dt)
+        volleys = [] if angle is None else [(emitter.barrage, boss.rect.centerx, boss.rect.bottom, angle)]
+        roll = yield volleys
+
+
+# 패턴 이름 -> 코루틴 생성 함수 (무작위 선택 시 등록 순서대로 구간을 나눔)
+BOSS_PATTERNS: Dict[str, Callable[..., PatternCoroutine]] = {
+    'dive': dive_pattern,
+    'spiral': spiral_pattern,
+    'strafe': strafe_pattern,
+}
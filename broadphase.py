@@ -0,0 +1,328 @@
+# broadphase.py
+"""
+충돌 검사용 광역(broad-phase) 공간 분할 구조
+후보 쌍만 추려서 정밀 충돌 검사 횟수를 줄입니다.
+"""
+import pygame
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import settings
+
+
+class SpatialHash:
+    """균일 격자 기반 공간 해시"""
+
+    def __init__(self, cell_size: int = settings.SPATIAL_HASH_CELL_SIZE):
+        """
+        공간 해시 초기화
+
+        Args:
+            cell_size: 격자 한 칸의 크기 (픽셀)
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, pygame.sprite.Sprite]]] = {}
+        self.count = 0
+        self.bounds: Optional[List[int]] = None  # 사용 중인 칸 범위 [x0, y0, x1, y1]
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        self.cells.clear()
+        self.count = 0
+        self.bounds = None
+
+    def rebuild(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """스프라이트 목록으로 해시 재구성 (매 프레임 호출)"""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """사각형이 걸치는 격자 범위 (x0, y0, x1, y1)"""
+        size = self.cell_size
+        x0 = rect.left // size
+        y0 = rect.top // size
+        x1 = max(rect.left, rect.right - 1) // size
+        y1 = max(rect.top, rect.bottom - 1) // size
+        return x0, y0, x1, y1
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """스프라이트를 걸치는 모든 칸에 등록"""
+        entry = (self.count, sprite)
+        self.count += 1
+
+        x0, y0, x1, y1 = self._cell_range(sprite.rect)
+        bounds = self.bounds
+        if bounds is None:
+            self.bounds = [x0, y0, x1, y1]
+        else:
+            bounds[0] = min(bounds[0], x0)
+            bounds[1] = min(bounds[1], y0)
+            bounds[2] = max(bounds[2], x1)
+            bounds[3] = max(bounds[3], y1)
+        
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def query_rect(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """
+        사각형과 같은 칸에 있는 후보 스프라이트 반환
+
+        Returns:
+            삽입 순서대로 정렬된 후보 리스트 (중복 없음)
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self.cells
+
+        # 대부분 한 칸만 걸치므로 빠른 경로
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            return [sprite for _, sprite in bucket] if bucket else []
+
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, sprite in bucket:
+                        found[order] = sprite
+
+        return [found[order] for order in sorted(found)]
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[pygame.sprite.Sprite]:
+        """
+        중심이 원 안(경계 포함)에 있는 스프라이트 반환
+        
+        Args:
+            x: 원 중심 x
+            y: 원 중심 y
+            radius: 반지름
+        
+        Returns:
+            삽입 순서대로 정렬된 스프라이트 리스트 (중복 없음)
+        """
+        if radius < 0:
+            return []
+        
+        size = self.cell_size
+        x0 = int((x - radius) // size)
+        y0 = int((y - radius) // size)
+        x1 = int((x + radius) // size)
+        y1 = int((y + radius) // size)
+        cells = self.cells
+        
+        # 반지름이 커서 격자 범위가 실제 칸 수보다 넓으면 있는 칸만 순회
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            buckets = [bucket for (cx, cy), bucket in cells.items()
+                       if x0 <= cx <= x1 and y0 <= cy <= y1]
+        else:
+            buckets = [cells[(cx, cy)] for cx in range(x0, x1 + 1)
+                       for cy in range(y0, y1 + 1) if (cx, cy) in cells]
+        
+        radius_sq = radius * radius
+        found = {}
+        for bucket in buckets:
+            for order, sprite in bucket:
+                if order in found:
+                    continue
+                dx = sprite.rect.centerx - x
+                dy = sprite.rect.centery - y
+                found[order] = sprite if dx * dx + dy * dy <= radius_sq else None
+        
+        return [found[order] for order in sorted(found) if found[order] is not None]
+    
+    def query_nearest(self, x: float, y: float,
+                      test: Optional[Callable[[pygame.sprite.Sprite], bool]] = None
+                      ) -> Optional[pygame.sprite.Sprite]:
+        """
+        중심이 가장 가까운 스프라이트 찾기 (호밍 타겟용)
+        
+        질의 칸에서 시작해 한 겹씩 넓혀 가며 찾고, 다음 고리가 찾은 거리보다
+        멀어지면 멈춥니다. 고리가 사용 중인 칸 수보다 넓어지면 남은 칸을 직접 순회합니다.
+        
+        Args:
+            x: 질의 좌표 x
+            y: 질의 좌표 y
+            test: 후보에 적용할 조건 (선택, 예: 아직 그룹에 있는지)
+        
+        Returns:
+            가장 가까운 스프라이트 (거리가 같으면 먼저 삽입된 것), 없으면 None
+        """
+        if self.bounds is None:
+            return None
+        
+        size = self.cell_size
+        cells = self.cells
+        qx = int(x // size)
+        qy = int(y // size)
+        x0, y0, x1, y1 = self.bounds
+        max_ring = max(qx - x0, x1 - qx, qy - y0, y1 - qy, 0)
+        
+        best = None
+        best_order = 0
+        best_dist_sq = float('inf')
+        seen = set()
+        
+        def visit(bucket):
+            nonlocal best, best_order, best_dist_sq
+            for order, sprite in bucket:
+                if order in seen:
+                    continue
+                seen.add(order)
+                dx = sprite.rect.centerx - x
+                dy = sprite.rect.centery - y
+                dist_sq = dx * dx + dy * dy
+                if (dist_sq < best_dist_sq or (dist_sq == best_dist_sq and order < best_order)) \
+                        and (test is None or test(sprite)):
+                    best = sprite
+                    best_order = order
+                    best_dist_sq = dist_sq
+        
+        for ring in range(max_ring + 1):
+            if ring == 0:
+                ring_cells = [(qx, qy)]
+            else:
+                ring_cells = [(cx, cy) for cx in range(qx - ring, qx + ring + 1)
+                              for cy in (qy - ring, qy + ring)]
+                ring_cells += [(cx, cy) for cx in (qx - ring, qx + ring)
+                               for cy in range(qy - ring + 1, qy + ring)]
+            for cell in ring_cells:
+                bucket = cells.get(cell)
+                if bucket:
+                    visit(bucket)
+            
+            # 남은 칸의 중심들은 질의 좌표에서 최소 ring * size 이상 떨어져 있음
+            limit = ring * size
+            if best is not None and best_dist_sq < limit * limit:
+                return best
+            
+            # 다음 고리가 전체 사용 칸보다 넓으면 남은 칸을 직접 순회
+            if (2 * ring + 3) ** 2 > len(cells):
+                for (cx, cy), bucket in cells.items():
+                    if max(abs(cx - qx), abs(cy - qy)) > ring:
+                        visit(bucket)
+                return best
+        
+        return best
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class SweepAndPrune:
+    """
+    y축 정렬 기반 sweep-and-prune
+    
+    항목을 rect.top 기준으로 정렬해 두고, 매 프레임 삽입 정렬로 갱신합니다.
+    탄환은 거의 같은 방향으로 움직이므로 프레임 간 순서 변화가 적어
+    삽입 정렬이 거의 O(n)으로 끝납니다.
+    """
+    
+    def __init__(self):
+        self.entries: List[pygame.sprite.Sprite] = []
+        self.tops: List[int] = []
+        self.orders: Dict[pygame.sprite.Sprite, int] = {}
+        self.next_order = 0
+        self.max_height = 0
+        self.dirty = False
+    
+    def add(self, sprite: pygame.sprite.Sprite) -> None:
+        """항목 추가 (정렬은 다음 update에서)"""
+        if sprite in self.orders:
+            return
+        self.orders[sprite] = self.next_order
+        self.next_order += 1
+        self.entries.append(sprite)
+    
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        """항목 제거 (목록 정리는 다음 update에서)"""
+        if self.orders.pop(sprite, None) is not None:
+            self.dirty = True
+    
+    def update(self, sprites: Optional[Iterable[pygame.sprite.Sprite]] = None) -> None:
+        """
+        죽은 항목을 빼고 새 항목을 더한 뒤 삽입 정렬
+        
+        Args:
+            sprites: 새로 등록할 항목이 섞여 있는 목록 (그룹 순서대로)
+        """
+        orders = self.orders
+        if self.dirty or any(not sprite.alive() for sprite in self.entries):
+            kept = {}
+            for sprite in self.entries:
+                if sprite in orders and sprite.alive():
+                    kept[sprite] = None
+                else:
+                    orders.pop(sprite, None)
+            self.entries = list(kept)
+            self.dirty = False
+        
+        if sprites is not None:
+            for sprite in sprites:
+                if sprite not in orders:
+                    self.add(sprite)
+        
+        # 삽입 정렬 (거의 정렬된 상태이므로 이동이 적음)
+        entries = self.entries
+        tops = [sprite.rect.top for sprite in entries]
+        max_height = 0
+        for i in range(1, len(entries)):
+            sprite = entries[i]
+            top = tops[i]
+            j = i - 1
+            while j >= 0 and tops[j] > top:
+                entries[j + 1] = entries[j]
+                tops[j + 1] = tops[j]
+                j -= 1
+            entries[j + 1] = sprite
+            tops[j + 1] = top
+        for sprite in entries:
+            if sprite.rect.height > max_height:
+                max_height = sprite.rect.height
+        
+        self.tops = tops
+        self.max_height = max_height
+    
+    def query_band(self, top: int, bottom: int) -> List[pygame.sprite.Sprite]:
+        """세로 구간 [top, bottom)과 겹칠 수 있는 후보 반환 (y 정렬 순서)"""
+        lo = bisect_right(self.tops, top - self.max_height)
+        hi = bisect_left(self.tops, bottom)
+        return self.entries[lo:hi]
+    
+    def first_overlap(self, rect: pygame.Rect,
+                      test: Optional[Callable[[pygame.sprite.Sprite], bool]] = None
+                      ) -> Optional[pygame.sprite.Sprite]:
+        """
+        사각형과 겹치는 항목 중 가장 먼저 등록된 항목 반환
+        
+        Args:
+            rect: 검사할 사각형
+            test: 사각형이 겹친 항목에 추가로 적용할 정밀 검사 (선택)
+        """
+        hit = None
+        hit_order = 0
+        for sprite in self.query_band(rect.top, rect.bottom):
+            if sprite.rect.colliderect(rect) and sprite in self.orders:
+                order = self.orders[sprite]
+                if hit is not None and order >= hit_order:
+                    continue
+                if test is None or test(sprite):
+                    hit = sprite
+                    hit_order = order
+        return hit
+    
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        self.entries = []
+        self.tops = []
+        self.orders.clear()
+        self.max_height = 0
+        self.dirty = False
+    
+    def __len__(self) -> int:
+        return len(self.entries)
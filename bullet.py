@@ -5,8 +5,12 @@
 """
 import pygame
 import math
-from typing import Literal, Optional, List
+import numpy as np
+import weakref
+from typing import Dict, Literal, Optional, List, Tuple
 import settings
+from broadphase import SpatialHash, SweepAndPrune
+from sim_clock import SimClock
 
 
 # 무기 타입 상수
@@ -26,6 +30,7 @@ WEAPON_INFO = {
         'damage': 1,
         'fire_delay': 250,
         'color': (0, 255, 255),
+        'speed_scale': 1,  # settings.BULLET_SPEED 배율
         'description': 'Basic weapon'
     },
     WEAPON_LASER: {
@@ -33,6 +38,7 @@ WEAPON_INFO = {
         'damage': 2,
         'fire_delay': 400,
         'color': (255, 0, 0),
+        'speed_scale': 1.5,
         'description': 'Piercing laser'
     },
     WEAPON_MISSILE: {
@@ -40,6 +46,7 @@ WEAPON_INFO = {
         'damage': 3,
         'fire_delay': 600,
         'color': (255, 165, 0),
+        'speed_scale': 0.8,
         'description': 'High damage'
     },
     WEAPON_HOMING: {
@@ -47,6 +54,7 @@ WEAPON_INFO = {
         'damage': 1,
         'fire_delay': 350,
         'color': (0, 255, 0),
+        'speed_scale': 0.9,
         'description': 'Tracks enemies'
     },
     WEAPON_SPREAD: {
@@ -54,6 +62,7 @@ WEAPON_INFO = {
         'damage': 1,
         'fire_delay': 300,
         'color': (255, 0, 255),
+        'speed_scale': 1,
         'description': '5-way shot'
     },
     WEAPON_RAILGUN: {
@@ -61,6 +70,7 @@ WEAPON_INFO = {
         'damage': 5,
         'fire_delay': 800,
         'color': (0, 255, 255),
+        'speed_scale': 2.5,
         'description': 'Ultra pierce'
     },
     WEAPON_PLASMA: {
@@ -68,6 +78,7 @@ WEAPON_INFO = {
         'damage': 4,
         'fire_delay': 500,
         'color': (150, 0, 255),
+        'speed_scale': 1.2,
         'description': 'Explosive'
     },
     WEAPON_WAVE: {
@@ -75,11 +86,190 @@ WEAPON_INFO = {
         'damage': 2,
         'fire_delay': 200,
         'color': (255, 255, 0),
+        'speed_scale': 1.3,
         'description': 'Wave pattern'
     },
 }
 
 
+# 플레이어 멀티샷/스프레드 각도 (시작 시 이미지 미리 생성)
+PLAYER_SHOT_ANGLES = (-45, -30, -15, 0, 15, 30, 45)
+
+# 적 탄환 회전 각도 간격 (보스 나선 패턴이 5도 단위, 패턴마다 0도부터 다시 시작)
+ENEMY_SHOT_ANGLE_STEP = 5
+
+# 회전하지 않는 원형 탄
+UNROTATED_WEAPONS = (WEAPON_HOMING, WEAPON_PLASMA)
+
+# 호밍탄이 한 프레임에 타겟 방향으로 꺾는 비율
+HOMING_TURN_RATE = 0.1
+
+# 조향할 호밍탄이 이 수 이상이면 NumPy로 한 번에 계산 (적으면 배열 묶는 비용이 더 큼)
+HOMING_BATCH_MIN = 128
+
+# 무기 이미지 아틀라스 ((weapon_type, damage_tier, angle) -> Surface)
+_weapon_atlas: Dict[Tuple[str, int, float], pygame.Surface] = {}
+
+# 적 탄환 원본 이미지 -> {angle: 회전된 Surface}
+_enemy_bullet_atlas: 'weakref.WeakKeyDictionary[pygame.Surface, Dict[float, pygame.Surface]]' = weakref.WeakKeyDictionary()
+
+# (bullet_type, weapon_type, angle, 기준 탄속) -> (speed_x, speed_y, base_speed)
+_velocity_table: Dict[Tuple[str, str, float, float], Tuple[float, float, float]] = {}
+
+
+def get_weapon_image(weapon_type: str, damage: int, angle: float) -> Optional[pygame.Surface]:
+    """
+    플레이어 무기 탄환 이미지 반환 (아틀라스에서 공유)
+    
+    Args:
+        weapon_type: 무기 타입
+        damage: 탄환 데미지 (일반탄은 2 이상이면 강화 이미지)
+        angle: 발사 각도
+    
+    Returns:
+        공유 Surface (직접 수정 금지), 알 수 없는 무기면 None
+    """
+    damage_tier = 1 if weapon_type == WEAPON_NORMAL and damage > 1 else 0
+    
+    # 강화 일반탄(글로우)과 원형 탄은 회전하지 않으므로 각도와 무관하게 공유
+    rotates = weapon_type not in UNROTATED_WEAPONS and damage_tier == 0
+    key = (weapon_type, damage_tier, angle if rotates else 0)
+    
+    image = _weapon_atlas.get(key)
+    if image is None:
+        builders = {
+            WEAPON_NORMAL: Bullet._create_normal_image,
+            WEAPON_LASER: Bullet._create_laser_image,
+            WEAPON_MISSILE: Bullet._create_missile_image,
+            WEAPON_HOMING: Bullet._create_homing_image,
+            WEAPON_SPREAD: Bullet._create_spread_image,
+            WEAPON_RAILGUN: Bullet._create_railgun_image,
+            WEAPON_PLASMA: Bullet._create_plasma_image,
+            WEAPON_WAVE: Bullet._create_wave_image,
+        }
+        builder = builders.get(weapon_type)
+        if builder is None:
+            return None
+        
+        if weapon_type == WEAPON_NORMAL:
+            image = builder(damage_tier)
+        else:
+            image = builder()
+        
+        if rotates and angle != 0:
+            image = pygame.transform.rotate(image, -angle)
+        _weapon_atlas[key] = image
+    
+    return image
+
+
+def get_enemy_bullet_image(source: pygame.Surface, angle: float) -> pygame.Surface:
+    """적 탄환 이미지 반환 (원본 이미지별 회전 결과 공유)"""
+    if angle == 0:
+        return source
+    
+    rotations = _enemy_bullet_atlas.get(source)
+    if rotations is None:
+        rotations = {}
+        _enemy_bullet_atlas[source] = rotations
+    
+    image = rotations.get(angle)
+    if image is None:
+        image = pygame.transform.rotate(source, -angle)
+        rotations[angle] = image
+    return image
+
+
+def get_bullet_velocity(bullet_type: str, weapon_type: str, angle: float) -> Tuple[float, float, float]:
+    """
+    발사 각도별 속도 벡터 반환 (테이블에 캐시)
+    
+    Returns:
+        (speed_x, speed_y, base_speed)
+    """
+    if bullet_type == 'player':
+        speed = settings.BULLET_SPEED
+    else:
+        speed = settings.ENEMY_BULLET_SPEED
+    key = (bullet_type, weapon_type, angle, speed)
+    
+    velocity = _velocity_table.get(key)
+    if velocity is None:
+        radians = math.radians(angle)
+        if bullet_type == 'player':
+            base_speed = speed * WEAPON_INFO.get(weapon_type, {}).get('speed_scale', 1)
+            velocity = (math.sin(radians) * base_speed, -math.cos(radians) * base_speed, base_speed)
+        else:
+            velocity = (math.sin(radians) * speed, math.cos(radians) * speed, speed)
+        _velocity_table[key] = velocity
+    
+    return velocity
+
+
+def steer_homing(speed_x: np.ndarray, speed_y: np.ndarray, dx: np.ndarray, dy: np.ndarray,
+                 base_speed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    호밍탄 여러 발의 조향을 한 번에 계산 (Bullet.steer와 같은 식)
+    
+    두 방향의 차이는 [-2pi, 2pi] 범위이므로 while 루프 대신 한 번씩 보정하면 결과가 같습니다.
+    
+    Args:
+        speed_x, speed_y: 현재 속도
+        dx, dy: 탄환 중심에서 타겟 중심까지의 정수 거리
+        base_speed: 탄속
+    
+    Returns:
+        새 (speed_x, speed_y). 타겟과 중심이 같은 탄환은 속도를 유지
+    """
+    target_angle = np.arctan2(dx, -dy)
+    current_angle = np.arctan2(speed_x, -speed_y)
+    
+    angle_diff = target_angle - current_angle
+    angle_diff = np.where(angle_diff > math.pi, angle_diff - 2 * math.pi, angle_diff)
+    angle_diff = np.where(angle_diff < -math.pi, angle_diff + 2 * math.pi, angle_diff)
+    new_angle = current_angle + angle_diff * HOMING_TURN_RATE
+    
+    steering = (dx != 0) | (dy != 0)
+    new_x = np.where(steering, np.sin(new_angle) * base_speed, speed_x)
+    new_y = np.where(steering, -np.cos(new_angle) * base_speed, speed_y)
+    return new_x, new_y
+
+
+def steer_homing_bullets(bullets: List['Bullet']) -> None:
+    """살아있는 타겟이 있는 호밍탄들을 steer_homing으로 한 번에 조향"""
+    if not bullets:
+        return
+    
+    # 필드별 평평한 리스트로 묶는 편이 튜플 리스트보다 훨씬 빠름
+    count = len(bullets)
+    rects = [bullet.rect for bullet in bullets]
+    target_rects = [bullet.target.rect for bullet in bullets]
+    dx = (np.fromiter([rect.centerx for rect in target_rects], np.int64, count) -
+          np.fromiter([rect.centerx for rect in rects], np.int64, count))
+    dy = (np.fromiter([rect.centery for rect in target_rects], np.int64, count) -
+          np.fromiter([rect.centery for rect in rects], np.int64, count))
+    speed_x = np.fromiter([bullet.speed_x for bullet in bullets], np.float64, count)
+    speed_y = np.fromiter([bullet.speed_y for bullet in bullets], np.float64, count)
+    base_speed = np.fromiter([bullet.base_speed for bullet in bullets], np.float64, count)
+    new_x, new_y = steer_homing(speed_x, speed_y, dx, dy, base_speed)
+    
+    for bullet, speed_x, speed_y in zip(bullets, new_x.tolist(), new_y.tolist()):
+        bullet.speed_x = speed_x
+        bullet.speed_y = speed_y
+
+
+def warm_bullet_images(enemy_bullet_image: Optional[pygame.Surface] = None) -> None:
+    """게임 시작 시 자주 쓰는 탄환 이미지를 미리 생성"""
+    for weapon_type in WEAPON_INFO:
+        for damage in (1, 2):
+            for angle in PLAYER_SHOT_ANGLES:
+                get_weapon_image(weapon_type, damage, angle)
+    
+    if enemy_bullet_image is not None:
+        for angle in range(0, 360, ENEMY_SHOT_ANGLE_STEP):
+            get_enemy_bullet_image(enemy_bullet_image, angle)
+
+
 class Bullet(pygame.sprite.Sprite):
     """탄환 스프라이트 클래스"""
     
@@ -90,40 +280,31 @@ class Bullet(pygame.sprite.Sprite):
                  angle: float = 0,
                  weapon_type: str = WEAPON_NORMAL):
         super().__init__()
-        self.original_image = image.copy()
+        self.pool: Optional['BulletPool'] = None  # 풀에서 만든 탄환이면 반납할 풀
+        self.in_pool = False
+        self.hits = set()  # 관통 무기가 맞춘 적의 entity_id
+        self.reset(x, y, bullet_type, image, damage, angle, weapon_type)
+    
+    def reset(self, x: int, y: int,
+              bullet_type: Literal['player', 'enemy'],
+              image: pygame.Surface,
+              damage: int = 1,
+              angle: float = 0,
+              weapon_type: str = WEAPON_NORMAL) -> None:
+        """새 발사 정보로 탄환 상태 초기화 (풀 재사용 시에도 호출)"""
         self.bullet_type = bullet_type
         self.damage = damage
         self.angle = angle
         self.weapon_type = weapon_type
-        self.hits = []
+        self.hits.clear()
         
-        # 속도 설정
-        if bullet_type == 'player':
-            base_speed = settings.BULLET_SPEED
-            if weapon_type == WEAPON_LASER:
-                base_speed = settings.BULLET_SPEED * 1.5
-            elif weapon_type == WEAPON_MISSILE:
-                base_speed = settings.BULLET_SPEED * 0.8
-            elif weapon_type == WEAPON_HOMING:
-                base_speed = settings.BULLET_SPEED * 0.9
-            elif weapon_type == WEAPON_RAILGUN:
-                base_speed = settings.BULLET_SPEED * 2.5
-            elif weapon_type == WEAPON_PLASMA:
-                base_speed = settings.BULLET_SPEED * 1.2
-            elif weapon_type == WEAPON_WAVE:
-                base_speed = settings.BULLET_SPEED * 1.3
-            
-            self.speed_x = math.sin(math.radians(angle)) * base_speed
-            self.speed_y = -math.cos(math.radians(angle)) * base_speed
-        else:
-            base_speed = settings.ENEMY_BULLET_SPEED
-            self.speed_x = math.sin(math.radians(angle)) * base_speed
-            self.speed_y = math.cos(math.radians(angle)) * base_speed
-        
-        self.base_speed = base_speed
+        # 속도 설정 (각도별 테이블)
+        self.speed_x, self.speed_y, self.base_speed = get_bullet_velocity(
+            bullet_type, weapon_type, angle)
         
         # 무기별 특성
         self.piercing = (weapon_type in [WEAPON_LASER, WEAPON_RAILGUN])
+        self.homing = (weapon_type == WEAPON_HOMING and bullet_type == 'player')
         self.explosive = (weapon_type == WEAPON_PLASMA)
         self.wave_weapon = (weapon_type == WEAPON_WAVE)
         
@@ -131,8 +312,12 @@ class Bullet(pygame.sprite.Sprite):
         self.wave_offset = 0
         self.wave_amplitude = 30
         
-        # 무기 타입별 이미지 생성
-        self.image = self._create_weapon_image()
+        # 무기 타입별 이미지 (아틀라스 공유)
+        if bullet_type == 'enemy':
+            self.image = get_enemy_bullet_image(image, angle)
+        else:
+            weapon_image = get_weapon_image(weapon_type, damage, angle)
+            self.image = weapon_image if weapon_image is not None else image
         
         self.rect = self.image.get_rect()
         self.rect.centerx = x
@@ -141,53 +326,38 @@ class Bullet(pygame.sprite.Sprite):
         self.float_x = float(x)
         self.float_y = float(y)
         
+        # 직전 프레임 위치 (연속 충돌 검사용)
+        self.prev_float_x = self.float_x
+        self.prev_float_y = self.float_y
+        
         # 호밍 미사일용
         self.target = None
         self.homing_strength = 5
+        self.retarget_timer = 0  # 0이 되면 타겟을 다시 찾음
     
-    def _create_weapon_image(self) -> pygame.Surface:
-        """무기 타입별 이미지 생성"""
-        if self.bullet_type == 'enemy':
-            if self.angle != 0:
-                return pygame.transform.rotate(self.original_image, -self.angle)
-            return self.original_image.copy()
-        
-        if self.weapon_type == WEAPON_NORMAL:
-            return self._create_normal_image()
-        elif self.weapon_type == WEAPON_LASER:
-            return self._create_laser_image()
-        elif self.weapon_type == WEAPON_MISSILE:
-            return self._create_missile_image()
-        elif self.weapon_type == WEAPON_HOMING:
-            return self._create_homing_image()
-        elif self.weapon_type == WEAPON_SPREAD:
-            return self._create_spread_image()
-        elif self.weapon_type == WEAPON_RAILGUN:
-            return self._create_railgun_image()
-        elif self.weapon_type == WEAPON_PLASMA:
-            return self._create_plasma_image()
-        elif self.weapon_type == WEAPON_WAVE:
-            return self._create_wave_image()
-        else:
-            return self.original_image.copy()
+    def kill(self) -> None:
+        """모든 그룹에서 제거하고, 풀에서 만든 탄환이면 풀에 반납"""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
     
-    def _create_normal_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_normal_image(damage_tier: int = 0) -> pygame.Surface:
         """일반 탄환 이미지"""
         surface = pygame.Surface((6, 15), pygame.SRCALPHA)
         pygame.draw.rect(surface, (0, 255, 255), (1, 0, 4, 15))
         pygame.draw.rect(surface, (255, 255, 255), (2, 0, 2, 15))
         
-        if self.damage > 1:
+        if damage_tier > 0:
             glow = pygame.Surface((10, 19), pygame.SRCALPHA)
             pygame.draw.rect(glow, (255, 100, 100, 100), (0, 0, 10, 19))
             glow.blit(surface, (2, 2))
             return glow
         
-        if self.angle != 0:
-            return pygame.transform.rotate(surface, -self.angle)
         return surface
     
-    def _create_laser_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_laser_image() -> pygame.Surface:
         """레이저 이미지"""
         surface = pygame.Surface((8, 30), pygame.SRCALPHA)
         pygame.draw.rect(surface, (255, 50, 50, 100), (0, 0, 8, 30))
@@ -195,11 +365,10 @@ class Bullet(pygame.sprite.Sprite):
         pygame.draw.rect(surface, (255, 200, 200), (2, 0, 4, 30))
         pygame.draw.rect(surface, (255, 255, 255), (3, 0, 2, 30))
         
-        if self.angle != 0:
-            return pygame.transform.rotate(surface, -self.angle)
         return surface
     
-    def _create_missile_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_missile_image() -> pygame.Surface:
         """미사일 이미지"""
         surface = pygame.Surface((10, 20), pygame.SRCALPHA)
         pygame.draw.rect(surface, (150, 150, 150), (2, 4, 6, 12))
@@ -219,11 +388,10 @@ class Bullet(pygame.sprite.Sprite):
             (4, 16), (5, 18), (6, 16)
         ])
         
-        if self.angle != 0:
-            return pygame.transform.rotate(surface, -self.angle)
         return surface
     
-    def _create_homing_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_homing_image() -> pygame.Surface:
         """호밍탄 이미지"""
         surface = pygame.Surface((12, 12), pygame.SRCALPHA)
         pygame.draw.circle(surface, (0, 255, 0, 150), (6, 6), 6)
@@ -231,17 +399,17 @@ class Bullet(pygame.sprite.Sprite):
         pygame.draw.circle(surface, (200, 255, 200), (6, 6), 2)
         return surface
     
-    def _create_spread_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_spread_image() -> pygame.Surface:
         """스프레드샷 이미지"""
         surface = pygame.Surface((8, 12), pygame.SRCALPHA)
         pygame.draw.ellipse(surface, (255, 0, 255), (0, 0, 8, 12))
         pygame.draw.ellipse(surface, (255, 150, 255), (2, 2, 4, 8))
         
-        if self.angle != 0:
-            return pygame.transform.rotate(surface, -self.angle)
         return surface
     
-    def _create_railgun_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_railgun_image() -> pygame.Surface:
         """레일건 이미지"""
         surface = pygame.Surface((10, 40), pygame.SRCALPHA)
         pygame.draw.rect(surface, (0, 255, 255, 150), (0, 0, 10, 40))
@@ -251,11 +419,10 @@ class Bullet(pygame.sprite.Sprite):
         for i in range(0, 40, 8):
             pygame.draw.line(surface, (200, 255, 255), (1, i), (9, i+4), 1)
         
-        if self.angle != 0:
-            return pygame.transform.rotate(surface, -self.angle)
         return surface
     
-    def _create_plasma_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_plasma_image() -> pygame.Surface:
         """플라즈마 캐논 이미지"""
         surface = pygame.Surface((16, 16), pygame.SRCALPHA)
         pygame.draw.circle(surface, (150, 0, 255, 200), (8, 8), 8)
@@ -265,7 +432,8 @@ class Bullet(pygame.sprite.Sprite):
         pygame.draw.circle(surface, (255, 255, 255), (8, 8), 7, 1)
         return surface
     
-    def _create_wave_image(self) -> pygame.Surface:
+    @staticmethod
+    def _create_wave_image() -> pygame.Surface:
         """웨이브 빔 이미지"""
         surface = pygame.Surface((12, 20), pygame.SRCALPHA)
         for i in range(5):
@@ -274,59 +442,93 @@ class Bullet(pygame.sprite.Sprite):
             pygame.draw.ellipse(surface, (255, 255, 0, alpha), (0, y, 12, 8))
         pygame.draw.rect(surface, (255, 255, 200), (5, 0, 2, 20))
         
-        if self.angle != 0:
-            return pygame.transform.rotate(surface, -self.angle)
         return surface
     
     def set_target(self, target) -> None:
         """호밍 타겟 설정"""
         self.target = target
     
-    def find_nearest_enemy(self, enemies) -> None:
-        """가장 가까운 적 찾기"""
+    def find_nearest_enemy(self, enemies, spatial_hash: Optional[SpatialHash] = None) -> None:
+        """
+        가장 가까운 적 찾기 (거리가 같으면 그룹 순서상 앞선 적)
+        
+        Args:
+            enemies: 적 그룹
+            spatial_hash: 이번 프레임 적 위치로 만든 공간 해시 (있으면 격자 탐색)
+        """
         if self.weapon_type != WEAPON_HOMING:
             return
         
+        x, y = self.rect.center
+        if spatial_hash is not None:
+            self.target = spatial_hash.query_nearest(x, y, lambda enemy: enemy in enemies)
+            return
+        
         nearest = None
-        min_dist = float('inf')
+        min_dist_sq = float('inf')
         
         for enemy in enemies:
-            dx = enemy.rect.centerx - self.rect.centerx
-            dy = enemy.rect.centery - self.rect.centery
-            dist = math.sqrt(dx**2 + dy**2)
+            dx = enemy.rect.centerx - x
+            dy = enemy.rect.centery - y
+            dist_sq = dx * dx + dy * dy
             
-            if dist < min_dist:
-                min_dist = dist
+            if dist_sq < min_dist_sq:
+                min_dist_sq = dist_sq
                 nearest = enemy
         
         self.target = nearest
     
-    def update(self, enemies=None) -> None:
-        """탄환 위치 업데이트"""
-        if self.weapon_type == WEAPON_HOMING and self.bullet_type == 'player':
-            if enemies:
-                self.find_nearest_enemy(enemies)
+    def update(self, enemies=None, spatial_hash: Optional[SpatialHash] = None) -> None:
+        """
+        탄환 위치 업데이트
+        
+        Args:
+            enemies: 호밍탄이 추적할 적 그룹 (선택)
+            spatial_hash: 적 그룹의 공간 해시 (선택, 타겟 탐색 가속)
+        """
+        if self.homing:
+            self.update_target(enemies, spatial_hash)
+            if self.has_live_target():
+                self.steer()
+        self.move()
+    
+    def update_target(self, enemies=None, spatial_hash: Optional[SpatialHash] = None) -> None:
+        """타겟이 죽었거나 재탐색 주기가 되었을 때만 가장 가까운 적을 다시 찾음"""
+        if enemies:
+            self.retarget_timer -= 1
+            if self.target is None or not self.target.alive() or self.retarget_timer <= 0:
+                self.find_nearest_enemy(enemies, spatial_hash)
+                self.retarget_timer = settings.HOMING_RETARGET_FRAMES
+    
+    def has_live_target(self) -> bool:
+        """추적 중인 타겟이 살아있는지"""
+        return self.target is not None and self.target.alive()
+    
+    def steer(self) -> None:
+        """타겟 방향으로 HOMING_TURN_RATE만큼 회전 (탄속 유지)"""
+        dx = self.target.rect.centerx - self.rect.centerx
+        dy = self.target.rect.centery - self.rect.centery
+        dist = math.sqrt(dx**2 + dy**2)
+        
+        if dist > 0:
+            target_angle = math.atan2(dx, -dy)
+            current_angle = math.atan2(self.speed_x, -self.speed_y)
+            
+            angle_diff = target_angle - current_angle
+            while angle_diff > math.pi:
+                angle_diff -= 2 * math.pi
+            while angle_diff < -math.pi:
+                angle_diff += 2 * math.pi
+            
+            new_angle = current_angle + angle_diff * HOMING_TURN_RATE
             
-            if self.target and self.target.alive():
-                dx = self.target.rect.centerx - self.rect.centerx
-                dy = self.target.rect.centery - self.rect.centery
-                dist = math.sqrt(dx**2 + dy**2)
-                
-                if dist > 0:
-                    target_angle = math.atan2(dx, -dy)
-                    current_angle = math.atan2(self.speed_x, -self.speed_y)
-                    
-                    angle_diff = target_angle - current_angle
-                    while angle_diff > math.pi:
-                        angle_diff -= 2 * math.pi
-                    while angle_diff < -math.pi:
-                        angle_diff += 2 * math.pi
-                    
-                    turn_rate = 0.1
-                    new_angle = current_angle + angle_diff * turn_rate
-                    
-                    self.speed_x = math.sin(new_angle) * self.base_speed
-                    self.speed_y = -math.cos(new_angle) * self.base_speed
+            self.speed_x = math.sin(new_angle) * self.base_speed
+            self.speed_y = -math.cos(new_angle) * self.base_speed
+    
+    def move(self) -> None:
+        """속도만큼 이동하고 화면 밖이면 제거"""
+        self.prev_float_x = self.float_x
+        self.prev_float_y = self.float_y
         
         if self.wave_weapon and self.bullet_type == 'player':
             self.wave_offset += 0.3
@@ -344,16 +546,197 @@ class Bullet(pygame.sprite.Sprite):
             self.rect.right < 0 or self.rect.left > settings.SCREEN_WIDTH):
             self.kill()
     
+    def get_previous_center(self) -> Tuple[int, int]:
+        """직전 프레임의 사각형 중심"""
+        return int(self.prev_float_x), int(self.prev_float_y)
+    
+    def get_sweep_rect(self) -> pygame.Rect:
+        """직전 위치부터 현재 위치까지 지나간 영역 (광역 검사용)"""
+        previous = self.rect.copy()
+        previous.center = self.get_previous_center()
+        return self.rect.union(previous)
+    
     def can_hit(self, enemy) -> bool:
         """해당 적을 맞출 수 있는지"""
         if not self.piercing:
             return True
-        return id(enemy) not in self.hits
+        return enemy.entity_id not in self.hits
     
     def register_hit(self, enemy) -> None:
         """적 맞춤 기록"""
         if self.piercing:
-            self.hits.append(id(enemy))
+            self.hits.add(enemy.entity_id)
+
+
+class BulletPool:
+    """
+    탄환 객체 풀
+    
+    kill()된 탄환을 빈 목록에 모아 두었다가 다음 발사 때 reset()으로 재사용합니다.
+    빈 목록은 max_size까지만 보관하고 넘치는 탄환은 버립니다.
+    """
+    
+    def __init__(self, max_size: int = settings.BULLET_POOL_SIZE):
+        """
+        탄환 풀 초기화
+        
+        Args:
+            max_size: 보관할 최대 탄환 수
+        """
+        self.max_size = max_size
+        self.free: List[Bullet] = []
+        self.hits = 0        # 재사용한 횟수
+        self.misses = 0      # 새로 만든 횟수
+        self.discarded = 0   # 풀이 가득 차 버린 횟수
+        self.in_use = 0
+        self.high_water = 0  # 동시에 사용 중이던 최대 탄환 수
+    
+    def acquire(self, x: int, y: int,
+                bullet_type: Literal['player', 'enemy'],
+                image: pygame.Surface,
+                damage: int = 1,
+                angle: float = 0,
+                weapon_type: str = WEAPON_NORMAL) -> Bullet:
+        """탄환 가져오기 (Bullet 생성자와 같은 인자)"""
+        if self.free:
+            bullet = self.free.pop()
+            bullet.in_pool = False
+            bullet.reset(x, y, bullet_type, image, damage, angle, weapon_type)
+            self.hits += 1
+        else:
+            bullet = Bullet(x, y, bullet_type, image, damage, angle, weapon_type)
+            bullet.pool = self
+            self.misses += 1
+        
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return bullet
+    
+    def release(self, bullet: Bullet) -> None:
+        """탄환 반납 (Bullet.kill에서 호출, 중복 반납은 무시)"""
+        if bullet.in_pool or bullet.pool is not self:
+            return
+        
+        self.in_use -= 1
+        bullet.target = None
+        if len(self.free) < self.max_size:
+            bullet.in_pool = True
+            self.free.append(bullet)
+        else:
+            bullet.pool = None  # 풀과의 연결을 끊고 버림
+            self.discarded += 1
+    
+    def get_stats(self) -> Dict[str, int]:
+        """풀 통계 반환"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'discarded': self.discarded,
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'high_water': self.high_water,
+        }
+
+
+# 플레이어와 적이 함께 쓰는 탄환 풀
+bullet_pool = BulletPool()
+
+
+class PooledBulletGroup(pygame.sprite.Group):
+    """비울 때 탄환을 kill()해서 풀에 반납하는 그룹"""
+    
+    def empty(self) -> None:
+        for bullet in self.sprites():
+            bullet.kill()
+    
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """
+        탄환 그리기
+        
+        Args:
+            surface: 그릴 Surface
+            alpha: 직전 스텝 위치(prev_float_x/y)에서 현재 위치까지 보간 비율 (렌더 보간용)
+        """
+        if alpha >= 1.0:
+            super().draw(surface)
+            return
+        
+        blits = []
+        for bullet in self.sprites():
+            x = bullet.prev_float_x + (bullet.float_x - bullet.prev_float_x) * alpha
+            y = bullet.prev_float_y + (bullet.float_y - bullet.prev_float_y) * alpha
+            rect = bullet.rect
+            blits.append((bullet.image, (int(x) - (rect.centerx - rect.left), int(y) - (rect.centery - rect.top))))
+        surface.blits(blits, doreturn=False)
+
+
+class PlayerBulletGroup(PooledBulletGroup):
+    """플레이어 탄환 전용 그룹"""
+    
+    def update(self, enemies=None, spatial_hash: Optional[SpatialHash] = None) -> None:
+        """탄환 이동 (호밍탄은 적 그룹과 공간 해시를 참조, 조향은 한 번에 계산)"""
+        bullets = self.sprites()
+        steering = []
+        for bullet in bullets:
+            if bullet.homing:
+                bullet.update_target(enemies, spatial_hash)
+                if bullet.has_live_target():
+                    steering.append(bullet)
+        if len(steering) >= HOMING_BATCH_MIN:
+            steer_homing_bullets(steering)
+        else:
+            for bullet in steering:
+                bullet.steer()
+        
+        for bullet in bullets:
+            bullet.move()
+
+
+class EnemyBulletGroup(PooledBulletGroup):
+    """적 탄환 전용 그룹 (sweep-and-prune 자동 관리)"""
+    
+    def __init__(self, *sprites):
+        self.sweep = SweepAndPrune()
+        super().__init__(*sprites)
+    
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite)
+        self.sweep.add(sprite)
+    
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        self.sweep.remove(sprite)
+    
+    def update(self) -> None:
+        """탄환 이동 후 y축 정렬 갱신"""
+        for bullet in self.sprites():
+            bullet.update()
+        self.sweep.update()
+    
+    def spawn_batch(self, xs, ys, vxs, vys, image, damage: int = 1,
+                    weapon_type: str = WEAPON_NORMAL) -> None:
+        """
+        같은 이미지의 적 탄환 여러 발을 풀에서 꺼내 한 번에 추가 (BulletArray.spawn_batch와 같은 인자)
+        
+        Args:
+            xs, ys: 중심 좌표 배열 (스칼라면 모든 탄환에 적용)
+            vxs, vys: 프레임당 이동량 배열 (스칼라면 모든 탄환에 적용)
+            image: 탄환 이미지, 또는 탄환별 이미지 목록 (회전하지 않고 그대로 사용)
+            damage: 탄환 데미지
+            weapon_type: 무기 타입
+        """
+        xs, ys, vxs, vys = (array.tolist() for array in np.broadcast_arrays(xs, ys, vxs, vys))
+        images = [image] * len(xs) if isinstance(image, pygame.Surface) else image
+        acquire = bullet_pool.acquire
+        bullets = []
+        for x, y, vx, vy, bullet_image in zip(xs, ys, vxs, vys, images):
+            bullet = acquire(x, y, 'enemy', bullet_image, damage, 0, weapon_type)
+            bullet.speed_x = vx
+            bullet.speed_y = vy
+            bullet.base_speed = math.hypot(vx, vy)
+            bullets.append(bullet)
+        self.add(*bullets)
 
 
 class TractorBeam(pygame.sprite.Sprite):
@@ -367,20 +750,21 @@ class TractorBeam(pygame.sprite.Sprite):
         self.rect.top = y
         self.speed = settings.TRACTOR_BEAM_SPEED
         self.capturing = False
-        self.capture_start_time = 0
+        self.capture_elapsed = 0
     
-    def update(self) -> None:
+    def update(self, clock: SimClock) -> None:
         if not self.capturing:
             self.rect.y += self.speed
             if self.rect.top > settings.SCREEN_HEIGHT:
                 self.kill()
+        else:
+            self.capture_elapsed += clock.dt
     
     def start_capture(self) -> None:
         self.capturing = True
-        self.capture_start_time = pygame.time.get_ticks()
+        self.capture_elapsed = 0
     
     def is_capture_complete(self) -> bool:
         if not self.capturing:
             return False
-        elapsed = pygame.time.get_ticks() - self.capture_start_time
-        return elapsed >= settings.TRACTOR_BEAM_CAPTURE_TIME
\ No newline at end of file
+        return self.capture_elapsed >= settings.TRACTOR_BEAM_CAPTURE_TIME
\ No newline at end of file
@@ -0,0 +1,262 @@
+# bullet_engine.py
+"""
+NumPy 구조 배열(SoA) 탄환 엔진
+탄환 하나를 스프라이트 객체 대신 배열의 한 칸으로 저장하고,
+이동/화면 밖 정리/충돌 검사를 벡터 연산으로 한 번에 처리합니다. (탄막 난이도용)
+직선 이동 탄환만 다루며 호밍/파동 탄환은 기존 스프라이트 그룹을 사용합니다.
+"""
+import numpy as np
+import pygame
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import settings
+from bullet import WEAPON_INFO, WEAPON_NORMAL
+from collision_kernel import overlap_mask, pack_rect
+
+# 발사 주체
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+# 무기 타입 <-> 정수 코드
+WEAPON_TYPES: List[str] = list(WEAPON_INFO)
+WEAPON_CODES: Dict[str, int] = {weapon_type: code for code, weapon_type in enumerate(WEAPON_TYPES)}
+
+# 탄환별 배열 (이름, dtype)
+_FIELDS = (
+    ('x', np.float64),        # 중심 좌표
+    ('y', np.float64),
+    ('vx', np.float64),       # 프레임당 이동량
+    ('vy', np.float64),
+    ('damage', np.int32),
+    ('weapon', np.int8),      # WEAPON_CODES
+    ('owner', np.int8),       # OWNER_PLAYER / OWNER_ENEMY
+    ('alive', np.bool_),
+    ('image_id', np.int32),   # images 목록 인덱스
+)
+
+
+class BulletArray:
+    """
+    배열 기반 탄환 묶음
+    
+    스프라이트 그룹과 같은 add/update/draw/empty/len 인터페이스를 제공하므로
+    적 탄환 그룹 자리에 그대로 넣을 수 있습니다.
+    배열은 발사 순서대로 유지되며, kill()은 alive만 끄고 다음 update()에서 한꺼번에 정리합니다.
+    """
+    
+    def __init__(self, capacity: int = settings.BULLET_ARRAY_CAPACITY):
+        """
+        탄환 배열 초기화
+        
+        Args:
+            capacity: 처음 확보할 탄환 수 (가득 차면 두 배로 늘림)
+        """
+        self.capacity = capacity
+        self.count = 0  # 사용 중인 앞쪽 칸 수 (죽은 탄환 포함)
+        for name, dtype in _FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        
+        # 탄환 이미지 테이블 (같은 Surface는 한 번만 등록)
+        self.images: List[pygame.Surface] = []
+        self._image_ids: Dict[pygame.Surface, int] = {}
+        self._image_sizes = np.zeros((0, 2), dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive[:self.count]))
+    
+    def _reserve(self, extra: int) -> int:
+        """extra개를 더 넣을 자리를 확보하고 시작 인덱스 반환"""
+        start = self.count
+        needed = start + extra
+        if needed > self.capacity:
+            capacity = self.capacity
+            while capacity < needed:
+                capacity *= 2
+            for name, dtype in _FIELDS:
+                grown = np.zeros(capacity, dtype=dtype)
+                grown[:start] = getattr(self, name)[:start]
+                setattr(self, name, grown)
+            self.capacity = capacity
+        self.count = needed
+        return start
+    
+    def image_index(self, image: pygame.Surface) -> int:
+        """이미지를 테이블에 등록하고 인덱스 반환"""
+        index = self._image_ids.get(image)
+        if index is None:
+            index = len(self.images)
+            self.images.append(image)
+            self._image_ids[image] = index
+            self._image_sizes = np.vstack((self._image_sizes, image.get_size()))
+        return index
+    
+    def spawn(self, x: float, y: float, vx: float, vy: float, image: pygame.Surface,
+              damage: int = 1, weapon_type: str = WEAPON_NORMAL,
+              owner: int = OWNER_ENEMY) -> None:
+        """탄환 1발 추가"""
+        self.spawn_batch(np.array([x], dtype=np.float64), np.array([y], dtype=np.float64),
+                         np.array([vx], dtype=np.float64), np.array([vy], dtype=np.float64),
+                         image, damage, weapon_type, owner)
+    
+    def spawn_batch(self, xs: np.ndarray, ys: np.ndarray, vxs: np.ndarray, vys: np.ndarray,
+                    image: Union[pygame.Surface, Sequence[pygame.Surface]], damage: int = 1, weapon_type: str = WEAPON_NORMAL,
+                    owner: int = OWNER_ENEMY) -> None:
+        """
+        같은 이미지의 탄환 여러 발을 한 번에 추가
+        
+        Args:
+            xs, ys: 중심 좌표 배열 (스칼라면 모든 탄환에 적용)
+            vxs, vys: 프레임당 이동량 배열 (스칼라면 모든 탄환에 적용)
+            image: 탄환 이미지 (공유 Surface), 또는 탄환별 이미지 목록
+            damage: 탄환 데미지
+            weapon_type: 무기 타입
+            owner: OWNER_PLAYER 또는 OWNER_ENEMY
+        """
+        size = int(np.broadcast(xs, ys, vxs, vys).size)
+        if size == 0:
+            return
+        
+        start = self._reserve(size)
+        end = start + size
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.vx[start:end] = vxs
+        self.vy[start:end] = vys
+        self.damage[start:end] = damage
+        self.weapon[start:end] = WEAPON_CODES.get(weapon_type, 0)
+        self.owner[start:end] = owner
+        self.alive[start:end] = True
+        if isinstance(image, pygame.Surface):
+            self.image_id[start:end] = self.image_index(image)
+        else:
+            self.image_id[start:end] = [self.image_index(bullet_image) for bullet_image in image]
+    
+    def add(self, *bullets) -> None:
+        """
+        Bullet 스프라이트를 배열로 옮겨 담기 (스프라이트 그룹의 add와 호환용)
+        
+        옮긴 스프라이트는 kill()해서 탄환 풀에 바로 반납합니다.
+        스프라이트 생성 비용이 그대로 들므로 새로 쏘는 탄은 spawn_batch(emitter.emit)로 넣습니다.
+        """
+        for bullet in bullets:
+            owner = OWNER_PLAYER if bullet.bullet_type == 'player' else OWNER_ENEMY
+            self.spawn(bullet.float_x, bullet.float_y, bullet.speed_x, bullet.speed_y,
+                       bullet.image, bullet.damage, bullet.weapon_type, owner)
+            bullet.kill()
+    
+    def _topleft(self, indices: Optional[np.ndarray] = None):
+        """
+        사각형 좌상단과 크기 계산 (Bullet과 같은 int() 절삭 + rect.center 규칙)
+        
+        Returns:
+            (left, top, width, height) 배열
+        """
+        if indices is None:
+            x, y, image_id = self.x[:self.count], self.y[:self.count], self.image_id[:self.count]
+        else:
+            x, y, image_id = self.x[indices], self.y[indices], self.image_id[indices]
+        sizes = self._image_sizes[image_id]
+        width, height = sizes[:, 0], sizes[:, 1]
+        left = x.astype(np.int64) - width // 2
+        top = y.astype(np.int64) - height // 2
+        return left, top, width, height
+    
+    def update(self) -> None:
+        """모든 탄환 이동 후 화면 밖 탄환과 죽은 탄환 정리"""
+        n = self.count
+        if n == 0:
+            return
+        
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        
+        left, top, width, height = self._topleft()
+        self.alive[:n] &= ((top + height >= 0) & (top <= settings.SCREEN_HEIGHT) &
+                           (left + width >= 0) & (left <= settings.SCREEN_WIDTH))
+        self._compact()
+    
+    def _compact(self) -> None:
+        """살아있는 탄환을 발사 순서대로 앞으로 모음"""
+        n = self.count
+        keep = self.alive[:n].copy()  # alive 자체도 옮기므로 복사
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return
+        
+        for name, _ in _FIELDS:
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+    
+    def _alive_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[:self.count])
+    
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """
+        살아있는 탄환을 Surface.blits 한 번으로 그리기
+        
+        Args:
+            surface: 그릴 Surface
+            alpha: 직전 스텝 위치(현재 위치 - 속도)에서 현재 위치까지 보간 비율 (렌더 보간용)
+        """
+        indices = self._alive_indices()
+        if len(indices) == 0:
+            return
+        
+        if alpha >= 1.0:
+            left, top, _, _ = self._topleft(indices)
+        else:
+            back = 1.0 - alpha
+            sizes = self._image_sizes[self.image_id[indices]]
+            left = (self.x[indices] - self.vx[indices] * back).astype(np.int64) - sizes[:, 0] // 2
+            top = (self.y[indices] - self.vy[indices] * back).astype(np.int64) - sizes[:, 1] // 2
+        images = self.images
+        surface.blits(zip(map(images.__getitem__, self.image_id[indices].tolist()),
+                          zip(left.tolist(), top.tolist())),
+                      doreturn=False)
+    
+    def pack_rects(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        살아있는 탄환 사각형을 collision_kernel 형식으로 묶기
+        
+        Returns:
+            ((N, 4) (left, top, right, bottom) 배열, 배열 인덱스)
+        """
+        indices = self._alive_indices()
+        left, top, width, height = self._topleft(indices)
+        rects = np.column_stack((left, top, left + width, top + height)).astype(np.int32)
+        return rects, indices
+    
+    def first_overlap(self, rect: pygame.Rect,
+                      test: Optional[Callable[[int], bool]] = None) -> int:
+        """
+        rect와 겹치는 가장 먼저 발사된 탄환의 인덱스 (없으면 -1)
+        
+        Args:
+            rect: 검사할 사각형
+            test: 사각형이 겹친 탄환 인덱스를 받아 최종 판정하는 함수 (선택)
+        """
+        rects, indices = self.pack_rects()
+        if len(indices) == 0:
+            return -1
+        for index in indices[overlap_mask(rects, pack_rect(rect))].tolist():
+            if test is None or test(index):
+                return index
+        return -1
+    
+    def get_rect(self, index: int) -> pygame.Rect:
+        """탄환 하나의 사각형"""
+        left, top, width, height = self._topleft(np.array([index]))
+        return pygame.Rect(int(left[0]), int(top[0]), int(width[0]), int(height[0]))
+    
+    def get_image(self, index: int) -> pygame.Surface:
+        """탄환 하나의 이미지"""
+        return self.images[self.image_id[index]]
+    
+    def kill(self, index: int) -> None:
+        """탄환 제거 (실제 정리는 다음 update에서)"""
+        self.alive[index] = False
+    
+    def empty(self) -> None:
+        """모든 탄환 제거"""
+        self.alive[:self.count] = False
+        self.count = 0
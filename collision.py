@@ -3,15 +3,197 @@
 충돌 처리 모듈
 """
 import pygame
-from typing import Tuple, List
+import numpy as np
+from typing import Tuple, List, Optional, Iterable
 import settings
+from broadphase import SpatialHash
+from bullet import EnemyBulletGroup
+from bullet_engine import BulletArray
+from collision_kernel import (pack_rects, pack_rect, pack_rect_list, pack_centers,
+                              overlap_pairs, overlap_mask, first_overlap, swept_hit_times,
+                              within_radius)
+from mask_cache import get_mask, masks_overlap
 
 
-def check_bullet_enemy_collision(bullets: pygame.sprite.Group,
-                                  enemies: pygame.sprite.Group) -> Tuple[int, List, List, List]:
+def _first_hit(sprite: pygame.sprite.Sprite, others: List) -> int:
+    """
+    스프라이트와 처음 겹치는 항목 인덱스 (없으면 -1)
+    
+    정밀 충돌 모드면 사각형이 겹치는 항목만 마스크로 다시 확인합니다.
+    """
+    rects = pack_rects(others)
+    rect = pack_rect(sprite.rect)
+    if not settings.PRECISE_COLLISION:
+        return first_overlap(rects, rect)
+    
+    if len(rects) == 0:
+        return -1
+    for index in np.flatnonzero(overlap_mask(rects, rect)).tolist():
+        if masks_overlap(sprite, others[index]):
+            return index
+    return -1
+
+
+def find_enemies_in_radius(enemies: pygame.sprite.Group, x: float, y: float, radius: float,
+                           spatial_hash: Optional[SpatialHash] = None) -> List:
+    """
+    중심이 원 안(경계 포함)에 있는 적 찾기 (광역 피해용)
+    
+    공간 해시가 주어지면 원이 걸치는 칸만 검사하고, 없으면 NumPy로 일괄 계산합니다.
+    
+    Args:
+        enemies: 적 그룹
+        x: 원 중심 x
+        y: 원 중심 y
+        radius: 반지름
+        spatial_hash: 이번 프레임에 적 그룹으로 재구성한 공간 해시
+    
+    Returns:
+        그룹 순서대로 정렬된 적 리스트
+    """
+    if spatial_hash is not None:
+        return [enemy for enemy in spatial_hash.query_radius(x, y, radius) if enemy in enemies]
+    
+    enemy_list = list(enemies)
+    if not enemy_list:
+        return []
+    inside = np.flatnonzero(within_radius(pack_centers(enemy_list), x, y, radius))
+    return [enemy_list[i] for i in inside.tolist()]
+
+
+def _damage_enemy(enemy, damage: int, hit_positions: List, boss_killed_positions: List,
+                  split_children: List) -> int:
+    """
+    적 하나에 피해를 주고 분열/처치 결과 기록
+    
+    Returns:
+        획득한 점수
+    """
+    pos = (enemy.rect.centerx, enemy.rect.centery)
+    
+    # 분열 적 체크
+    if enemy.can_split():
+        children = enemy.get_split_children()
+        split_children.extend(children)
+    
+    if enemy.take_damage(damage):
+        if enemy.is_boss:
+            boss_killed_positions.append(pos)
+        else:
+            hit_positions.append(pos)
+        return enemy.get_score_value()
+    
+    return 0
+
+
+def _apply_splash(bullet, center: Tuple[int, int], direct_hit, enemies: pygame.sprite.Group,
+                  spatial_hash: Optional[SpatialHash], hit_positions: List,
+                  boss_killed_positions: List, split_children: List) -> int:
+    """
+    폭발 무기(플라즈마)의 범위 피해 처리
+    
+    Returns:
+        획득한 점수
+    """
+    damage = max(1, int(bullet.damage * settings.PLASMA_SPLASH_DAMAGE_RATIO))
+    score = 0
+    
+    for enemy in find_enemies_in_radius(enemies, center[0], center[1],
+                                        settings.PLASMA_SPLASH_RADIUS, spatial_hash):
+        if enemy is direct_hit or enemy not in enemies:
+            continue
+        score += _damage_enemy(enemy, damage, hit_positions, boss_killed_positions, split_children)
+    
+    return score
+
+
+def _resolve_bullet_hits(bullet, candidates: Iterable, enemies: pygame.sprite.Group,
+                         hit_positions: List, boss_killed_positions: List,
+                         split_children: List,
+                         spatial_hash: Optional[SpatialHash] = None) -> int:
+    """
+    탄환 하나와 겹치는 적 후보들을 주어진 순서대로 처리
+    
+    Returns:
+        획득한 점수
+    """
+    score = 0
+    piercing = bullet.piercing
+    
+    for enemy in candidates:
+        if enemy not in enemies:
+            continue  # 이번 프레임에 이미 처치된 적
+        
+        # 관통 무기의 경우 이미 맞은 적인지 확인
+        if not bullet.can_hit(enemy):
+            continue
+        
+        center = enemy.rect.center
+        
+        # 관통 무기는 맞춤 기록
+        if piercing:
+            bullet.register_hit(enemy)
+        else:
+            bullet.kill()
+        
+        score += _damage_enemy(enemy, bullet.damage, hit_positions, boss_killed_positions,
+                               split_children)
+        
+        # 폭발 무기는 맞은 적 주변에 범위 피해
+        if bullet.explosive:
+            score += _apply_splash(bullet, center, enemy, enemies, spatial_hash, hit_positions,
+                                   boss_killed_positions, split_children)
+        
+        # 관통 무기가 아니면 다음 탄환으로
+        if not piercing:
+            break
+    
+    return score
+
+
+def _pack_sweeps(bullets: List) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """탄환별 (이동 전 중심, 이동 후 중심, 크기) 배열"""
+    start = np.array([bullet.get_previous_center() for bullet in bullets], dtype=np.int32)
+    end = np.array([bullet.rect.center for bullet in bullets], dtype=np.int32)
+    size = np.array([bullet.rect.size for bullet in bullets], dtype=np.int32)
+    return start.reshape(-1, 2), end.reshape(-1, 2), size.reshape(-1, 2)
+
+
+def _precise_swept_hit(bullet, enemy, start: np.ndarray, end: np.ndarray,
+                       enter: float, leave: float) -> bool:
+    """
+    연속 충돌로 걸린 쌍을 마스크로 다시 확인
+    
+    현재 위치에서 겹치면 현재 위치로, 프레임 사이에 통과했으면
+    겹침 구간 중간 위치로 마스크를 비교합니다.
+    """
+    if bullet.rect.colliderect(enemy.rect):
+        return masks_overlap(bullet, enemy)
+    
+    t = (enter + leave) / 2
+    cx = int(round(start[0] + (end[0] - start[0]) * t))
+    cy = int(round(start[1] + (end[1] - start[1]) * t))
+    width, height = bullet.rect.size
+    return masks_overlap(bullet, enemy, (cx - width // 2, cy - height // 2))
+
+
+def check_bullet_enemy_collision(player_bullets: pygame.sprite.Group,
+                                  enemies: pygame.sprite.Group,
+                                  spatial_hash: Optional[SpatialHash] = None) -> Tuple[int, List, List, List]:
     """
     플레이어 탄환과 적의 충돌 처리
     
+    탄환이 직전 위치에서 현재 위치까지 지나간 선분으로 연속 충돌을 검사하므로
+    빠른 탄환이 한 프레임에 적을 건너뛰어도 맞습니다.
+    광역 검사는 공간 해시가 주어지면 해시로, 없으면 NumPy 커널로 합니다.
+    한 탄환이 여러 적에 닿으면 먼저 닿은 순서(같으면 그룹 순서)대로 처리하고,
+    정밀 충돌 모드면 마스크로 한 번 더 확인합니다.
+    
+    Args:
+        player_bullets: 플레이어 탄환 그룹
+        enemies: 적 그룹
+        spatial_hash: 이번 프레임에 적 그룹으로 재구성한 공간 해시
+    
     Returns:
         (획득한 점수, 일반 충돌 위치 리스트, 보스 충돌 위치 리스트, 분열 자식 리스트)
     """
@@ -20,67 +202,123 @@ def check_bullet_enemy_collision(bullets: pygame.sprite.Group,
     boss_killed_positions = []
     split_children = []
     
-    for bullet in list(bullets):
-        if bullet.bullet_type != 'player':
-            continue
-        
-        for enemy in list(enemies):
-            if pygame.sprite.collide_rect(bullet, enemy):
-                # 관통 무기의 경우 이미 맞은 적인지 확인
-                if hasattr(bullet, 'can_hit') and not bullet.can_hit(enemy):
-                    continue
-                
-                pos = (enemy.rect.centerx, enemy.rect.centery)
-                
-                # 관통 무기는 맞춤 기록
-                if hasattr(bullet, 'piercing') and bullet.piercing:
-                    bullet.register_hit(enemy)
-                else:
-                    bullet.kill()
-                
-                # 분열 적 체크
-                if enemy.can_split():
-                    children = enemy.get_split_children()
-                    split_children.extend(children)
-                
-                if enemy.take_damage(bullet.damage):
-                    score += enemy.get_score_value()
-                    
-                    if enemy.is_boss:
-                        boss_killed_positions.append(pos)
-                    else:
-                        hit_positions.append(pos)
-                
-                # 관통 무기가 아니면 다음 탄환으로
-                if not (hasattr(bullet, 'piercing') and bullet.piercing):
-                    break
+    bullet_list = list(player_bullets)
+    if not bullet_list or not enemies:
+        return score, hit_positions, boss_killed_positions, split_children
+    
+    # 광역 검사: 지나간 영역과 겹치는 (탄환, 적) 후보 쌍
+    if spatial_hash is not None:
+        pair_rows = []
+        pair_enemies = []
+        for row, bullet in enumerate(bullet_list):
+            for enemy in spatial_hash.query_rect(bullet.get_sweep_rect()):
+                pair_rows.append(row)
+                pair_enemies.append(enemy)
+        pair_rows = np.array(pair_rows, dtype=np.intp)
+    else:
+        enemy_list = list(enemies)
+        sweep_rects = pack_rect_list(bullet.get_sweep_rect() for bullet in bullet_list)
+        pairs = overlap_pairs(sweep_rects, pack_rects(enemy_list))
+        pair_rows = pairs[:, 0]
+        pair_enemies = [enemy_list[i] for i in pairs[:, 1].tolist()]
+    
+    if len(pair_rows) == 0:
+        return score, hit_positions, boss_killed_positions, split_children
+    
+    # 정밀 검사: 선분 대 사각형 충돌 시각
+    start, end, size = _pack_sweeps(bullet_list)
+    start, end, size = start[pair_rows], end[pair_rows], size[pair_rows]
+    enter, leave = swept_hit_times(start, end, size, pack_rects(pair_enemies))
+    
+    # 탄환 순서 -> 충돌 시각 -> 그룹 순서로 정렬
+    order = np.lexsort((np.arange(len(enter)), enter, pair_rows))
+    order = order[np.isfinite(enter[order])]
+    if len(order) == 0:
+        return score, hit_positions, boss_killed_positions, split_children
+    
+    rows = pair_rows[order]
+    bounds = np.flatnonzero(np.diff(rows)) + 1
+    precise = settings.PRECISE_COLLISION
+    for row, chunk in zip(rows[np.r_[0, bounds]].tolist(), np.split(order, bounds)):
+        bullet = bullet_list[row]
+        chunk = chunk.tolist()
+        if precise:
+            chunk = [k for k in chunk
+                     if _precise_swept_hit(bullet, pair_enemies[k], start[k], end[k],
+                                           enter[k], leave[k])]
+        candidates = [pair_enemies[k] for k in chunk]
+        if candidates:
+            score += _resolve_bullet_hits(bullet, candidates, enemies, hit_positions,
+                                          boss_killed_positions, split_children, spatial_hash)
     
     return score, hit_positions, boss_killed_positions, split_children
 
 
-def check_player_bullet_collision(player, bullets: pygame.sprite.Group) -> bool:
-    """플레이어와 적 탄환의 충돌 처리"""
+def check_player_bullet_collision(player, enemy_bullets: pygame.sprite.Group) -> bool:
+    """
+    플레이어와 적 탄환의 충돌 처리
+    
+    EnemyBulletGroup이면 y축 정렬(sweep-and-prune)로 플레이어 높이 구간만 검사하고,
+    BulletArray면 배열 전체를 한 번에 검사합니다.
+    """
     if not player or not player.alive():
         return False
     
-    for bullet in bullets:
-        if bullet.bullet_type == 'enemy':
-            if pygame.sprite.collide_rect(player, bullet):
-                bullet.kill()
-                return True
+    if isinstance(enemy_bullets, BulletArray):
+        test = None
+        if settings.PRECISE_COLLISION:
+            player_mask = get_mask(player.image)
+            
+            def test(index):
+                rect = enemy_bullets.get_rect(index)
+                offset = (rect.x - player.rect.x, rect.y - player.rect.y)
+                return player_mask.overlap(get_mask(enemy_bullets.get_image(index)), offset) is not None
+        index = enemy_bullets.first_overlap(player.rect, test)
+        if index >= 0:
+            enemy_bullets.kill(index)
+            return True
+        return False
+    
+    if isinstance(enemy_bullets, EnemyBulletGroup):
+        test = None
+        if settings.PRECISE_COLLISION:
+            def test(bullet):
+                return masks_overlap(player, bullet)
+        bullet = enemy_bullets.sweep.first_overlap(player.rect, test)
+        if bullet:
+            bullet.kill()
+            return True
+        return False
+    
+    bullet_list = list(enemy_bullets)
+    index = _first_hit(player, bullet_list)
+    if index >= 0:
+        bullet_list[index].kill()
+        return True
     
     return False
 
 
-def check_player_enemy_collision(player, enemies: pygame.sprite.Group) -> bool:
+def check_player_enemy_collision(player, enemies: pygame.sprite.Group,
+                                 spatial_hash: Optional[SpatialHash] = None) -> bool:
     """플레이어와 적의 직접 충돌 처리"""
     if not player or not player.alive():
         return False
     
-    for enemy in enemies:
-        if pygame.sprite.collide_rect(player, enemy):
-            enemy.kill()
-            return True
+    if spatial_hash is not None:
+        precise = settings.PRECISE_COLLISION
+        for enemy in spatial_hash.query_rect(player.rect):
+            if (enemy in enemies and pygame.sprite.collide_rect(player, enemy)
+                    and (not precise or masks_overlap(player, enemy))):
+                enemy.kill()
+                return True
+        return False
+    
+    enemy_list = list(enemies)
+    index = _first_hit(player, enemy_list)
+    if index >= 0:
+        enemy_list[index].kill()
+        return True
     
     return False
 
@@ -90,24 +328,27 @@ def check_tractor_beam_player_collision(player, tractor_beams: pygame.sprite.Gro
     if not player or not player.alive():
         return None
     
-    for beam in tractor_beams:
-        if pygame.sprite.collide_rect(player, beam):
-            return beam
+    beam_list = list(tractor_beams)
+    index = first_overlap(pack_rects(beam_list), pack_rect(player.rect))
+    if index >= 0:
+        return beam_list[index]
     
     return None
 
 
-def check_bullet_beam_collision(bullets: pygame.sprite.Group,
+def check_bullet_beam_collision(player_bullets: pygame.sprite.Group,
                                  tractor_beams: pygame.sprite.Group) -> bool:
     """플레이어 탄환과 트랙터 빔의 충돌 처리"""
-    for bullet in bullets:
-        if bullet.bullet_type != 'player':
-            continue
-        
-        for beam in tractor_beams:
-            if pygame.sprite.collide_rect(bullet, beam):
-                bullet.kill()
-                beam.kill()
-                return True
+    if not tractor_beams:
+        return False
     
-    return False
\ No newline at end of file
+    bullet_list = list(player_bullets)
+    beam_list = list(tractor_beams)
+    pairs = overlap_pairs(pack_rects(bullet_list), pack_rects(beam_list))
+    if len(pairs):
+        bullet_row, beam_row = pairs[0].tolist()
+        bullet_list[bullet_row].kill()
+        beam_list[beam_row].kill()
+        return True
+    
+    return False
@@ -0,0 +1,148 @@
+# collision_kernel.py
+"""
+NumPy 기반 일괄 사각형 충돌 커널
+스프라이트 사각형을 int32 배열로 묶어 한 번에 겹침 여부를 계산합니다.
+"""
+import numpy as np
+import pygame
+from typing import Iterable, Tuple
+
+# 한 번에 계산할 겹침 행렬의 최대 원소 수 (메모리 상한)
+MAX_MATRIX_CELLS = 1 << 20
+
+
+def pack_rect_list(rects: Iterable[pygame.Rect]) -> np.ndarray:
+    """
+    사각형 목록을 (N, 4) int32 배열로 변환
+    
+    Returns:
+        각 행이 (left, top, right, bottom)인 연속 배열
+    """
+    packed = np.array([tuple(rect) for rect in rects], dtype=np.int32).reshape(-1, 4)
+    packed[:, 2] += packed[:, 0]
+    packed[:, 3] += packed[:, 1]
+    return packed
+
+
+def pack_rects(sprites: Iterable[pygame.sprite.Sprite]) -> np.ndarray:
+    """스프라이트 사각형을 (N, 4) int32 배열로 변환"""
+    return pack_rect_list(sprite.rect for sprite in sprites)
+
+
+def pack_centers(sprites: Iterable[pygame.sprite.Sprite]) -> np.ndarray:
+    """스프라이트 사각형 중심을 (N, 2) int32 배열로 변환"""
+    return np.array([sprite.rect.center for sprite in sprites], dtype=np.int32).reshape(-1, 2)
+
+
+def pack_rect(rect: pygame.Rect) -> np.ndarray:
+    """단일 사각형을 (4,) int32 배열로 변환"""
+    return np.array([rect.left, rect.top, rect.right, rect.bottom], dtype=np.int32)
+
+
+def _non_empty(rects: np.ndarray) -> np.ndarray:
+    """크기가 0인 사각형 제외 (pygame.Rect.colliderect와 동일)"""
+    return (rects[:, 2] > rects[:, 0]) & (rects[:, 3] > rects[:, 1])
+
+
+def overlap_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """a의 각 행과 b의 각 행이 겹치는지 나타내는 (Na, Nb) 불리언 행렬"""
+    return ((a[:, None, 0] < b[None, :, 2]) &
+            (a[:, None, 2] > b[None, :, 0]) &
+            (a[:, None, 1] < b[None, :, 3]) &
+            (a[:, None, 3] > b[None, :, 1]) &
+            _non_empty(a)[:, None] &
+            _non_empty(b)[None, :])
+
+
+def overlap_pairs(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    겹치는 (a 인덱스, b 인덱스) 쌍 계산
+    
+    b 전체의 경계 상자와 겹치지 않는 a 행은 미리 걸러내고,
+    남은 행은 메모리 상한에 맞춰 나눠서 계산합니다.
+    
+    Returns:
+        (K, 2) 배열. a 순서, 같은 a 안에서는 b 순서 (이중 루프와 동일한 순서)
+    """
+    if len(a) == 0 or len(b) == 0:
+        return np.empty((0, 2), dtype=np.intp)
+    
+    # 경계 상자 가지치기
+    left, top = b[:, 0].min(), b[:, 1].min()
+    right, bottom = b[:, 2].max(), b[:, 3].max()
+    rows = np.flatnonzero((a[:, 0] < right) & (a[:, 2] > left) &
+                          (a[:, 1] < bottom) & (a[:, 3] > top))
+    if len(rows) == 0:
+        return np.empty((0, 2), dtype=np.intp)
+    
+    chunk = max(1, MAX_MATRIX_CELLS // len(b))
+    pieces = []
+    for start in range(0, len(rows), chunk):
+        chunk_rows = rows[start:start + chunk]
+        hit_a, hit_b = np.nonzero(overlap_matrix(a[chunk_rows], b))
+        pieces.append(np.column_stack((chunk_rows[hit_a], hit_b)))
+    
+    return np.concatenate(pieces)
+
+
+def swept_hit_times(start: np.ndarray, end: np.ndarray, size: np.ndarray,
+                    rects: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    선분을 따라 이동하는 사각형의 충돌 구간 계산 (slab 방식)
+    
+    대상 사각형을 이동 사각형 크기만큼 넓힌 뒤, 중심이 지나는 선분과 교차시킵니다.
+    t = 1에서 겹치면 항상 충돌로 판정되므로 colliderect 결과를 포함합니다.
+    
+    Args:
+        start: (K, 2) 이동 전 중심
+        end: (K, 2) 이동 후 중심
+        size: (K, 2) 이동 사각형의 (width, height)
+        rects: (K, 4) 대상 사각형
+    
+    Returns:
+        (진입 시각, 이탈 시각) 각각 (K,) 배열. [0, 1] 범위로 자르며 충돌하지 않으면 진입 시각이 inf
+    """
+    # rect.center 대입 규칙과 같은 비대칭 반폭
+    half_hi = size // 2
+    half_lo = size - half_hi
+    lo = rects[:, :2] - half_lo
+    hi = rects[:, 2:] + half_hi
+    delta = end - start
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t1 = (lo - start) / delta
+        t2 = (hi - start) / delta
+    
+    # 해당 축으로 움직이지 않으면 처음부터 안에 있는지로 결정
+    still = delta == 0
+    inside = (start > lo) & (start < hi)
+    t_enter = np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2))
+    t_exit = np.where(still, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2))
+    
+    enter = t_enter.max(axis=1)
+    leave = t_exit.min(axis=1)
+    hit = (enter < leave) & (enter < 1) & (leave > 0) & _non_empty(rects)
+    
+    enter = np.where(hit, np.maximum(enter, 0.0), np.inf)
+    leave = np.where(hit, np.minimum(leave, 1.0), np.inf)
+    return enter, leave
+
+
+def within_radius(centers: np.ndarray, x: float, y: float, radius: float) -> np.ndarray:
+    """각 중심이 원 안(경계 포함)에 있는지 (N,) 불리언 마스크 (제곱 거리 비교)"""
+    dx = centers[:, 0] - x
+    dy = centers[:, 1] - y
+    return dx * dx + dy * dy <= radius * radius
+
+
+def overlap_mask(rects: np.ndarray, rect: np.ndarray) -> np.ndarray:
+    """배열의 각 사각형이 단일 사각형과 겹치는지 (N,) 불리언 마스크"""
+    return overlap_matrix(rect.reshape(1, 4), rects)[0]
+
+
+def first_overlap(rects: np.ndarray, rect: np.ndarray) -> int:
+    """단일 사각형과 처음 겹치는 행 인덱스 (없으면 -1)"""
+    if len(rects) == 0:
+        return -1
+    hits = np.flatnonzero(overlap_mask(rects, rect))
+    return int(hits[0]) if len(hits) else -1
@@ -5,6 +5,7 @@
 import pygame
 import random
 from typing import List
+from sim_clock import SimClock
 
 
 class Explosion(pygame.sprite.Sprite):
@@ -126,7 +127,7 @@ class ScreenShake:
         """큰 흔들림 (보스 처치 시)"""
         self.start_shake(12, 400)
     
-    def update(self) -> None:
+    def update(self, clock: SimClock) -> None:
         """흔들림 업데이트"""
         if self.shake_amount > 0:
             progress = self.shake_amount / self.shake_duration
@@ -135,7 +136,7 @@ class ScreenShake:
             self.offset_x = random.randint(-current_intensity, current_intensity)
             self.offset_y = random.randint(-current_intensity, current_intensity)
             
-            self.shake_amount -= 16
+            self.shake_amount -= clock.dt
         else:
             self.offset_x = 0
             self.offset_y = 0
@@ -154,14 +155,14 @@ class FlashEffect:
     
     def __init__(self):
         self.flashing = False
-        self.flash_start_time = 0
+        self.flash_elapsed = 0
         self.flash_duration = 0
         self.flash_intensity = 0
     
     def trigger_flash(self, duration: int = 50, intensity: int = 100) -> None:
         """섬광 효과 시작"""
         self.flashing = True
-        self.flash_start_time = pygame.time.get_ticks()
+        self.flash_elapsed = 0
         self.flash_duration = duration
         self.flash_intensity = intensity
     
@@ -177,11 +178,11 @@ class FlashEffect:
         """큰 섬광"""
         self.trigger_flash(100, 150)
     
-    def update(self) -> None:
+    def update(self, clock: SimClock) -> None:
         """섬광 상태 업데이트"""
         if self.flashing:
-            elapsed = pygame.time.get_ticks() - self.flash_start_time
-            if elapsed >= self.flash_duration:
+            self.flash_elapsed += clock.dt
+            if self.flash_elapsed >= self.flash_duration:
                 self.flashing = False
     
     def draw(self, surface: pygame.Surface) -> None:
@@ -189,8 +190,7 @@ class FlashEffect:
         if not self.flashing:
             return
         
-        elapsed = pygame.time.get_ticks() - self.flash_start_time
-        progress = elapsed / self.flash_duration
+        progress = self.flash_elapsed / self.flash_duration
         
         alpha = int(self.flash_intensity * (1 - progress))
         
@@ -0,0 +1,131 @@
+# emitter.py
+"""
+탄막 발사기
+탄막 모양(링, 나선, 조준 부채꼴, 물결)을 딕셔너리로 선언하고,
+한 번 발사할 때 모든 탄환의 위치/속도를 배열로 계산해 탄환 컨테이너에 한 번에 넣습니다.
+(EnemyBulletGroup, BulletArray 모두 spawn_batch 지원)
+
+탄막 설정 키:
+    shape: 'ring' | 'fan' | 'aimed_fan' | 'wave'
+    count: 한 번에 쏘는 탄 수
+    spread: 부채꼴 탄 사이 각도 (fan, aimed_fan, wave)
+    spacing: 탄 사이 가로 간격 (px, 나란히 쏘는 탄)
+    speed: 탄속 (없으면 settings.ENEMY_BULLET_SPEED)
+    spin: 틱마다 회전하는 각도 (나선)
+    sway, sway_period: 물결 진폭(도)과 주기(ms)
+    cadence: 발사 간격 (ms)
+    chance: 발사 간격이 지난 틱마다 실제로 쏠 확률 (없으면 1)
+    rotate: True면 탄마다 발사 각도로 회전한 이미지 사용 (공유 회전 캐시)
+각도는 적 탄환 기준(0도 = 아래, 양수 = 오른쪽)입니다.
+"""
+import math
+import numpy as np
+import pygame
+from typing import Dict, Optional, Tuple
+import settings
+from bullet import get_enemy_bullet_image
+
+# 탄막 이름 -> 설정
+BARRAGES: Dict[str, dict] = {
+    # 보스 대기 중 정면 한 발 (발사 간격은 보스 attack_cooldown)
+    'boss_idle': {'shape': 'fan', 'count': 1},
+    # 보스 돌진 중 가끔 아래로 한 발
+    'boss_dive': {'shape': 'fan', 'count': 1, 'cadence': 200, 'chance': 0.1},
+    # 보스 나선: 3방향 링을 틱마다 5도씩 돌림
+    'boss_spiral': {'shape': 'ring', 'count': 3, 'spin': 5, 'cadence': 150},
+    # 보스 좌우 이동 중 나란히 3연발
+    'boss_strafe': {'shape': 'fan', 'count': 3, 'spread': 0, 'spacing': 15, 'cadence': 300,
+                    'chance': 0.08},
+}
+
+
+def barrage_angles(barrage: dict, angle: float) -> np.ndarray:
+    """
+    탄막 한 번에 쏘는 탄환들의 각도
+    
+    Args:
+        barrage: 탄막 설정
+        angle: 기준 각도 (링은 첫 탄, 부채꼴은 가운데)
+    
+    Returns:
+        각도 배열 (도)
+    """
+    count = barrage['count']
+    steps = np.arange(count, dtype=np.float64)
+    if barrage['shape'] == 'ring':
+        return angle + steps * (360 / count)
+    return angle + (steps - (count - 1) / 2) * barrage.get('spread', 0)
+
+
+def emit(bullets, barrage: dict, x: float, y: float, angle: float, image: pygame.Surface,
+         target: Optional[Tuple[float, float]] = None) -> int:
+    """
+    탄막 한 번 발사 (탄환 컨테이너에 한 번에 추가)
+    
+    Args:
+        bullets: spawn_batch를 지원하는 탄환 컨테이너
+        barrage: 탄막 설정
+        x, y: 발사 위치 (탄막 중심)
+        angle: 기준 각도 (Emitter.tick 결과)
+        image: 탄환 이미지
+        target: 조준 부채꼴이 겨눌 위치 (없으면 기준 각도 그대로)
+    
+    Returns:
+        발사한 탄 수
+    """
+    if barrage['shape'] == 'aimed_fan' and target is not None:
+        angle += math.degrees(math.atan2(target[0] - x, target[1] - y))
+    
+    angles = barrage_angles(barrage, angle)
+    radians = np.radians(angles)
+    if barrage.get('rotate'):
+        image = [get_enemy_bullet_image(image, bullet_angle) for bullet_angle in angles.tolist()]
+    speed = barrage.get('speed', settings.ENEMY_BULLET_SPEED)
+    count = len(radians)
+    xs = x + (np.arange(count) - (count - 1) / 2) * barrage.get('spacing', 0)
+    bullets.spawn_batch(xs, y, np.sin(radians) * speed, np.cos(radians) * speed, image)
+    return count
+
+
+class Emitter:
+    """탄막 하나의 발사 간격/회전 상태 (틱마다 한 번 진행)"""
+    
+    def __init__(self, barrage: dict, angle: float = 0):
+        """
+        발사기 초기화
+        
+        Args:
+            barrage: 탄막 설정
+            angle: 시작 기준 각도
+        """
+        self.barrage = barrage
+        self.base_angle = angle
+        self.angle = angle
+        self.cooldown = 0
+        self.elapsed = 0
+    
+    def tick(self, roll: float = 0.0, dt: float = settings.SIM_STEP_MS) -> Optional[float]:
+        """
+        한 틱 진행
+        
+        Args:
+            roll: 이번 틱 발사 판정 난수 (chance와 비교)
+            dt: 이번 틱 길이 (ms)
+        
+        Returns:
+            이번 틱에 쏠 기준 각도 (쏘지 않으면 None)
+        """
+        barrage = self.barrage
+        self.elapsed += dt
+        self.base_angle += barrage.get('spin', 0)
+        self.angle = self.base_angle
+        if 'sway' in barrage:
+            self.angle += barrage['sway'] * math.sin(
+                2 * math.pi * self.elapsed / barrage.get('sway_period', 1000))
+        
+        if self.cooldown > 0:
+            self.cooldown -= dt
+        if self.cooldown > 0 or roll >= barrage.get('chance', 1.0):
+            return None
+        self.cooldown = barrage['cadence']
+        return self.angle
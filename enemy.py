@@ -6,9 +6,16 @@
 import pygame
 import random
 import math
-from typing import Optional, Tuple, List
+import itertools
+import weakref
+from typing import Optional, Tuple, List, Dict
 import settings
-from bullet import Bullet, TractorBeam
+from bullet import TractorBeam
+from mask_cache import get_mask
+from paths import PathFollower, build_spline_table, get_path_table
+from boss_patterns import BOSS_PATTERNS, PatternCoroutine, Volley
+from emitter import BARRAGES, emit
+from sim_clock import SimClock
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -22,6 +29,15 @@ class Enemy(pygame.sprite.Sprite):
     TYPE_KAMIKAZE = 'kamikaze'
     TYPE_SPLITTER = 'splitter'
     
+    # 개체 고유 번호 (id()와 달리 객체가 사라져도 재사용되지 않음)
+    _entity_ids = itertools.count(1)
+    
+    # 타입별 공유 이미지 ((enemy_type, is_split_child) -> Surface, 프로세스당 한 번 생성)
+    _image_cache: Dict[Tuple[str, bool], pygame.Surface] = {}
+    
+    # 기본 이미지 -> 피격 시 밝게 처리한 이미지
+    _flash_cache: 'weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface]' = weakref.WeakKeyDictionary()
+    
     def __init__(self, x: int, y: int, enemy_type: str,
                  image: pygame.Surface, bullet_image: pygame.Surface,
                  is_split_child: bool = False):
@@ -37,28 +53,40 @@ class Enemy(pygame.sprite.Sprite):
             is_split_child: 분열로 생성된 자식인지 여부
         """
         super().__init__()
+        self.entity_id = next(Enemy._entity_ids)
         self.enemy_type = enemy_type
         self.bullet_image = bullet_image
         self.is_split_child = is_split_child
         
         # 타입별 이미지 생성
-        self.image = self._create_type_image(image)
+        self.base_image = self._create_type_image(image)
+        self.flash_image = self._get_flash_image(self.base_image)
+        self.flash_frames = 0
+        self.image = self.base_image
         self.rect = self.image.get_rect()
+        if settings.PRECISE_COLLISION:
+            get_mask(self.image)  # 정밀 충돌용 마스크 미리 생성
         self.rect.x = x
         self.rect.y = y
         
         # 편대 위치
         self.formation_x = x
         self.formation_y = y
+        self.formation_phase = self.entity_id % 100  # 흔들림 위상 (생성 시 한 번만 결정)
+        self.formation = None  # FormationController (등록되면 슬롯 위치를 여기서 읽음)
+        self.formation_slot = -1
         
         # 진입 경로
-        self.path: List[Tuple[float, float]] = []
-        self.path_index = 0
+        self.path: Optional[PathFollower] = None
         self.in_formation = True
         
         # 타입별 스탯 설정
         self._setup_stats()
         
+        # 시뮬레이션 시간 (update에서 받은 시계 기준)
+        self.dt = settings.SIM_STEP_MS  # 이번 스텝 길이 (ms)
+        self.now = 0.0
+        
         # 보스 전용
         self.is_boss = (enemy_type == self.TYPE_BOSS)
         self.has_captured_ship = False
@@ -66,15 +94,12 @@ class Enemy(pygame.sprite.Sprite):
         self.tractor_beam_delay = 5000
         
         # 보스 패턴 관련
-        self.boss_pattern = 'idle'
-        self.pattern_timer = 0
-        self.pattern_duration = 0
+        self.boss_pattern = 'idle'  # 진행 중인 패턴 이름
+        self.pattern: Optional[PatternCoroutine] = None
+        self.pending_shots: List[Volley] = []  # 이번 틱 패턴이 쏠 탄막 목록
         self.attack_cooldown = 0
         self.dive_target_x = 0
         self.dive_target_y = 0
-        self.dive_return = False
-        self.spiral_angle = 0
-        self.strafe_direction = 1
         
         # 카미카제 전용
         self.kamikaze_activated = False
@@ -84,26 +109,40 @@ class Enemy(pygame.sprite.Sprite):
         self.has_split = False
     
     def _create_type_image(self, base_image: pygame.Surface) -> pygame.Surface:
-        """타입별 이미지 생성"""
-        if self.enemy_type == self.TYPE_NORMAL:
-            return base_image.copy()
-        
-        elif self.enemy_type == self.TYPE_BOSS:
-            return base_image.copy()
-        
-        elif self.enemy_type == self.TYPE_FAST:
-            return self._create_fast_enemy_image()
-        
-        elif self.enemy_type == self.TYPE_TANK:
-            return self._create_tank_enemy_image()
-        
-        elif self.enemy_type == self.TYPE_KAMIKAZE:
-            return self._create_kamikaze_enemy_image()
-        
-        elif self.enemy_type == self.TYPE_SPLITTER:
-            return self._create_splitter_enemy_image()
+        """
+        타입별 이미지 반환
         
-        return base_image.copy()
+        일반/보스는 전달받은 이미지를, 나머지 타입은 처음 한 번만 그린 이미지를
+        모든 인스턴스가 공유합니다. 공유 이미지이므로 직접 수정하면 안 됩니다.
+        """
+        key = (self.enemy_type, self.is_split_child)
+        image = Enemy._image_cache.get(key)
+        if image is not None:
+            return image
+        
+        builders = {
+            self.TYPE_FAST: self._create_fast_enemy_image,
+            self.TYPE_TANK: self._create_tank_enemy_image,
+            self.TYPE_KAMIKAZE: self._create_kamikaze_enemy_image,
+            self.TYPE_SPLITTER: self._create_splitter_enemy_image,
+        }
+        builder = builders.get(self.enemy_type)
+        if builder is None:
+            return base_image
+        
+        image = builder()
+        Enemy._image_cache[key] = image
+        return image
+    
+    @classmethod
+    def _get_flash_image(cls, base_image: pygame.Surface) -> pygame.Surface:
+        """기본 이미지의 피격 효과용 밝은 이미지 반환 (기본 이미지당 한 번 생성)"""
+        bright_image = cls._flash_cache.get(base_image)
+        if bright_image is None:
+            bright_image = base_image.copy()
+            bright_image.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_ADD)
+            cls._flash_cache[base_image] = bright_image
+        return bright_image
     
     def _create_fast_enemy_image(self) -> pygame.Surface:
         """빠른 적 이미지 생성 - 날렵한 모양"""
@@ -288,108 +327,99 @@ class Enemy(pygame.sprite.Sprite):
         self.hp = self.max_hp
     
     def set_entry_path(self, path_type: str) -> None:
-        """진입 경로 설정"""
-        start_x = self.rect.x
-        start_y = -50
-        
-        if path_type == 'circle':
-            center_x = settings.SCREEN_WIDTH // 2
-            center_y = settings.SCREEN_HEIGHT // 4
-            radius = 150
-            steps = 30
-            
-            for i in range(steps):
-                angle = math.pi + (math.pi * i / steps)
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                self.path.append((x, y))
-        
-        elif path_type == 'zigzag':
-            steps = 20
-            amplitude = 100
-            
-            for i in range(steps):
-                x = start_x + amplitude * math.sin(i * 0.5)
-                y = start_y + i * 30
-                self.path.append((x, y))
-        
-        elif path_type == 'fast_dive':
-            # 빠른 적용 급강하 경로
-            steps = 10
-            for i in range(steps):
-                x = start_x + math.sin(i * 0.3) * 50
-                y = start_y + i * 50
-                self.path.append((x, y))
-        
-        else:  # straight
-            steps = 15
-            for i in range(steps):
-                x = start_x
-                y = start_y + i * 30
-                self.path.append((x, y))
-        
-        self.path.append((self.formation_x, self.formation_y))
+        """
+        진입 경로 설정 (모양별 공유 테이블 + 이 적의 시작/편대 위치)
+        
+        경로를 다 날아 편대 위치에 도착할 때까지는 편대 밖 상태입니다.
+        
+        Args:
+            path_type: paths.PATH_SHAPES의 경로 이름
+                ('circle', 'zigzag', 'fast_dive', 'straight', 'swoop_left', 'swoop_right', 'loop')
+        """
+        formation_center = (self.formation_x + self.rect.width // 2,
+                            self.formation_y + self.rect.height // 2)
+        self.path = PathFollower(get_path_table(path_type), self.rect.center,
+                                 (self.rect.x, -50), formation_center)
+        self.in_formation = False
     
     def set_player_reference(self, player) -> None:
         """플레이어 참조 설정 (카미카제용)"""
         self.target_player = player
     
-    def update(self) -> None:
-        """적 상태 업데이트"""
+    def update(self, roll: Optional[float] = None, clock: Optional[SimClock] = None) -> None:
+        """
+        적 상태 업데이트
+        
+        Args:
+            roll: 돌진/패턴 시작 판정 난수 (None이면 직접 뽑음)
+            clock: 시뮬레이션 시계 (None이면 고정 스텝 하나만큼 진행)
+        """
+        if clock is None:
+            self.dt = settings.SIM_STEP_MS
+            self.now += self.dt
+        else:
+            self.dt = clock.dt
+            self.now = clock.now
+        
+        # 피격 효과가 끝나면 기본 이미지로 복귀
+        if self.flash_frames > 0:
+            self.flash_frames -= 1
+            if self.flash_frames == 0:
+                self.image = self.base_image
+        
         if not self.in_formation:
             self._follow_entry_path()
         else:
             if self.is_boss:
-                self._update_boss_pattern()
+                self._update_boss_pattern(roll)
             elif self.enemy_type == self.TYPE_KAMIKAZE:
-                self._update_kamikaze()
+                self._update_kamikaze(roll)
             else:
                 self._idle_movement()
         
         # 쿨다운 감소
         if self.tractor_beam_cooldown > 0:
-            self.tractor_beam_cooldown -= 16
+            self.tractor_beam_cooldown -= self.dt
         if self.attack_cooldown > 0:
-            self.attack_cooldown -= 16
+            self.attack_cooldown -= self.dt
     
     def _follow_entry_path(self) -> None:
-        """진입 경로를 따라 이동"""
-        if self.path_index < len(self.path):
-            target_x, target_y = self.path[self.path_index]
-            
-            dx = target_x - self.rect.centerx
-            dy = target_y - self.rect.centery
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance < 5:
-                self.path_index += 1
-            else:
-                move_speed = self.speed
-                if self.enemy_type == self.TYPE_FAST:
-                    move_speed = self.speed * 1.5
-                
-                self.rect.x += (dx / distance) * move_speed
-                self.rect.y += (dy / distance) * move_speed
-        else:
-            self.in_formation = True
+        """진입 경로를 따라 이동 (경로상 이동 거리만 증가)"""
+        if self.path is not None:
+            move_speed = self.speed * settings.ENEMY_ENTRY_SPEED_SCALE
+            if self.enemy_type == self.TYPE_FAST:
+                move_speed *= 1.5
             
-            # 카미카제는 편대 도착 후 바로 돌진 모드
-            if self.enemy_type == self.TYPE_KAMIKAZE:
-                self.kamikaze_activated = True
+            x, y, arrived = self.path.advance(move_speed)
+            self.rect.center = (int(x), int(y))
+            if not arrived:
+                return
+            self.path = None
+        
+        self.in_formation = True
+        
+        # 카미카제는 편대 도착 후 바로 돌진 모드
+        if self.enemy_type == self.TYPE_KAMIKAZE:
+            self.kamikaze_activated = True
     
     def _idle_movement(self) -> None:
-        """편대에서 대기 시 흔들림"""
-        offset = math.sin(pygame.time.get_ticks() * 0.002 + hash(id(self)) % 100) * 2
+        """편대에서 대기 시 흔들림 (편대에 등록되어 있으면 프레임마다 계산된 슬롯 위치 사용)"""
+        if self.formation is not None:
+            self.rect.x = self.formation.xs[self.formation_slot]
+            self.rect.y = self.formation.ys[self.formation_slot]
+            return
+        
+        offset = math.sin(self.now * 0.002 + self.formation_phase) * 2
         self.rect.x = int(self.formation_x + offset)
         self.rect.y = int(self.formation_y)
     
-    def _update_kamikaze(self) -> None:
+    def _update_kamikaze(self, roll: Optional[float] = None) -> None:
         """카미카제 적 업데이트"""
         if not self.kamikaze_activated:
             self._idle_movement()
             
             # 랜덤하게 돌진 시작
-            if random.random() < 0.008:
+            if (random.random() if roll is None else roll) < 0.008:
                 self.kamikaze_activated = True
             return
         
@@ -412,177 +442,126 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.top > settings.SCREEN_HEIGHT:
             self.kill()
     
-    def _update_boss_pattern(self) -> None:
-        """보스 패턴 업데이트"""
-        if self.boss_pattern == 'idle':
-            self._idle_movement()
-            
-            if random.random() < 0.005:
-                self._start_random_pattern()
-        
-        elif self.boss_pattern == 'dive':
-            self._execute_dive_pattern()
-        
-        elif self.boss_pattern == 'spiral':
-            self._execute_spiral_pattern()
-        
-        elif self.boss_pattern == 'strafe':
-            self._execute_strafe_pattern()
-        
-        if self.pattern_duration > 0:
-            self.pattern_duration -= 16
-            if self.pattern_duration <= 0:
+    def _update_boss_pattern(self, roll: Optional[float] = None) -> None:
+        """보스 패턴 업데이트 (진행 중인 패턴 코루틴을 한 틱 진행)"""
+        if roll is None:
+            roll = random.random()
+        
+        if self.pattern is not None:
+            try:
+                self.pending_shots = self.pattern.send(roll)
+                return
+            except StopIteration:
                 self._return_to_formation()
-    
-    def _start_random_pattern(self) -> None:
-        """랜덤 공격 패턴 시작"""
-        pattern = random.choice(['dive', 'spiral', 'strafe'])
-        
-        if pattern == 'dive':
-            self.boss_pattern = 'dive'
-            self.dive_target_x = random.randint(100, settings.SCREEN_WIDTH - 100)
-            self.dive_target_y = settings.SCREEN_HEIGHT - 150
-            self.dive_return = False
-            self.pattern_duration = 5000
-        
-        elif pattern == 'spiral':
-            self.boss_pattern = 'spiral'
-            self.spiral_angle = 0
-            self.pattern_duration = 3000
-        
-        elif pattern == 'strafe':
-            self.boss_pattern = 'strafe'
-            self.pattern_duration = 4000
-            self.strafe_direction = 1 if random.random() > 0.5 else -1
-    
-    def _execute_dive_pattern(self) -> None:
-        """돌진 패턴"""
-        if not self.dive_return:
-            dx = self.dive_target_x - self.rect.centerx
-            dy = self.dive_target_y - self.rect.centery
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance < 10:
-                self.dive_return = True
-            else:
-                speed = self.speed * 2.5
-                self.rect.x += (dx / distance) * speed
-                self.rect.y += (dy / distance) * speed
-        else:
-            dx = self.formation_x - self.rect.centerx
-            dy = self.formation_y - self.rect.centery
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance < 10:
-                self.boss_pattern = 'idle'
-                self.rect.centerx = self.formation_x
-                self.rect.centery = self.formation_y
-            else:
-                speed = self.speed * 2
-                self.rect.x += (dx / distance) * speed
-                self.rect.y += (dy / distance) * speed
-    
-    def _execute_spiral_pattern(self) -> None:
-        """나선형 패턴"""
-        self.spiral_angle += 5
-        
-        offset_x = math.cos(math.radians(self.spiral_angle)) * 30
-        offset_y = math.sin(math.radians(self.spiral_angle * 0.5)) * 20
         
-        self.rect.centerx = self.formation_x + offset_x
-        self.rect.centery = self.formation_y + offset_y
+        self._idle_movement()
+        if roll < 0.005:
+            # 판정을 통과한 난수는 [0, 0.005)에 고르게 퍼져 있으므로 늘려서 패턴 선택에 재사용
+            self._start_random_pattern(roll / 0.005)
     
-    def _execute_strafe_pattern(self) -> None:
-        """좌우 이동 패턴"""
-        self.rect.x += self.speed * 2 * self.strafe_direction
+    def _start_random_pattern(self, roll: Optional[float] = None) -> None:
+        """
+        랜덤 공격 패턴 시작
         
-        if self.rect.left < 50:
-            self.strafe_direction = 1
-        elif self.rect.right > settings.SCREEN_WIDTH - 50:
-            self.strafe_direction = -1
+        Args:
+            roll: 0~1 난수 (None이면 직접 뽑음). 등록된 패턴 수로 나눈 구간으로 패턴을, 구간 안 위치로 패턴 세부값을 정함
+        """
+        if roll is None:
+            roll = random.random()
+        names = list(BOSS_PATTERNS)
+        index = min(int(roll * len(names)), len(names) - 1)
+        self.start_pattern(names[index], roll * len(names) - index)
+    
+    def start_pattern(self, name: str, detail: float = 0.5) -> None:
+        """
+        공격 패턴 시작
         
-        self.rect.centery = self.formation_y
+        Args:
+            name: BOSS_PATTERNS에 등록된 패턴 이름
+            detail: 패턴에 넘기는 0~1 난수 (돌진 목표, 이동 방향 등)
+        """
+        self.boss_pattern = name
+        self.pattern = BOSS_PATTERNS[name](self, detail)
+        self.pending_shots = next(self.pattern)
+    
+    def _create_dive_path(self) -> PathFollower:
+        """편대에서 옆으로 빠졌다가 목표 지점으로 휘어 내려가는 스플라인 경로"""
+        start_x, start_y = self.rect.center
+        side = 1 if self.dive_target_x >= start_x else -1
+        table = build_spline_table([
+            (start_x, start_y),
+            (start_x - side * 60, start_y + 40),
+            (start_x + (self.dive_target_x - start_x) * 0.3, start_y + 160),
+            (self.dive_target_x, self.dive_target_y),
+        ])
+        return PathFollower(table, (start_x, start_y), (0, 0),
+                            (self.dive_target_x, self.dive_target_y))
+    
+    def _create_return_path(self) -> PathFollower:
+        """돌진 지점에서 크게 돌아 편대 위치로 올라가는 스플라인 경로"""
+        start_x, start_y = self.rect.center
+        end = (self.formation_x + self.rect.width // 2, self.formation_y + self.rect.height // 2)
+        side = 1 if end[0] >= start_x else -1
+        table = build_spline_table([
+            (start_x, start_y),
+            (start_x - side * 80, start_y - 100),
+            ((start_x + end[0]) / 2, (start_y + end[1]) / 2),
+            end,
+        ])
+        return PathFollower(table, (start_x, start_y), (0, 0), end)
     
     def _return_to_formation(self) -> None:
         """편대 복귀"""
         self.boss_pattern = 'idle'
+        self.pattern = None
+        self.pending_shots = []
     
-    def shoot(self, bullets_group: pygame.sprite.Group) -> None:
-        """탄환 발사"""
+    def shoot(self, bullets_group: pygame.sprite.Group, roll: Optional[float] = None) -> None:
+        """
+        탄환 발사
+        
+        Args:
+            bullets_group: 적 탄환 그룹
+            roll: 이번 프레임 발사 판정 난수 (None이면 직접 뽑음)
+        """
         if not self.in_formation and self.boss_pattern == 'idle':
             return
         
         if self.enemy_type == self.TYPE_KAMIKAZE:
             return  # 카미카제는 발사 안함
         
+        if roll is None:
+            roll = random.random()
+        
         if self.is_boss:
-            self._boss_shoot(bullets_group)
+            self._boss_shoot(bullets_group, roll)
         else:
-            if random.random() < self.fire_chance:
-                bullet = Bullet(
-                    self.rect.centerx,
-                    self.rect.bottom,
-                    'enemy',
-                    self.bullet_image
-                )
-                bullets_group.add(bullet)
-    
-    def _boss_shoot(self, bullets_group: pygame.sprite.Group) -> None:
-        """보스 특수 공격"""
+            if roll < self.fire_chance:
+                # 난이도에 따라 부채꼴로 여러 발 (기본 1발은 정면), 탄환 컨테이너에 한 번에 추가
+                barrage = {'shape': 'fan', 'count': settings.ENEMY_SHOT_COUNT,
+                           'spread': settings.ENEMY_SHOT_SPREAD, 'rotate': True}
+                emit(bullets_group, barrage, self.rect.centerx, self.rect.bottom, 0, self.bullet_image)
+    
+    def _boss_shoot(self, bullets_group: pygame.sprite.Group, roll: float) -> None:
+        """보스 특수 공격 (패턴 중에는 패턴 코루틴이 이번 틱에 내놓은 탄막 발사)"""
+        if self.pattern is not None:
+            target = self.target_player.rect.center if self.target_player else None
+            for barrage, x, y, angle in self.pending_shots:
+                emit(bullets_group, barrage, x, y, angle, self.bullet_image, target)
+            self.pending_shots = []
+            return
+        
         if self.attack_cooldown > 0:
             return
         
-        if self.boss_pattern == 'idle':
-            if random.random() < self.fire_chance * 2:
-                bullet = Bullet(
-                    self.rect.centerx,
-                    self.rect.bottom,
-                    'enemy',
-                    self.bullet_image
-                )
-                bullets_group.add(bullet)
-                self.attack_cooldown = 500
-        
-        elif self.boss_pattern == 'dive':
-            if random.random() < 0.1:
-                bullet = Bullet(
-                    self.rect.centerx,
-                    self.rect.bottom,
-                    'enemy',
-                    self.bullet_image
-                )
-                bullets_group.add(bullet)
-                self.attack_cooldown = 200
-        
-        elif self.boss_pattern == 'spiral':
-            if self.attack_cooldown <= 0:
-                for i in range(3):
-                    angle = self.spiral_angle + i * 120
-                    bullet = Bullet(
-                        self.rect.centerx,
-                        self.rect.centery,
-                        'enemy',
-                        self.bullet_image,
-                        angle=angle
-                    )
-                    bullets_group.add(bullet)
-                self.attack_cooldown = 150
-        
-        elif self.boss_pattern == 'strafe':
-            if random.random() < 0.08:
-                for dx in [-15, 0, 15]:
-                    bullet = Bullet(
-                        self.rect.centerx + dx,
-                        self.rect.bottom,
-                        'enemy',
-                        self.bullet_image
-                    )
-                    bullets_group.add(bullet)
-                self.attack_cooldown = 300
+        if roll < self.fire_chance * 2:
+            emit(bullets_group, BARRAGES['boss_idle'], self.rect.centerx, self.rect.bottom, 0,
+                 self.bullet_image)
+            self.attack_cooldown = 500
     
     def shoot_tractor_beam(self, beams_group: pygame.sprite.Group,
-                          beam_image: pygame.Surface) -> bool:
-        """트랙터 빔 발사"""
+                          beam_image: pygame.Surface, roll: Optional[float] = None) -> bool:
+        """트랙터 빔 발사 (roll: 이번 프레임 발사 판정 난수, None이면 직접 뽑음)"""
         if not self.is_boss or not self.in_formation:
             return False
         
@@ -592,7 +571,7 @@ class Enemy(pygame.sprite.Sprite):
         if self.tractor_beam_cooldown > 0:
             return False
         
-        if random.random() > 0.002:
+        if (random.random() if roll is None else roll) > 0.002:
             return False
         
         beam = TractorBeam(
@@ -623,11 +602,15 @@ class Enemy(pygame.sprite.Sprite):
         return False
     
     def _flash_effect(self) -> None:
-        """피격 시 깜빡임 효과"""
-        # 임시로 밝게
-        bright_image = self.image.copy()
-        bright_image.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_ADD)
-        self.image = bright_image
+        """피격 시 깜빡임 효과 (미리 만든 밝은 이미지로 교체)"""
+        self.image = self.flash_image
+        self.flash_frames = settings.ENEMY_HIT_FLASH_FRAMES
+    
+    def kill(self) -> None:
+        """모든 그룹에서 제거하고 편대 슬롯 반납"""
+        if self.formation is not None:
+            self.formation.release(self)
+        super().kill()
     
     def can_split(self) -> bool:
         """분열 가능 여부"""
@@ -648,13 +631,18 @@ class Enemy(pygame.sprite.Sprite):
                 self.rect.centerx + offset,
                 self.rect.centery,
                 self.TYPE_SPLITTER,
-                self.image,
+                self.base_image,
                 self.bullet_image,
                 is_split_child=True
             )
             child.in_formation = True
             child.formation_x = self.formation_x + offset
             child.formation_y = self.formation_y
+            if self.formation is not None:
+                # 부모 바로 옆 빈 슬롯 차지 (주변이 차 있으면 위 위치에 추가 슬롯)
+                columns = self.formation.columns or 1
+                self.formation.claim_near(child, self.formation_slot // columns,
+                                          self.formation_slot % columns + (1 if offset > 0 else -1))
             children.append(child)
         
         return children
@@ -0,0 +1,109 @@
+# enemy_ai.py
+"""
+적 AI 판정
+매 프레임 이번 차례인 적의 난수를 한 번에 뽑아 (판정 종류 × 적 수) 행렬로 나눠 주고,
+발사 확률 배열과 비교해 이번 프레임 발사할 적을 한 번에 골라냅니다.
+시드를 주면 같은 난수 흐름이 재현됩니다.
+
+발사/돌진/패턴 선택 같은 판정은 적 종류별로 N프레임에 한 번만 하고(settings.ENEMY_AI_SLICES),
+그 대신 돌진/패턴/빔 판정은 난수를 N프레임 중 가장 작은 값의 분포(1-(1-u)^(1/N))로 바꿔서
+1-(1-p)^N, 즉 N프레임 안에 한 번 이상 일어날 확률로 보정합니다.
+발사는 쿨다운 없이 프레임마다 p발씩 쏘던 비율을 지켜야 하므로 난수를 N으로 나눠
+u < min(1, N·p)로 판정되게 합니다 (N프레임 동안 기대 발사 수 N·p 유지).
+"""
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+import settings
+from enemy import Enemy
+
+# 난수 행렬 열 (판정 종류)
+ROLL_MOVE = 0  # 카미카제 돌진 시작 / 보스 패턴 시작
+ROLL_FIRE = 1  # 탄환 발사
+ROLL_BEAM = 2  # 트랙터 빔 발사
+ROLL_COUNT = 3
+
+# 판정 차례가 아닌 적에게 주는 난수 (어떤 확률 비교도 통과하지 않음)
+ROLL_SKIP = 1.0
+
+
+class EnemyAI:
+    """프레임 단위 적 AI 난수 판정과 시분할 스케줄링"""
+    
+    def __init__(self, seed: Optional[int] = settings.ENEMY_AI_SEED,
+                 slices: Optional[Dict[str, int]] = None):
+        """
+        AI 판정기 초기화
+        
+        Args:
+            seed: 난수 시드 (None이면 매번 다른 흐름)
+            slices: 적 종류별 판정 주기 (None이면 settings.ENEMY_AI_SLICES, 없는 종류는 매 프레임)
+        """
+        self.rng = np.random.default_rng(seed)
+        self.slices = settings.ENEMY_AI_SLICES if slices is None else slices
+        self.frame = 0
+        self.updates = 0  # 이번 프레임 AI 판정을 한 적 수
+        
+        self.enemies: List[Enemy] = []
+        self.fire_chances = np.zeros(0)
+        self.periods = np.ones(0, dtype=np.int64)
+        self.offsets = np.zeros(0, dtype=np.int64)
+        self.bosses: List[int] = []
+    
+    @staticmethod
+    def fire_chance(enemy: Enemy) -> float:
+        """
+        적 한 기의 발사 후보 확률
+        
+        보스는 패턴마다 확률이 달라 항상 후보로 두고 shoot에서 같은 난수로 다시 판정합니다.
+        """
+        if enemy.enemy_type == Enemy.TYPE_KAMIKAZE:
+            return 0.0
+        if enemy.is_boss:
+            return 1.0
+        return enemy.fire_chance
+    
+    def _sync(self, enemies: List[Enemy]) -> None:
+        """적 구성이 바뀌었을 때만 발사 확률/판정 주기 배열 재구성"""
+        if enemies == self.enemies:
+            return
+        self.enemies = enemies
+        count = len(enemies)
+        self.fire_chances = np.fromiter((self.fire_chance(enemy) for enemy in enemies),
+                                        dtype=np.float64, count=count)
+        self.periods = np.fromiter((max(1, self.slices.get(enemy.enemy_type, 1)) for enemy in enemies),
+                                   dtype=np.int64, count=count)
+        # 개체 번호로 차례를 나눠 같은 종류도 프레임마다 고르게 분산
+        self.offsets = np.fromiter((enemy.entity_id for enemy in enemies),
+                                   dtype=np.int64, count=count) % self.periods
+        self.bosses = [i for i, enemy in enumerate(enemies) if enemy.is_boss]
+    
+    def decide(self, enemies) -> Tuple[List[Enemy], List[List[float]], List[int]]:
+        """
+        이번 프레임 판정 차례인 적의 난수와 발사 후보 계산
+        
+        Args:
+            enemies: 적 그룹
+        
+        Returns:
+            (적 목록, 판정 종류별 난수 목록 rolls[ROLL_*][적 인덱스], 발사 후보 인덱스).
+            차례가 아닌 적의 난수는 ROLL_SKIP
+        """
+        self._sync(enemies.sprites())
+        periods = self.periods.copy()
+        
+        # 공격 패턴 중인 보스는 발사 간격이 중요하므로 매 프레임 판정
+        for index in self.bosses:
+            if self.enemies[index].boss_pattern != 'idle':
+                periods[index] = 1
+        
+        due = np.flatnonzero((self.frame - self.offsets) % periods == 0)
+        self.frame += 1
+        self.updates = len(due)
+        
+        rolls = np.full((ROLL_COUNT, len(self.enemies)), ROLL_SKIP)
+        drawn = self.rng.random((ROLL_COUNT, len(due)))
+        rolls[:, due] = 1 - (1 - drawn) ** (1.0 / periods[due])
+        rolls[ROLL_FIRE, due] = drawn[ROLL_FIRE] / periods[due]
+        
+        shooters = np.flatnonzero(rolls[ROLL_FIRE] < self.fire_chances)
+        return self.enemies, rolls.tolist(), shooters.tolist()
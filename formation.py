@@ -0,0 +1,196 @@
+# formation.py
+"""
+편대 관리
+웨이브의 행 × 열 격자를 슬롯 점유 비트맵과 슬롯별 적 참조로 유지합니다.
+생존 수, 행/열별 수, 빈 슬롯 찾기를 O(1)로 답하고,
+슬롯 위치를 배열로 들고 있다가 매 프레임 한 번에 흔들림(과 숨쉬기) 위치를 계산합니다.
+적은 자기 슬롯 위치만 읽어 갑니다.
+"""
+import math
+import numpy as np
+from typing import List, Optional, Tuple
+import settings
+
+
+class FormationController:
+    """편대 격자 슬롯 점유 관리와 슬롯 위치 일괄 계산"""
+    
+    def __init__(self, rows: int = 0, columns: int = 0,
+                 origin: Tuple[int, int] = (0, 0), spacing: Tuple[int, int] = (0, 0),
+                 breathing: bool = settings.FORMATION_BREATHING):
+        """
+        편대 초기화
+        
+        Args:
+            rows: 격자 행 수
+            columns: 격자 열 수
+            origin: (0, 0) 슬롯의 편대 위치 (적 좌상단)
+            spacing: 슬롯 사이 간격 (x, y)
+            breathing: True면 편대 중심 기준으로 주기적으로 벌어졌다 모이는 숨쉬기 동작 추가
+        """
+        self.rows = rows
+        self.columns = columns
+        self.breathing = breathing
+        
+        # 슬롯 번호 = row * columns + column, 격자 뒤에는 격자가 가득 찼을 때 쓰는 추가 슬롯
+        self.grid_size = rows * columns
+        self.grid_mask = (1 << self.grid_size) - 1
+        self.row_mask = (1 << columns) - 1
+        self.occupied = 0  # 슬롯 점유 비트맵 (비트 i = 슬롯 i)
+        self.entities: List[Optional[object]] = [None] * self.grid_size
+        self.alive_count = 0
+        self.row_counts = [0] * rows
+        self.column_counts = [0] * columns
+        
+        # 슬롯별 기준 위치와 흔들림 위상
+        self.slot_x = [origin[0] + (slot % columns) * spacing[0] for slot in range(self.grid_size)]
+        self.slot_y = [origin[1] + (slot // columns) * spacing[1] for slot in range(self.grid_size)]
+        self.base_x = np.array(self.slot_x, dtype=np.float64)
+        self.base_y = np.array(self.slot_y, dtype=np.float64)
+        self.phases = np.zeros(self.grid_size)
+        self._update_center()
+        
+        # 이번 프레임 슬롯 좌상단 (정수 리스트, update 전에는 기준 위치)
+        self.xs: List[int] = list(self.slot_x)
+        self.ys: List[int] = list(self.slot_y)
+    
+    def __len__(self) -> int:
+        """전체 슬롯 수 (추가 슬롯 포함)"""
+        return len(self.entities)
+    
+    def _update_center(self) -> None:
+        """숨쉬기 기준이 되는 편대 중심 계산"""
+        if len(self.base_x) == 0:
+            self.center_x = self.center_y = 0.0
+            return
+        self.center_x = (self.base_x.min() + self.base_x.max()) / 2
+        self.center_y = (self.base_y.min() + self.base_y.max()) / 2
+    
+    def _occupy(self, enemy, slot: int) -> int:
+        """슬롯에 적 배치 (편대 위치를 슬롯 위치로 맞춤)"""
+        self.entities[slot] = enemy
+        self.occupied |= 1 << slot
+        self.alive_count += 1
+        if slot < self.grid_size:
+            self.row_counts[slot // self.columns] += 1
+            self.column_counts[slot % self.columns] += 1
+        
+        self.phases[slot] = enemy.formation_phase
+        enemy.formation_x = self.slot_x[slot]
+        enemy.formation_y = self.slot_y[slot]
+        enemy.formation = self
+        enemy.formation_slot = slot
+        return slot
+    
+    def place(self, enemy, row: int, column: int) -> int:
+        """
+        격자 슬롯에 적 배치
+        
+        Returns:
+            슬롯 번호
+        """
+        return self._occupy(enemy, row * self.columns + column)
+    
+    def add(self, enemy) -> int:
+        """
+        적의 현재 편대 위치(formation_x/y)에 격자 밖 추가 슬롯을 만들어 배치
+        
+        Returns:
+            슬롯 번호
+        """
+        slot = len(self.entities)
+        self.entities.append(None)
+        self.slot_x.append(enemy.formation_x)
+        self.slot_y.append(enemy.formation_y)
+        self.xs.append(int(enemy.formation_x))
+        self.ys.append(int(enemy.formation_y))
+        self.base_x = np.append(self.base_x, float(enemy.formation_x))
+        self.base_y = np.append(self.base_y, float(enemy.formation_y))
+        self.phases = np.append(self.phases, 0.0)
+        self._update_center()
+        return self._occupy(enemy, slot)
+    
+    def claim_near(self, enemy, row: int, column: int, reach: int = 1) -> int:
+        """
+        (row, column) 가까이의 빈 슬롯 차지 (분열 자식용)
+        
+        같은 행에서 column으로부터 reach칸 이내만 가까운 순으로 찾고,
+        없으면 멀리 떨어진 슬롯으로 순간이동하지 않도록 적의 현재 편대 위치에 추가 슬롯을 만듭니다.
+        
+        Returns:
+            슬롯 번호
+        """
+        if 0 <= row < self.rows:
+            for distance in range(reach + 1):
+                for col in ((column - distance, column + distance) if distance else (column,)):
+                    if 0 <= col < self.columns and self.is_free(row, col):
+                        return self.place(enemy, row, col)
+        return self.add(enemy)
+    
+    def release(self, enemy) -> None:
+        """적이 차지한 슬롯 비우기 (이미 비었으면 무시)"""
+        slot = enemy.formation_slot
+        if not 0 <= slot < len(self.entities) or self.entities[slot] is not enemy:
+            return
+        
+        self.entities[slot] = None
+        self.occupied &= ~(1 << slot)
+        self.alive_count -= 1
+        if slot < self.grid_size:
+            self.row_counts[slot // self.columns] -= 1
+            self.column_counts[slot % self.columns] -= 1
+    
+    def is_free(self, row: int, column: int) -> bool:
+        """격자 슬롯이 비어 있는지"""
+        return not (self.occupied >> (row * self.columns + column)) & 1
+    
+    def enemy_at(self, row: int, column: int):
+        """격자 슬롯을 차지한 적 (없으면 None)"""
+        return self.entities[row * self.columns + column]
+    
+    def row_count(self, row: int) -> int:
+        """행의 생존 적 수"""
+        return self.row_counts[row]
+    
+    def column_count(self, column: int) -> int:
+        """열의 생존 적 수"""
+        return self.column_counts[column]
+    
+    def free_slot(self, row: Optional[int] = None) -> Optional[int]:
+        """
+        번호가 가장 작은 빈 격자 슬롯
+        
+        Args:
+            row: 지정하면 해당 행에서만 찾음
+        
+        Returns:
+            슬롯 번호 (없으면 None)
+        """
+        free = ~self.occupied & self.grid_mask
+        if row is not None:
+            free &= self.row_mask << (row * self.columns)
+        if not free:
+            return None
+        return (free & -free).bit_length() - 1
+    
+    def update(self, ticks: int) -> None:
+        """
+        모든 슬롯 위치 계산 (프레임당 한 번)
+        
+        Args:
+            ticks: 현재 시각 (ms)
+        """
+        if len(self.base_x) == 0:
+            return
+        
+        x = self.base_x
+        y = self.base_y
+        if self.breathing:
+            scale = settings.FORMATION_BREATH_AMPLITUDE * math.sin(
+                ticks * 2 * math.pi / settings.FORMATION_BREATH_PERIOD)
+            x = x + (x - self.center_x) * scale
+            y = y + (y - self.center_y) * scale
+        
+        offsets = np.sin(ticks * 0.002 + self.phases) * 2
+        self.xs = (x + offsets).astype(np.int64).tolist()
+        self.ys = y.astype(np.int64).tolist()
@@ -0,0 +1,66 @@
+# interpolation.py
+"""
+렌더 보간
+고정 스텝 시뮬레이션 사이에 그리는 프레임에서 스프라이트를 직전 스텝과 현재 스텝 사이 위치에 그립니다.
+스텝 직전에 rect 위치를 기록해 두었다가, 그리는 동안만 rect를 보간 위치로 옮기고 다시 되돌립니다.
+(게임 로직이 보는 위치는 바뀌지 않음)
+탄환은 그룹이 직전 위치(prev_float_x/y, 속도)를 이미 들고 있으므로 그룹 draw(surface, alpha)에서 보간합니다.
+"""
+import pygame
+from typing import Dict, Iterable, List, Tuple
+import settings
+
+
+class RenderInterpolator:
+    """스텝 직전 스프라이트 위치 기록과 그리기용 위치 보간"""
+    
+    def __init__(self, snap_distance: int = settings.RENDER_SNAP_DISTANCE):
+        """
+        보간기 초기화
+        
+        Args:
+            snap_distance: 한 스텝에 이보다 많이(x + y) 움직였으면 순간이동으로 보고 보간하지 않음
+        """
+        self.snap_distance = snap_distance
+        self.previous: Dict[pygame.sprite.Sprite, Tuple[int, int]] = {}
+        self.moved: List[Tuple[pygame.sprite.Sprite, Tuple[int, int]]] = []
+    
+    def snapshot(self, groups: Iterable[Iterable[pygame.sprite.Sprite]]) -> None:
+        """
+        시뮬레이션 스텝 직전 위치 기록 (렌더 프레임의 마지막 스텝 전에 한 번)
+        
+        Args:
+            groups: 보간할 스프라이트 묶음 목록
+        """
+        self.previous = {sprite: sprite.rect.topleft for group in groups for sprite in group}
+    
+    def apply(self, alpha: float, groups: Iterable[Iterable[pygame.sprite.Sprite]]) -> None:
+        """
+        스프라이트 rect를 직전 위치와 현재 위치 사이로 옮김 (restore 전까지)
+        
+        Args:
+            alpha: 보간 비율 (0이면 직전 스텝, 1이면 현재 스텝)
+            groups: 보간할 스프라이트 묶음 목록
+        """
+        self.restore()
+        if alpha >= 1.0:
+            return
+        
+        previous = self.previous
+        for group in groups:
+            for sprite in group:
+                start = previous.get(sprite)
+                if start is None:
+                    continue  # 마지막 스텝에 새로 생긴 스프라이트
+                x, y = sprite.rect.topleft
+                dx = x - start[0]
+                dy = y - start[1]
+                if (dx or dy) and abs(dx) + abs(dy) <= self.snap_distance:
+                    self.moved.append((sprite, (x, y)))
+                    sprite.rect.topleft = (round(start[0] + dx * alpha), round(start[1] + dy * alpha))
+    
+    def restore(self) -> None:
+        """apply로 옮긴 rect를 현재 스텝 위치로 되돌림"""
+        for sprite, position in self.moved:
+            sprite.rect.topleft = position
+        self.moved = []
@@ -4,19 +4,23 @@ Galaga Clone - 메인 게임 루프
 """
 import pygame
 import sys
-import math
 from typing import Optional
 import settings
 from assets_loader import AssetsLoader
 from player import Player
 from enemy import Enemy
-from bullet import Bullet, TractorBeam
+from enemy_ai import EnemyAI, ROLL_MOVE, ROLL_FIRE, ROLL_BEAM
+from bullet import Bullet, TractorBeam, PlayerBulletGroup, EnemyBulletGroup, warm_bullet_images
+from bullet_engine import BulletArray
 from wave_manager import WaveManager
 from collision import *
+from broadphase import SpatialHash
 from ui import UI
 from effects import Explosion, EngineFlame, ScreenShake, FlashEffect
 from powerup import PowerUp, PowerUpManager
 from background import ScrollingBackground
+from sim_clock import SimClock
+from interpolation import RenderInterpolator
 
 
 class ComboSystem:
@@ -24,13 +28,14 @@ class ComboSystem:
     
     def __init__(self):
         self.combo_count = 0
-        self.combo_timer = 0
+        self.combo_timer = 0  # 마지막 처치 시각 (시뮬레이션 시각)
         self.combo_timeout = 2000
+        self.now = 0.0  # 마지막 update에서 받은 시뮬레이션 시각
         self.max_combo = 0
         self.total_combo_bonus = 0
     
     def add_kill(self) -> float:
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         if current_time - self.combo_timer < self.combo_timeout:
             self.combo_count += 1
         else:
@@ -54,8 +59,8 @@ class ComboSystem:
         else:
             return 5.0
     
-    def update(self) -> None:
-        current_time = pygame.time.get_ticks()
+    def update(self, clock: SimClock) -> None:
+        self.now = current_time = clock.now
         if self.combo_count > 0 and current_time - self.combo_timer >= self.combo_timeout:
             self.combo_count = 0
     
@@ -76,26 +81,24 @@ class NuclearBomb:
         self.x = x
         self.y = y
         self.active = True
-        self.start_time = pygame.time.get_ticks()
+        self.elapsed = 0  # 발동 후 지난 시뮬레이션 시간 (ms)
         self.duration = 1000
         self.max_radius = 800
     
-    def update(self) -> None:
-        elapsed = pygame.time.get_ticks() - self.start_time
-        if elapsed >= self.duration:
+    def update(self, clock: SimClock) -> None:
+        self.elapsed += clock.dt
+        if self.elapsed >= self.duration:
             self.active = False
     
     def get_current_radius(self) -> int:
-        elapsed = pygame.time.get_ticks() - self.start_time
-        progress = elapsed / self.duration
+        progress = self.elapsed / self.duration
         return int(self.max_radius * progress)
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.active:
             return
         radius = self.get_current_radius()
-        elapsed = pygame.time.get_ticks() - self.start_time
-        progress = elapsed / self.duration
+        progress = self.elapsed / self.duration
         for i in range(3):
             r = radius - i * 50
             if r > 0:
@@ -117,7 +120,10 @@ class Game:
         self.game_surface = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
         pygame.display.set_caption(settings.TITLE)
         self.clock = pygame.time.Clock()
+        self.sim_clock = SimClock()  # 게임 로직 시간 (모든 update에 전달)
+        self.interpolator = RenderInterpolator()
         self.assets = AssetsLoader()
+        warm_bullet_images(self.assets.get_image('enemy_bullet'))
         self.ui = UI()
         self.background = ScrollingBackground()
         self.screen_shake = ScreenShake()
@@ -127,7 +133,8 @@ class Game:
         self.state = settings.STATE_MENU
         self.running = True
         self.selected_difficulty = 1
-        self.difficulty_names = [settings.DIFFICULTY_EASY, settings.DIFFICULTY_NORMAL, settings.DIFFICULTY_HARD]
+        self.difficulty_names = [settings.DIFFICULTY_EASY, settings.DIFFICULTY_NORMAL, settings.DIFFICULTY_HARD,
+                                 settings.DIFFICULTY_BULLET_HELL]
         self.score = 0
         self.high_score = self.load_high_score()
         self.high_score = self.load_high_score()
@@ -137,10 +144,13 @@ class Game:
         self.new_rank = -1
         self.all_sprites = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
+        self.player_bullets = PlayerBulletGroup()
+        self.enemy_bullets = EnemyBulletGroup()
         self.tractor_beams = pygame.sprite.Group()
         self.explosions = pygame.sprite.Group()
         self.powerups = pygame.sprite.Group()
+        self.enemy_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+        self.enemy_ai = EnemyAI()
         self.player = None
         self.powerup_manager = PowerUpManager()
         self.powerup_message = ""
@@ -221,6 +231,7 @@ class Game:
         settings.ENEMY_SPEED = diff['enemy_speed']
         settings.ENEMY_FIRE_CHANCE = diff['enemy_fire_chance']
         settings.ENEMY_BULLET_SPEED = diff['enemy_bullet_speed']
+        settings.ENEMY_SHOT_COUNT = diff['enemy_shot_count']
         settings.ENEMY_ROWS = diff['enemy_rows']
         settings.ENEMIES_PER_ROW = diff['enemies_per_row']
         self.powerup_manager.drop_chance = diff['powerup_drop_chance']
@@ -229,9 +240,15 @@ class Game:
         self.apply_difficulty_settings()
         self.score = 0
         self.combo_system.reset()
+        self.enemy_ai = EnemyAI()
         self.all_sprites.empty()
         self.enemies.empty()
-        self.bullets.empty()
+        self.player_bullets.empty()
+        self.enemy_bullets.empty()
+        if settings.get_difficulty_setting('array_bullets'):
+            self.enemy_bullets = BulletArray()
+        else:
+            self.enemy_bullets = EnemyBulletGroup()
         self.tractor_beams.empty()
         self.explosions.empty()
         self.powerups.empty()
@@ -269,10 +286,10 @@ class Game:
                         self.running = False
                 elif self.state == settings.STATE_DIFFICULTY_SELECT:
                     if event.key == pygame.K_UP:
-                        self.selected_difficulty = (self.selected_difficulty - 1) % 3
+                        self.selected_difficulty = (self.selected_difficulty - 1) % len(self.difficulty_names)
                         self.assets.play_sound('shoot')
                     elif event.key == pygame.K_DOWN:
-                        self.selected_difficulty = (self.selected_difficulty + 1) % 3
+                        self.selected_difficulty = (self.selected_difficulty + 1) % len(self.difficulty_names)
                         self.assets.play_sound('shoot')
                     elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
                         settings.set_difficulty(self.difficulty_names[self.selected_difficulty])
@@ -293,13 +310,13 @@ class Game:
                         if self.player:
                             weapon_name = self.player.change_weapon(1)
                             self.powerup_message = weapon_name
-                            self.powerup_message_time = pygame.time.get_ticks()
+                            self.powerup_message_time = self.sim_clock.now
                             self.assets.play_sound('shoot')
                     elif event.key == pygame.K_q:
                         if self.player:
                             weapon_name = self.player.change_weapon(-1)
                             self.powerup_message = weapon_name
-                            self.powerup_message_time = pygame.time.get_ticks()
+                            self.powerup_message_time = self.sim_clock.now
                             self.assets.play_sound('shoot')
                 elif self.state == settings.STATE_PAUSED:
                     if event.key == pygame.K_p:
@@ -338,20 +355,22 @@ class Game:
                 if self.state == settings.STATE_PLAYING and self.player:
                     weapon_name = self.player.change_weapon(-event.y)
                     self.powerup_message = weapon_name
-                    self.powerup_message_time = pygame.time.get_ticks()
+                    self.powerup_message_time = self.sim_clock.now
                     self.assets.play_sound('shoot')
     
     def update(self):
+        clock = self.sim_clock
+        clock.tick(self.clock.get_time())
         self.background.update()
-        self.screen_shake.update()
-        self.flash_effect.update()
-        self.combo_system.update()
+        self.screen_shake.update(clock)
+        self.flash_effect.update(clock)
+        self.combo_system.update(clock)
         if self.nuclear_bomb:
-            self.nuclear_bomb.update()
+            self.nuclear_bomb.update(clock)
             if not self.nuclear_bomb.active:
                 self.nuclear_bomb = None
         if self.state == settings.STATE_STAGE_CLEAR:
-            if pygame.time.get_ticks() - self.stage_clear_time >= self.stage_clear_delay:
+            if clock.since(self.stage_clear_time) >= self.stage_clear_delay:
                 self.stage_clear_time = 0
                 self.enemies = self.wave_manager.next_wave()
                 self.all_sprites.add(self.enemies)
@@ -361,30 +380,41 @@ class Game:
             return
         keys = pygame.key.get_pressed()
         if self.player and not self.player_being_captured:
-            self.player.update(keys)
+            self.player.update(keys, clock)
             if keys[pygame.K_SPACE]:
-                if self.player.shoot(self.bullets):
+                if self.player.shoot(self.player_bullets):
                     self.assets.play_sound('shoot')
-        for enemy in self.enemies:
-            enemy.update()
-            enemy.shoot(self.bullets)
+        # 편대 슬롯 위치는 프레임당 한 번만 계산
+        self.wave_manager.update(clock)
+        # 모든 적의 난수를 한 번에 뽑고 발사 후보만 shoot 호출
+        enemies, rolls, shooters = self.enemy_ai.decide(self.enemies)
+        for enemy, move_roll, beam_roll in zip(enemies, rolls[ROLL_MOVE], rolls[ROLL_BEAM]):
+            enemy.update(move_roll, clock)
             if enemy.is_boss and not self.player_being_captured:
-                if enemy.shoot_tractor_beam(self.tractor_beams, self.assets.get_image('tractor_beam')):
+                if enemy.shoot_tractor_beam(self.tractor_beams, self.assets.get_image('tractor_beam'),
+                                            beam_roll):
                     self.assets.play_sound('enemy_shoot')
-        for bullet in self.bullets:
-            bullet.update(self.enemies)
+        fire_rolls = rolls[ROLL_FIRE]
+        for index in shooters:
+            enemies[index].shoot(self.enemy_bullets, fire_rolls[index])
+        # 이동이 끝난 적 위치로 공간 해시 재구성 (호밍 타겟 탐색과 충돌 처리에 공유)
+        self.enemy_hash.rebuild(self.enemies)
+        self.player_bullets.update(self.enemies, self.enemy_hash)
+        self.enemy_bullets.update()
         self.explosions.update()
-        self.tractor_beams.update()
-        self.powerups.update()
+        self.tractor_beams.update(clock)
+        self.powerups.update(clock)
         self.handle_collisions()
-        if len(self.enemies) == 0:
+        if self.wave_manager.formation.alive_count == 0:
             if self.stage_clear_time == 0:
-                self.stage_clear_time = pygame.time.get_ticks()
+                self.stage_clear_time = clock.now
                 self.state = settings.STATE_STAGE_CLEAR
                 self.assets.play_sound('stage_clear')
         if self.wave_manager and self.wave_manager.is_bonus_stage:
             if self.wave_manager.is_bonus_stage_timeout():
-                self.enemies.empty()
+                # kill()로 제거해야 편대 슬롯도 비워져 스테이지 클리어가 판정됨
+                for enemy in self.enemies:
+                    enemy.kill()
     
     def handle_collisions(self):
         if not self.player:
@@ -392,12 +422,13 @@ class Game:
         if self.nuclear_bomb:
             self.handle_nuclear_bomb_damage()
         score_gained, hit_positions, boss_killed_positions, split_children = check_bullet_enemy_collision(
-            self.bullets, self.enemies)
+            self.player_bullets, self.enemies, self.enemy_hash)
         for child in split_children:
             if self.player:
                 child.set_player_reference(self.player)
             self.enemies.add(child)
             self.all_sprites.add(child)
+            self.enemy_hash.insert(child)
         if score_gained > 0:
             kill_count = len(hit_positions) + len(boss_killed_positions)
             combo_multiplier = 1.0
@@ -410,7 +441,7 @@ class Game:
             self.score += final_score
             if self.combo_system.combo_count >= 3:
                 self.combo_message = f"{self.combo_system.combo_count} COMBO! x{combo_multiplier:.1f}"
-                self.combo_message_time = pygame.time.get_ticks()
+                self.combo_message_time = self.sim_clock.now
             self.assets.play_sound('explosion')
             for pos in hit_positions:
                 explosion = Explosion(pos[0], pos[1], self.assets.get_explosion_frames())
@@ -428,13 +459,13 @@ class Game:
                 self.high_score = self.score
                 self.save_high_score()
         self.handle_powerup_collision()
-        if check_player_bullet_collision(self.player, self.bullets):
+        if check_player_bullet_collision(self.player, self.enemy_bullets):
             if not self.player.take_damage():
                 self.game_over()
             else:
                 self.assets.play_sound('explosion')
                 self.screen_shake.medium_shake()
-        if check_player_enemy_collision(self.player, self.enemies):
+        if check_player_enemy_collision(self.player, self.enemies, self.enemy_hash):
             if not self.player.take_damage():
                 self.game_over()
             else:
@@ -468,18 +499,17 @@ class Game:
                     if self.wave_manager:
                         self.wave_manager.set_player(self.player)
         if self.capturing_boss and self.capturing_boss.has_captured_ship:
-            for bullet in self.bullets:
-                if bullet.bullet_type == 'player':
-                    if pygame.sprite.collide_rect(bullet, self.capturing_boss):
-                        bullet.kill()
-                        self.capturing_boss.kill()
-                        self.score += settings.SCORE_RESCUE
-                        if self.player:
-                            self.player.rescue_ship()
-                        self.capturing_boss = None
-                        self.assets.play_sound('rescue')
-                        break
-        if check_bullet_beam_collision(self.bullets, self.tractor_beams):
+            for bullet in self.player_bullets:
+                if pygame.sprite.collide_rect(bullet, self.capturing_boss):
+                    bullet.kill()
+                    self.capturing_boss.kill()
+                    self.score += settings.SCORE_RESCUE
+                    if self.player:
+                        self.player.rescue_ship()
+                    self.capturing_boss = None
+                    self.assets.play_sound('rescue')
+                    break
+        if check_bullet_beam_collision(self.player_bullets, self.tractor_beams):
             self.assets.play_sound('explosion')
             if self.player_being_captured:
                 self.player_being_captured = False
@@ -496,7 +526,7 @@ class Game:
                     message = "1UP!"
                 if message:
                     self.powerup_message = message
-                    self.powerup_message_time = pygame.time.get_ticks()
+                    self.powerup_message_time = self.sim_clock.now
                 self.assets.play_sound('powerup')
                 powerup.kill()
     
@@ -507,7 +537,7 @@ class Game:
             self.flash_effect.large_flash()
             self.assets.play_sound('boss_warning')
             self.powerup_message = "NUCLEAR BOMB!"
-            self.powerup_message_time = pygame.time.get_ticks()
+            self.powerup_message_time = self.sim_clock.now
     
     def handle_nuclear_bomb_damage(self):
         if not self.nuclear_bomb:
@@ -515,18 +545,14 @@ class Game:
         radius = self.nuclear_bomb.get_current_radius()
         bomb_x = self.nuclear_bomb.x
         bomb_y = self.nuclear_bomb.y
-        for enemy in list(self.enemies):
-            dx = enemy.rect.centerx - bomb_x
-            dy = enemy.rect.centery - bomb_y
-            distance = math.sqrt(dx**2 + dy**2)
-            if distance <= radius:
-                pos = (enemy.rect.centerx, enemy.rect.centery)
-                if enemy.take_damage(999):
-                    self.score += enemy.get_score_value()
-                    explosion = Explosion(pos[0], pos[1], self.assets.get_explosion_frames())
-                    self.explosions.add(explosion)
-                    if enemy.is_boss:
-                        self.powerup_manager.spawn_boss_powerup(pos[0], pos[1], self.powerups)
+        for enemy in find_enemies_in_radius(self.enemies, bomb_x, bomb_y, radius, self.enemy_hash):
+            pos = (enemy.rect.centerx, enemy.rect.centery)
+            if enemy.take_damage(999):
+                self.score += enemy.get_score_value()
+                explosion = Explosion(pos[0], pos[1], self.assets.get_explosion_frames())
+                self.explosions.add(explosion)
+                if enemy.is_boss:
+                    self.powerup_manager.spawn_boss_powerup(pos[0], pos[1], self.powerups)
     
     def game_over(self):
         self.state = settings.STATE_GAME_OVER
@@ -540,7 +566,14 @@ class Game:
             self.show_name_input = False
             self.new_rank = -1
     
-    def draw(self):
+    def interpolated_sprites(self):
+        """렌더 보간 대상 (탄환 그룹은 draw에서 직접 보간)"""
+        return [self.enemies, self.tractor_beams, self.powerups, [self.player] if self.player else []]
+    
+    def draw(self, alpha: float = 1.0):
+        if self.state != settings.STATE_PLAYING:
+            alpha = 1.0  # 시뮬레이션이 멈춘 상태(일시정지 등)에서는 보간하지 않음
+        self.interpolator.apply(alpha, self.interpolated_sprites())
         self.background.draw(self.game_surface)
         if self.state == settings.STATE_MENU:
             self.ui.draw_menu(self.game_surface)
@@ -548,7 +581,8 @@ class Game:
             self.ui.draw_difficulty_select(self.game_surface, self.selected_difficulty)
         elif self.state == settings.STATE_PLAYING:
             self.enemies.draw(self.game_surface)
-            self.bullets.draw(self.game_surface)
+            self.player_bullets.draw(self.game_surface, alpha)
+            self.enemy_bullets.draw(self.game_surface, alpha)
             self.tractor_beams.draw(self.game_surface)
             self.explosions.draw(self.game_surface)
             for powerup in self.powerups:
@@ -578,7 +612,8 @@ class Game:
                 self.ui.draw_capture_warning(self.game_surface)
         elif self.state == settings.STATE_PAUSED:
             self.enemies.draw(self.game_surface)
-            self.bullets.draw(self.game_surface)
+            self.player_bullets.draw(self.game_surface, alpha)
+            self.enemy_bullets.draw(self.game_surface, alpha)
             if self.player:
                 self.player.draw(self.game_surface)
             self.ui.draw_pause(self.game_surface)
@@ -596,6 +631,7 @@ class Game:
         self.screen.fill((0, 0, 0))
         self.screen.blit(self.game_surface, (shake_x, shake_y))
         pygame.display.flip()
+        self.interpolator.restore()
     
     def draw_combo_display(self):
         if not self.combo_system.is_active():
@@ -613,7 +649,7 @@ class Game:
             color = (255, 100, 100)
         else:
             color = (255, 0, 255)
-        elapsed = pygame.time.get_ticks() - self.combo_system.combo_timer
+        elapsed = self.sim_clock.since(self.combo_system.combo_timer)
         remaining = max(0, self.combo_system.combo_timeout - elapsed)
         bar_width = int(100 * remaining / self.combo_system.combo_timeout)
         bar_x = settings.SCREEN_WIDTH - 120
@@ -627,7 +663,7 @@ class Game:
     def draw_combo_message(self):
         if not self.combo_message:
             return
-        elapsed = pygame.time.get_ticks() - self.combo_message_time
+        elapsed = self.sim_clock.since(self.combo_message_time)
         if elapsed > self.combo_message_duration:
             self.combo_message = ""
             return
@@ -665,11 +701,12 @@ class Game:
             settings.DIFFICULTY_EASY: settings.GREEN,
             settings.DIFFICULTY_NORMAL: settings.YELLOW,
             settings.DIFFICULTY_HARD: settings.RED,
+            settings.DIFFICULTY_BULLET_HELL: (255, 128, 0),
         }
         color = diff_colors.get(settings.current_difficulty, settings.WHITE)
-        text = settings.current_difficulty.upper()
+        text = settings.current_difficulty.replace('_', ' ').upper()
         surface = font.render(text, True, color)
-        self.game_surface.blit(surface, (settings.SCREEN_WIDTH - 60, 50))
+        self.game_surface.blit(surface, surface.get_rect(topright=(settings.SCREEN_WIDTH - 10, 50)))
     
     def draw_weapon_display(self):
         if not self.player:
@@ -717,21 +754,21 @@ class Game:
         y = settings.SCREEN_HEIGHT - 30
         font = pygame.font.Font(None, 20)
         active_powerups = []
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now
         if powerups.speed_boost:
-            remaining = max(0, (powerups.speed_end_time - current_time) // 1000)
+            remaining = max(0, int(powerups.speed_end_time - current_time) // 1000)
             active_powerups.append(("SPEED", remaining, (100, 255, 100)))
         if powerups.shot_power > 1:
-            remaining = max(0, (powerups.shot_power_end_time - current_time) // 1000)
+            remaining = max(0, int(powerups.shot_power_end_time - current_time) // 1000)
             active_powerups.append(("POWER", remaining, (255, 100, 100)))
         if powerups.triple_shot:
-            remaining = max(0, (powerups.triple_shot_end_time - current_time) // 1000)
+            remaining = max(0, int(powerups.triple_shot_end_time - current_time) // 1000)
             active_powerups.append(("TRIPLE", remaining, (100, 100, 255)))
         if powerups.shield_active:
-            remaining = max(0, (powerups.shield_end_time - current_time) // 1000)
+            remaining = max(0, int(powerups.shield_end_time - current_time) // 1000)
             active_powerups.append(("SHIELD", remaining, (100, 255, 255)))
         if powerups.rapid_fire:
-            remaining = max(0, (powerups.rapid_fire_end_time - current_time) // 1000)
+            remaining = max(0, int(powerups.rapid_fire_end_time - current_time) // 1000)
             active_powerups.append(("RAPID", remaining, (255, 255, 100)))
         for i, (name, remaining, color) in enumerate(active_powerups):
             text = f"{name}:{remaining}s"
@@ -741,7 +778,7 @@ class Game:
     def draw_powerup_message(self):
         if not self.powerup_message:
             return
-        elapsed = pygame.time.get_ticks() - self.powerup_message_time
+        elapsed = self.sim_clock.since(self.powerup_message_time)
         if elapsed > self.powerup_message_duration:
             self.powerup_message = ""
             return
@@ -832,10 +869,14 @@ class Game:
             
     def run(self):
         while self.running:
+            # 실제 경과 시간만큼 고정 스텝으로 진행 (밀렸으면 여러 스텝, 렌더가 빠르면 0스텝)
+            steps = self.sim_clock.advance(self.clock.tick(settings.RENDER_FPS))
             self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(settings.FPS)
+            for step in range(steps):
+                if step == steps - 1:
+                    self.interpolator.snapshot(self.interpolated_sprites())
+                self.update()
+            self.draw(self.sim_clock.alpha)
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,50 @@
+# mask_cache.py
+"""
+정밀 충돌용 비트마스크 캐시
+같은 이미지(Surface 객체)의 마스크는 한 번만 생성해서 재사용합니다.
+"""
+import weakref
+import pygame
+from typing import Optional, Tuple
+
+# 이미지 객체 -> 마스크 (이미지가 사라지면 마스크도 함께 정리됨)
+_masks: 'weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]' = weakref.WeakKeyDictionary()
+
+
+def get_mask(surface: pygame.Surface) -> pygame.mask.Mask:
+    """
+    이미지의 비트마스크 반환 (없으면 생성 후 캐시)
+    
+    Args:
+        surface: 스프라이트 이미지
+    
+    Returns:
+        알파값 기준 비트마스크
+    """
+    mask = _masks.get(surface)
+    if mask is None:
+        mask = pygame.mask.from_surface(surface)
+        _masks[surface] = mask
+    return mask
+
+
+def masks_overlap(sprite_a: pygame.sprite.Sprite, sprite_b: pygame.sprite.Sprite,
+                  position_a: Optional[Tuple[int, int]] = None) -> bool:
+    """
+    두 스프라이트 이미지의 불투명 픽셀이 겹치는지 확인
+    
+    사각형 겹침이 확인된 쌍에만 호출합니다.
+    
+    Args:
+        sprite_a: 첫 번째 스프라이트
+        sprite_b: 두 번째 스프라이트
+        position_a: sprite_a를 현재 위치 대신 놓을 좌상단 좌표 (선택)
+    """
+    ax, ay = position_a if position_a is not None else sprite_a.rect.topleft
+    offset = (sprite_b.rect.x - ax, sprite_b.rect.y - ay)
+    return get_mask(sprite_a.image).overlap(get_mask(sprite_b.image), offset) is not None
+
+
+def cached_count() -> int:
+    """현재 캐시된 마스크 수"""
+    return len(_masks)
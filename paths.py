@@ -0,0 +1,251 @@
+# paths.py
+"""
+적 진입/돌진 경로 라이브러리
+경로 모양마다 웨이포인트와 호 길이 테이블을 한 번만 만들어 모든 적이 공유하고,
+적은 경로를 따라 이동한 거리만 늘려서 위치를 구합니다. (매 프레임 sqrt/나눗셈 없음)
+곡선 경로는 Catmull-Rom 스플라인을 촘촘히 샘플링해서 같은 테이블로 만듭니다.
+"""
+import math
+import settings
+from typing import Callable, Dict, List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+# 스플라인 제어점 사이를 나누는 샘플 수
+SPLINE_SAMPLES = 16
+
+
+def catmull_rom(control_points: Sequence[Point], samples: int = SPLINE_SAMPLES) -> List[Point]:
+    """
+    제어점을 모두 지나는 균일 Catmull-Rom 스플라인 샘플링
+    
+    Args:
+        control_points: 제어점 (2개 이상, 양 끝점은 한 번 더 복제해서 사용)
+        samples: 제어점 구간마다 나눌 샘플 수
+    
+    Returns:
+        첫 제어점부터 마지막 제어점까지의 웨이포인트
+    """
+    extended = [control_points[0]] + list(control_points) + [control_points[-1]]
+    points = []
+    for i in range(1, len(extended) - 2):
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = extended[i - 1:i + 3]
+        for step in range(samples):
+            t = step / samples
+            t2 = t * t
+            t3 = t2 * t
+            points.append((
+                0.5 * (2 * x1 + (x2 - x0) * t + (2 * x0 - 5 * x1 + 4 * x2 - x3) * t2
+                       + (3 * x1 - x0 - 3 * x2 + x3) * t3),
+                0.5 * (2 * y1 + (y2 - y0) * t + (2 * y0 - 5 * y1 + 4 * y2 - y3) * t2
+                       + (3 * y1 - y0 - 3 * y2 + y3) * t3),
+            ))
+    points.append(tuple(control_points[-1]))
+    return points
+
+
+def _circle_points() -> List[Point]:
+    """화면 위쪽 중앙을 크게 도는 반원 (화면 좌표 고정)"""
+    center_x = settings.SCREEN_WIDTH // 2
+    center_y = settings.SCREEN_HEIGHT // 4
+    radius = 150
+    steps = 30
+    return [(center_x + radius * math.cos(math.pi + math.pi * i / steps),
+             center_y + radius * math.sin(math.pi + math.pi * i / steps))
+            for i in range(steps)]
+
+
+def _zigzag_points() -> List[Point]:
+    """좌우로 흔들며 내려오는 경로 (시작 위치 기준)"""
+    return [(100 * math.sin(i * 0.5), i * 30) for i in range(20)]
+
+
+def _fast_dive_points() -> List[Point]:
+    """빠른 적용 급강하 경로 (시작 위치 기준)"""
+    return [(math.sin(i * 0.3) * 50, i * 50) for i in range(10)]
+
+
+def _straight_points() -> List[Point]:
+    """곧장 내려오는 경로 (시작 위치 기준)"""
+    return [(0, i * 30) for i in range(15)]
+
+
+def _swoop_points(mirror: bool) -> List[Point]:
+    """
+    화면 옆에서 내려와 아래쪽에서 크게 고리를 그린 뒤 올라가는 갤러그식 진입 (화면 좌표)
+    
+    Args:
+        mirror: True면 오른쪽에서 진입
+    """
+    width = settings.SCREEN_WIDTH
+    height = settings.SCREEN_HEIGHT
+    controls = [(0.08, 0.02), (0.22, 0.30), (0.45, 0.52), (0.68, 0.45),
+                (0.66, 0.30), (0.48, 0.30), (0.40, 0.22)]
+    return catmull_rom([((1 - fx if mirror else fx) * width, fy * height) for fx, fy in controls])
+
+
+def _swoop_left_points() -> List[Point]:
+    """왼쪽에서 들어오는 스윕"""
+    return _swoop_points(False)
+
+
+def _swoop_right_points() -> List[Point]:
+    """오른쪽에서 들어오는 스윕"""
+    return _swoop_points(True)
+
+
+def _loop_points() -> List[Point]:
+    """내려오다가 옆으로 한 바퀴 도는 경로 (시작 위치 기준)"""
+    return catmull_rom([(0, 0), (0, 160), (70, 260), (0, 330), (-70, 260), (0, 180), (0, 100)])
+
+
+# 경로 이름 -> (웨이포인트 생성 함수, 시작 위치만큼 평행이동하는지)
+PATH_SHAPES: Dict[str, Tuple[Callable[[], List[Point]], bool]] = {
+    'circle': (_circle_points, False),
+    'zigzag': (_zigzag_points, True),
+    'fast_dive': (_fast_dive_points, True),
+    'straight': (_straight_points, True),
+    'swoop_left': (_swoop_left_points, False),
+    'swoop_right': (_swoop_right_points, False),
+    'loop': (_loop_points, True),
+}
+
+
+class PathTable:
+    """한 경로 모양의 호 길이 테이블 (모든 적이 공유, 읽기 전용)"""
+    
+    def __init__(self, points: List[Point], relative: bool):
+        """
+        호 길이 테이블 생성
+        
+        Args:
+            points: 웨이포인트 목록
+            relative: True면 시작 위치 기준 좌표, False면 화면 좌표
+        """
+        self.points = points
+        self.relative = relative
+        
+        # 각 웨이포인트까지의 누적 거리와 구간별 단위 방향 (역수를 미리 곱해 둠)
+        self.starts: List[float] = [0.0]
+        self.directions: List[Point] = []
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            inverse = 1.0 / length if length > 0 else 0.0
+            self.directions.append(((x1 - x0) * inverse, (y1 - y0) * inverse))
+            self.starts.append(self.starts[-1] + length)
+        self.length = self.starts[-1]
+
+
+# 경로 이름 -> 공유 테이블
+_tables: Dict[str, PathTable] = {}
+
+
+def build_spline_table(control_points: Sequence[Point]) -> PathTable:
+    """
+    적 한 기 전용 스플라인 경로 테이블 생성 (보스 돌진처럼 목표가 매번 다른 경로)
+    
+    경로를 시작할 때 한 번만 만들고, 이동 중에는 PathFollower로 따라갑니다.
+    
+    Args:
+        control_points: 화면 좌표 제어점
+    """
+    return PathTable(catmull_rom(control_points), False)
+
+
+def get_path_table(path_type: str) -> PathTable:
+    """
+    경로 테이블 반환 (처음 요청 시 생성)
+    
+    Args:
+        path_type: 경로 이름 (알 수 없으면 'straight')
+    """
+    if path_type not in PATH_SHAPES:
+        path_type = 'straight'
+    
+    table = _tables.get(path_type)
+    if table is None:
+        builder, relative = PATH_SHAPES[path_type]
+        table = PathTable(builder(), relative)
+        _tables[path_type] = table
+    return table
+
+
+class PathFollower:
+    """
+    공유 테이블을 따라가는 적 한 기의 진행 상태
+    
+    현재 위치에서 경로 첫 점까지의 진입 구간, 공유 테이블 구간,
+    경로 끝점에서 편대 위치까지의 마무리 구간을 이어서 이동합니다.
+    """
+    
+    def __init__(self, table: PathTable, start: Point, origin: Point, end: Point):
+        """
+        경로 진행 상태 초기화 (진입/마무리 구간 길이만 여기서 계산)
+        
+        Args:
+            table: 공유 경로 테이블
+            start: 현재 위치 (적 중심)
+            origin: 상대 경로를 평행이동할 기준점
+            end: 도착 위치 (편대에서의 적 중심)
+        """
+        self.table = table
+        self.offset_x, self.offset_y = origin if table.relative else (0.0, 0.0)
+        
+        first_x, first_y = table.points[0]
+        last_x, last_y = table.points[-1]
+        self.start_x, self.start_y = start
+        self.lead_dx, self.lead_dy, self.lead_length = self._segment(
+            start, (first_x + self.offset_x, first_y + self.offset_y))
+        self.tail_x = last_x + self.offset_x
+        self.tail_y = last_y + self.offset_y
+        self.end_x, self.end_y = end
+        self.tail_dx, self.tail_dy, tail_length = self._segment((self.tail_x, self.tail_y), end)
+        
+        self.tail_start = self.lead_length + table.length
+        self.length = self.tail_start + tail_length
+        self.distance = 0.0
+        self.cursor = 0  # 현재 테이블 구간 (거리가 늘기만 하므로 앞으로만 이동)
+    
+    @staticmethod
+    def _segment(a: Point, b: Point) -> Tuple[float, float, float]:
+        """두 점 사이 (단위 방향 x, 단위 방향 y, 길이)"""
+        dx = b[0] - a[0]
+        dy = b[1] - a[1]
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return 0.0, 0.0, 0.0
+        return dx / length, dy / length, length
+    
+    def advance(self, step: float) -> Tuple[float, float, bool]:
+        """
+        경로를 따라 step만큼 이동
+        
+        Returns:
+            (x, y, 도착 여부). 도착하면 편대 위치를 반환
+        """
+        distance = self.distance + step
+        self.distance = distance
+        
+        if distance >= self.length:
+            return self.end_x, self.end_y, True
+        
+        if distance < self.lead_length:
+            return (self.start_x + self.lead_dx * distance,
+                    self.start_y + self.lead_dy * distance, False)
+        
+        if distance >= self.tail_start:
+            along = distance - self.tail_start
+            return self.tail_x + self.tail_dx * along, self.tail_y + self.tail_dy * along, False
+        
+        along = distance - self.lead_length
+        table = self.table
+        starts = table.starts
+        i = self.cursor
+        while starts[i + 1] <= along:
+            i += 1
+        self.cursor = i
+        
+        x, y = table.points[i]
+        ux, uy = table.directions[i]
+        along -= starts[i]
+        return self.offset_x + x + ux * along, self.offset_y + y + uy * along, False
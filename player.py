@@ -6,10 +6,11 @@ import pygame
 import math
 from typing import Optional
 import settings
-from bullet import (Bullet, WEAPON_NORMAL, WEAPON_LASER, WEAPON_MISSILE, 
+from bullet import (WEAPON_NORMAL, WEAPON_LASER, WEAPON_MISSILE, 
                    WEAPON_HOMING, WEAPON_SPREAD, WEAPON_RAILGUN, 
-                   WEAPON_PLASMA, WEAPON_WAVE, WEAPON_INFO)
+                   WEAPON_PLASMA, WEAPON_WAVE, WEAPON_INFO, bullet_pool)
 from powerup import PlayerPowerUps
+from sim_clock import SimClock
 
 
 class Player(pygame.sprite.Sprite):
@@ -43,7 +44,7 @@ class Player(pygame.sprite.Sprite):
         self.weapon_change_time = 0
         
         # 발사 관련
-        self.last_shot_time = 0
+        self.last_shot_time = -math.inf  # 시뮬레이션 시각 0에서도 바로 발사 가능
         self.base_fire_delay = settings.PLAYER_FIRE_DELAY
         self.fire_delay = self.base_fire_delay
         
@@ -55,6 +56,9 @@ class Player(pygame.sprite.Sprite):
         # 파워업 시스템
         self.powerups = PlayerPowerUps()
         
+        # 마지막 update에서 받은 시뮬레이션 시각 (발사/무적 시간 기준)
+        self.now = 0.0
+        
         # 쉴드 시각 효과
         self.shield_angle = 0
         
@@ -62,10 +66,12 @@ class Player(pygame.sprite.Sprite):
         self.ultimate_charge = 0
         self.ultimate_max = 100
     
-    def update(self, keys: pygame.key.ScancodeWrapper) -> None:
+    def update(self, keys: pygame.key.ScancodeWrapper, clock: SimClock) -> None:
         """플레이어 상태 업데이트"""
+        self.now = clock.now
+        
         # 파워업 타이머 업데이트
-        self.powerups.update()
+        self.powerups.update(clock)
         
         # 파워업 효과 적용
         speed_mult = self.powerups.get_speed_multiplier()
@@ -105,7 +111,7 @@ class Player(pygame.sprite.Sprite):
         
         # 무적 시간 처리
         if self.invulnerable:
-            elapsed = pygame.time.get_ticks() - self.invulnerable_start_time
+            elapsed = self.now - self.invulnerable_start_time
             if elapsed >= self.invulnerable_duration:
                 self.invulnerable = False
         
@@ -125,7 +131,7 @@ class Player(pygame.sprite.Sprite):
         self.current_weapon_index = (self.current_weapon_index + direction) % len(self.WEAPONS)
         self.current_weapon = self.WEAPONS[self.current_weapon_index]
         self.weapon_changing = True
-        self.weapon_change_time = pygame.time.get_ticks()
+        self.weapon_change_time = self.now
         return WEAPON_INFO[self.current_weapon]['name']
 
     def add_ultimate_charge(self, amount: int) -> None:
@@ -160,7 +166,7 @@ class Player(pygame.sprite.Sprite):
     
     def shoot(self, bullets_group: pygame.sprite.Group) -> bool:
         """탄환 발사"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         if current_time - self.last_shot_time < self.fire_delay:
             return False
         
@@ -184,7 +190,7 @@ class Player(pygame.sprite.Sprite):
     
     def _shoot_single(self, bullets_group: pygame.sprite.Group, damage: int) -> None:
         """단발 발사"""
-        bullet = Bullet(
+        bullet = bullet_pool.acquire(
             self.rect.centerx,
             self.rect.top,
             'player',
@@ -196,7 +202,7 @@ class Player(pygame.sprite.Sprite):
     
     def _shoot_double(self, bullets_group: pygame.sprite.Group, damage: int) -> None:
         """더블 파이터 발사"""
-        bullet1 = Bullet(
+        bullet1 = bullet_pool.acquire(
             self.rect.left + 10,
             self.rect.top,
             'player',
@@ -204,7 +210,7 @@ class Player(pygame.sprite.Sprite):
             damage=damage,
             weapon_type=self.current_weapon
         )
-        bullet2 = Bullet(
+        bullet2 = bullet_pool.acquire(
             self.rect.right - 10,
             self.rect.top,
             'player',
@@ -228,7 +234,7 @@ class Player(pygame.sprite.Sprite):
             angles = [0]
         
         for angle in angles:
-            bullet = Bullet(
+            bullet = bullet_pool.acquire(
                 self.rect.centerx,
                 self.rect.top,
                 'player',
@@ -243,7 +249,7 @@ class Player(pygame.sprite.Sprite):
         """스프레드 샷 발사 (5방향)"""
         angles = [-30, -15, 0, 15, 30]
         for angle in angles:
-            bullet = Bullet(
+            bullet = bullet_pool.acquire(
                 self.rect.centerx,
                 self.rect.top,
                 'player',
@@ -262,19 +268,19 @@ class Player(pygame.sprite.Sprite):
         # 쉴드 체크 (중첩 쉴드)
         if self.powerups.use_shield():
             self.invulnerable = True
-            self.invulnerable_start_time = pygame.time.get_ticks()
+            self.invulnerable_start_time = self.now
             return True
         
         if self.is_double_fighter:
             self.is_double_fighter = False
             self.invulnerable = True
-            self.invulnerable_start_time = pygame.time.get_ticks()
+            self.invulnerable_start_time = self.now
             return True
         else:
             self.lives -= 1
             if self.lives > 0:
                 self.invulnerable = True
-                self.invulnerable_start_time = pygame.time.get_ticks()
+                self.invulnerable_start_time = self.now
                 self.powerups.reset()
                 return True
             return False
@@ -7,6 +7,7 @@ import random
 import math
 from typing import Optional
 import settings
+from sim_clock import SimClock
 
 
 class PowerUp(pygame.sprite.Sprite):
@@ -77,7 +78,7 @@ class PowerUp(pygame.sprite.Sprite):
         self.rotation_speed = 3
         
         # 깜빡임 (사라지기 전 경고)
-        self.spawn_time = pygame.time.get_ticks()
+        self.age = 0  # 생성 후 지난 시뮬레이션 시간 (ms)
         self.lifetime = 8000  # 8초 후 사라짐
         self.blink_start = 6000  # 6초부터 깜빡임
         self.visible = True
@@ -166,7 +167,7 @@ class PowerUp(pygame.sprite.Sprite):
                 (center, center)
             ])
     
-    def update(self) -> None:
+    def update(self, clock: SimClock) -> None:
         """파워업 업데이트"""
         # 아래로 이동
         self.rect.y += self.speed
@@ -180,12 +181,12 @@ class PowerUp(pygame.sprite.Sprite):
             self.kill()
         
         # 수명 체크
-        elapsed = pygame.time.get_ticks() - self.spawn_time
-        if elapsed > self.lifetime:
+        self.age += clock.dt
+        if self.age > self.lifetime:
             self.kill()
-        elif elapsed > self.blink_start:
+        elif self.age > self.blink_start:
             # 깜빡임
-            self.visible = (elapsed // 100) % 2 == 0
+            self.visible = (self.age // 100) % 2 == 0
     
     def draw(self, screen: pygame.Surface) -> None:
         """화면에 그리기"""
@@ -237,6 +238,7 @@ class PlayerPowerUps:
     """플레이어의 현재 파워업 상태 관리 (중첩 시스템)"""
     
     def __init__(self):
+        self.now = 0.0  # 마지막 update에서 받은 시뮬레이션 시각
         self.reset()
     
     def reset(self) -> None:
@@ -276,7 +278,7 @@ class PlayerPowerUps:
         Returns:
             적용된 파워업 이름
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.now
         duration = powerup.duration
         
         if powerup.powerup_type == PowerUp.SPEED_UP:
@@ -316,9 +318,9 @@ class PlayerPowerUps:
         
         return ""
     
-    def update(self) -> None:
+    def update(self, clock: SimClock) -> None:
         """파워업 타이머 업데이트"""
-        current_time = pygame.time.get_ticks()
+        self.now = current_time = clock.now
         
         if self.speed_boost and current_time > self.speed_end_time:
             self.speed_boost = False
@@ -2,7 +2,7 @@
 """
 게임 전역 설정 및 상수 정의
 """
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 # 화면 설정
 SCREEN_WIDTH = 720
@@ -10,6 +10,12 @@ SCREEN_HEIGHT = 960
 BASE_WIDTH = SCREEN_WIDTH  # 동일하게 유지
 BASE_HEIGHT = SCREEN_HEIGHT  # 동일하게 유지
 FPS: int = 60
+SIM_STEP_MS: float = 1000 / FPS  # 시뮬레이션 한 스텝 길이 (ms)
+SIM_FIXED_STEP: bool = True  # False면 실제로 잰 프레임 시간을 dt로 사용
+SIM_MAX_STEP_MS: float = 100  # 잰 dt 상한 (창 이동 등으로 멈췄다 돌아왔을 때 한 번에 건너뛰지 않도록)
+SIM_MAX_STEPS: int = 5  # 렌더 프레임 하나에 몰아서 진행할 최대 스텝 수 (넘는 밀린 시간은 버림)
+RENDER_FPS: int = 60  # 화면 갱신 목표 (시뮬레이션은 SIM_STEP_MS 고정, 120/144로 올려도 게임 속도 동일)
+RENDER_SNAP_DISTANCE: int = 48  # 한 스텝에 이보다 많이 움직인 스프라이트는 보간 없이 현재 위치에 그림
 TITLE: str = "Galaga Clone"
 
 # 사용 가능한 스케일
@@ -29,6 +35,7 @@ CYAN: Tuple[int, int, int] = (0, 255, 255)
 DIFFICULTY_EASY = 'easy'
 DIFFICULTY_NORMAL = 'normal'
 DIFFICULTY_HARD = 'hard'
+DIFFICULTY_BULLET_HELL = 'bullet_hell'
 
 # 현재 난이도 (기본값)
 current_difficulty = DIFFICULTY_NORMAL
@@ -46,6 +53,8 @@ DIFFICULTY_SETTINGS = {
         'powerup_drop_chance': 0.20,
         'enemy_rows': 3,
         'enemies_per_row': 8,
+        'enemy_shot_count': 1,
+        'array_bullets': False,
     },
     DIFFICULTY_NORMAL: {
         'player_lives': 3,
@@ -58,6 +67,8 @@ DIFFICULTY_SETTINGS = {
         'powerup_drop_chance': 0.15,
         'enemy_rows': 4,
         'enemies_per_row': 10,
+        'enemy_shot_count': 1,
+        'array_bullets': False,
     },
     DIFFICULTY_HARD: {
         'player_lives': 2,
@@ -70,6 +81,22 @@ DIFFICULTY_SETTINGS = {
         'powerup_drop_chance': 0.10,
         'enemy_rows': 5,
         'enemies_per_row': 12,
+        'enemy_shot_count': 1,
+        'array_bullets': False,
+    },
+    DIFFICULTY_BULLET_HELL: {
+        'player_lives': 5,
+        'player_speed': 5,
+        'enemy_speed': 2,
+        'enemy_fire_chance': 0.03,
+        'enemy_bullet_speed': 4,
+        'boss_hp': 8,
+        'score_multiplier': 2.0,
+        'powerup_drop_chance': 0.15,
+        'enemy_rows': 5,
+        'enemies_per_row': 12,
+        'enemy_shot_count': 5,  # 부채꼴 탄 수
+        'array_bullets': True,  # 적 탄환을 NumPy 배열 엔진(bullet_engine)으로 처리
     },
 }
 
@@ -94,15 +121,38 @@ PLAYER_FIRE_DELAY: int = 250
 ENEMY_WIDTH: int = 30
 ENEMY_HEIGHT: int = 30
 ENEMY_SPEED: int = 2
+ENEMY_ENTRY_SPEED_SCALE: float = 3.0  # 진입 경로 비행 속도 배율 (경로 길이 1000px 이상이라 기본 속도로는 10초 넘게 걸림)
 ENEMY_FIRE_CHANCE: float = 0.01
+ENEMY_SHOT_COUNT: int = 1  # 한 번에 쏘는 부채꼴 탄 수
+ENEMY_SHOT_SPREAD: int = 15  # 부채꼴 탄 사이 각도
+ENEMY_AI_SEED: Optional[int] = None  # 적 AI 난수 시드 (정하면 발사/돌진 판정이 재현됨)
+# 적 종류별 AI 판정 주기 (N이면 N프레임마다 한 번 판정, 발사는 N·p, 그 밖의 확률은 1-(1-p)^N으로 보정. 이동은 매 프레임)
+ENEMY_AI_SLICES: Dict[str, int] = {
+    'normal': 4,
+    'fast': 2,
+    'tank': 4,
+    'kamikaze': 4,
+    'splitter': 4,
+    'boss': 2,  # 공격 패턴 중인 보스는 매 프레임 판정
+}
 BOSS_WIDTH: int = 50
 BOSS_HEIGHT: int = 40
+ENEMY_HIT_FLASH_FRAMES: int = 6  # 피격 시 밝게 표시하는 프레임 수
 
 # 탄환 설정
 BULLET_WIDTH: int = 4
 BULLET_HEIGHT: int = 15
 BULLET_SPEED: int = 7
 ENEMY_BULLET_SPEED: int = 5
+BULLET_POOL_SIZE: int = 512  # 탄환 풀에 보관할 최대 탄환 수
+BULLET_ARRAY_CAPACITY: int = 16384  # 배열 탄환 엔진의 초기 용량 (부족하면 자동 확장)
+PLASMA_SPLASH_RADIUS: int = 60  # 플라즈마 폭발 반경
+PLASMA_SPLASH_DAMAGE_RATIO: float = 0.5  # 폭발 피해 = 탄환 데미지 x 비율
+HOMING_RETARGET_FRAMES: int = 10  # 호밍탄이 가장 가까운 적을 다시 찾는 주기 (타겟이 죽으면 즉시)
+
+# 충돌 설정
+SPATIAL_HASH_CELL_SIZE: int = max(ENEMY_WIDTH, BOSS_WIDTH)  # 적 1기가 최대 2x2칸에 걸치도록
+PRECISE_COLLISION: bool = False  # True면 사각형 겹침 후 픽셀 마스크로 한 번 더 확인
 
 # 트랙터 빔 설정
 TRACTOR_BEAM_WIDTH: int = 30
@@ -114,6 +164,9 @@ TRACTOR_BEAM_CAPTURE_TIME: int = 1000
 ENEMIES_PER_ROW: int = 10
 ENEMY_ROWS: int = 4
 FORMATION_PADDING: int = 50
+FORMATION_BREATHING: bool = False  # 편대가 중심 기준으로 벌어졌다 모이는 숨쉬기 동작
+FORMATION_BREATH_AMPLITUDE: float = 0.06  # 숨쉬기 시 중심으로부터 거리 비율 최대 변화량
+FORMATION_BREATH_PERIOD: int = 4000  # 숨쉬기 주기 (ms)
 BONUS_STAGE_INTERVAL: int = 3
 
 # 점수 설정
@@ -0,0 +1,83 @@
+# sim_clock.py
+"""
+시뮬레이션 시계
+게임 로직이 읽는 시간을 한 곳에서 관리합니다.
+매 스텝 tick()으로 진행하고, 각 update에 넘겨 dt(이번 스텝 길이)와 now(단조 증가 시각)를 읽게 합니다.
+고정 dt면 실제 시간과 무관하게 진행되므로 벤치마크/헤드리스 실행에서 원하는 만큼 빠르게 돌릴 수 있습니다.
+게임 루프는 advance()로 실제 경과 시간을 누적해 렌더 프레임마다 진행할 스텝 수를 받고,
+남은 시간 비율(alpha)로 직전 스텝과 현재 스텝 사이를 보간해 그립니다.
+"""
+from typing import Optional
+import settings
+
+
+class SimClock:
+    """시뮬레이션 시각과 스텝 길이 (ms)"""
+    
+    def __init__(self, step: float = settings.SIM_STEP_MS, fixed: bool = settings.SIM_FIXED_STEP,
+                 max_step: float = settings.SIM_MAX_STEP_MS):
+        """
+        시계 초기화
+        
+        Args:
+            step: 고정 스텝 길이 (측정 모드에서는 잰 값이 없을 때 사용)
+            fixed: False면 tick에 넘긴 실제 경과 시간을 dt로 사용
+            max_step: 측정 모드 dt 상한
+        """
+        self.step = step
+        self.fixed = fixed
+        self.max_step = max_step
+        self.dt = step
+        self.now = 0.0
+        self.frame = 0
+        self.accumulator = 0.0  # 아직 시뮬레이션하지 않은 실제 경과 시간 (고정 모드)
+    
+    def tick(self, elapsed: Optional[float] = None) -> float:
+        """
+        한 스텝 진행
+        
+        Args:
+            elapsed: 지난 스텝 이후 실제 경과 시간 (ms, 고정 모드에서는 무시)
+        
+        Returns:
+            이번 스텝 dt
+        """
+        if self.fixed or elapsed is None:
+            self.dt = self.step
+        else:
+            self.dt = min(max(elapsed, 0.0), self.max_step)
+        self.now += self.dt
+        self.frame += 1
+        return self.dt
+    
+    def advance(self, elapsed: float, max_steps: int = settings.SIM_MAX_STEPS) -> int:
+        """
+        렌더 프레임 사이 실제 경과 시간을 누적해 이번에 진행할 스텝 수 계산
+        
+        Args:
+            elapsed: 지난 렌더 프레임 이후 실제 경과 시간 (ms)
+            max_steps: 한 번에 진행할 최대 스텝 수 (넘는 밀린 시간은 버림)
+        
+        Returns:
+            진행할 스텝 수 (측정 모드는 항상 1)
+        """
+        if not self.fixed:
+            return 1
+        
+        self.accumulator += elapsed
+        steps = min(int(self.accumulator // self.step), max_steps)
+        self.accumulator -= steps * self.step
+        if steps == max_steps:
+            self.accumulator %= self.step
+        return steps
+    
+    @property
+    def alpha(self) -> float:
+        """직전 스텝에서 다음 스텝까지 렌더 시점의 비율 (0~1, 측정 모드는 항상 1)"""
+        if not self.fixed:
+            return 1.0
+        return self.accumulator / self.step
+    
+    def since(self, stamp: float) -> float:
+        """stamp(이 시계의 now 값) 이후 지난 시뮬레이션 시간"""
+        return self.now - stamp
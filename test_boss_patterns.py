@@ -0,0 +1,85 @@
+# tests/test_boss_patterns.py
+"""
+보스 패턴 코루틴 테스트
+"""
+import pytest
+import pygame
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+import boss_patterns
+from boss_patterns import BOSS_PATTERNS
+from enemy import Enemy
+from bullet import EnemyBulletGroup
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _boss():
+    """편대 (300, 80)에 있는 보스"""
+    image = pygame.Surface((50, 40))
+    return Enemy(300, 80, Enemy.TYPE_BOSS, image, image)
+
+
+@pytest.mark.parametrize("name, duration", [('dive', 'DIVE_DURATION'), ('spiral', 'SPIRAL_DURATION'),
+                                            ('strafe', 'STRAFE_DURATION')])
+def test_pattern_runs_for_duration_and_fires_batches(pygame_init, monkeypatch, name, duration):
+    """패턴이 지속 시간 동안 진행되며 yield한 탄환 묶음을 shoot이 발사하는지 테스트"""
+    monkeypatch.setattr(settings, 'SIM_STEP_MS', 16)  # 틱 수를 정확히 세도록 정수 스텝
+    boss = _boss()
+    bullets = EnemyBulletGroup()
+    boss.start_pattern(name, 0.9)
+    
+    ticks = 0
+    fired = 0
+    while boss.boss_pattern == name:
+        boss.update(0.01)
+        boss.shoot(bullets, 0.01)
+        fired += len(bullets)
+        for bullet in bullets:
+            assert abs(bullet.rect.centerx - boss.rect.centerx) <= 15
+        bullets.empty()
+        ticks += 1
+    
+    # 시작한 틱을 포함해 지속 시간만큼 진행 후 편대 복귀
+    assert ticks == -(-getattr(boss_patterns, duration) // 16)
+    assert boss.pattern is None and boss.pending_shots == []
+    assert fired > 0
+
+
+def test_registered_pattern_is_picked_up(pygame_init, monkeypatch):
+    """새 패턴을 등록하면 무작위 선택과 발사에 바로 쓰이는지 테스트"""
+    def hover_pattern(boss, detail):
+        barrage = {'shape': 'fan', 'count': 2, 'spread': 60, 'cadence': 0}
+        yield []
+        for tick in range(3):
+            boss.rect.y += 10
+            yield [(barrage, boss.rect.centerx, boss.rect.bottom, 0)]
+    
+    monkeypatch.setitem(BOSS_PATTERNS, 'hover', hover_pattern)
+    boss = _boss()
+    bullets = EnemyBulletGroup()
+    
+    boss._start_random_pattern(0.99)  # 마지막에 등록된 패턴 구간
+    assert boss.boss_pattern == 'hover'
+    for tick in range(3):
+        boss.update(0.5)
+        boss.shoot(bullets, 0.5)
+    assert boss.rect.y == 110 and len(bullets) == 6
+    
+    boss.update(0.5)
+    assert boss.boss_pattern == 'idle'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
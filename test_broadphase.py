@@ -0,0 +1,241 @@
+# tests/test_broadphase.py
+"""
+공간 분할(broad-phase) 테스트
+"""
+import pytest
+import pygame
+import random
+import numpy as np
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+from bullet import Bullet, EnemyBulletGroup, WEAPON_NORMAL, WEAPON_LASER, WEAPON_RAILGUN
+from enemy import Enemy
+from broadphase import SpatialHash, SweepAndPrune
+from collision import check_bullet_enemy_collision, check_player_bullet_collision
+from collision_kernel import overlap_pairs
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _brute_force_collision(bullets, enemies):
+    """기존 전수 검사 방식 (비교 기준)"""
+    score = 0
+    hit_positions = []
+    boss_killed_positions = []
+    split_children = []
+    
+    for bullet in list(bullets):
+        for enemy in list(enemies):
+            if pygame.sprite.collide_rect(bullet, enemy):
+                if not bullet.can_hit(enemy):
+                    continue
+                pos = (enemy.rect.centerx, enemy.rect.centery)
+                if bullet.piercing:
+                    bullet.register_hit(enemy)
+                else:
+                    bullet.kill()
+                if enemy.can_split():
+                    split_children.extend(enemy.get_split_children())
+                if enemy.take_damage(bullet.damage):
+                    score += enemy.get_score_value()
+                    if enemy.is_boss:
+                        boss_killed_positions.append(pos)
+                    else:
+                        hit_positions.append(pos)
+                if not bullet.piercing:
+                    break
+    
+    return score, hit_positions, boss_killed_positions, split_children
+
+
+def _make_world(seed):
+    """같은 시드로 동일한 적/탄환 배치 생성"""
+    rng = random.Random(seed)
+    image = pygame.Surface((30, 30))
+    bullet_image = pygame.Surface((10, 10))
+    types = [Enemy.TYPE_NORMAL, Enemy.TYPE_BOSS, Enemy.TYPE_TANK, Enemy.TYPE_SPLITTER]
+    
+    enemies = pygame.sprite.Group()
+    for _ in range(60):
+        enemies.add(Enemy(rng.randint(0, 400), rng.randint(0, 300),
+                          rng.choice(types), image, bullet_image))
+    
+    bullets = pygame.sprite.Group()
+    weapons = [WEAPON_NORMAL, WEAPON_LASER, WEAPON_RAILGUN]
+    for _ in range(80):
+        bullets.add(Bullet(rng.randint(0, 420), rng.randint(0, 320), 'player',
+                           bullet_image, damage=rng.randint(1, 3),
+                           weapon_type=rng.choice(weapons)))
+    return bullets, enemies
+
+
+def test_query_returns_overlapping_in_insertion_order(pygame_init):
+    """겹치는 칸의 후보를 삽입 순서대로 반환하는지 테스트"""
+    sprites = []
+    for x in (0, 40, 200):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(x, 0, 30, 30)
+        sprites.append(sprite)
+    
+    spatial_hash = SpatialHash(50)
+    spatial_hash.rebuild(reversed(sprites))
+    
+    found = spatial_hash.query_rect(pygame.Rect(20, 0, 40, 10))
+    assert found == [sprites[1], sprites[0]]
+    assert spatial_hash.query_rect(pygame.Rect(600, 600, 5, 5)) == []
+
+
+@pytest.mark.parametrize("radius", [0, 25, 90, 800])
+def test_query_radius_matches_brute_force(pygame_init, radius):
+    """원 범위 질의가 전수 제곱 거리 검사와 같은 결과를 삽입 순서로 반환하는지 테스트"""
+    rng = random.Random(radius)
+    sprites = []
+    for _ in range(200):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rng.randint(-40, 700), rng.randint(-40, 900),
+                                  rng.randint(20, 50), rng.randint(20, 45))
+        sprites.append(sprite)
+    spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+    spatial_hash.rebuild(sprites)
+    
+    for x, y in [(360, 480), (0, 0), (sprites[3].rect.centerx, sprites[3].rect.centery)]:
+        expected = [s for s in sprites
+                    if (s.rect.centerx - x) ** 2 + (s.rect.centery - y) ** 2 <= radius ** 2]
+        assert spatial_hash.query_radius(x, y, radius) == expected
+
+
+@pytest.mark.parametrize("count", [1, 5, 40, 300])
+def test_query_nearest_matches_brute_force(pygame_init, count):
+    """최근접 질의가 전수 검사와 같은 스프라이트를 고르는지 테스트 (거리가 같으면 먼저 삽입된 것)"""
+    rng = random.Random(count)
+    sprites = []
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        # 격자에 맞춘 좌표로 거리가 같은 후보를 자주 만듦
+        sprite.rect = pygame.Rect(0, 0, rng.choice((30, 50)), 30)
+        sprite.rect.center = (rng.randrange(-40, 760, 20), rng.randrange(-40, 1000, 20))
+        sprites.append(sprite)
+    spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+    spatial_hash.rebuild(sprites)
+    excluded = set(sprites[::3])
+    
+    for _ in range(100):
+        x, y = rng.randrange(-200, 920, 10), rng.randrange(-200, 1160, 10)
+        distances = [(s.rect.centerx - x) ** 2 + (s.rect.centery - y) ** 2 for s in sprites]
+        assert spatial_hash.query_nearest(x, y) is sprites[distances.index(min(distances))]
+        
+        allowed = [(d, i) for i, (d, s) in enumerate(zip(distances, sprites)) if s not in excluded]
+        expected = sprites[min(allowed)[1]] if allowed else None
+        assert spatial_hash.query_nearest(x, y, lambda s: s not in excluded) is expected
+    
+    assert SpatialHash().query_nearest(0, 0) is None
+
+
+@pytest.mark.parametrize("use_hash", [True, False])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_brute_force(pygame_init, seed, use_hash):
+    """전수 검사와 결과가 동일한지 테스트 (공간 해시 / NumPy 커널, 관통, 분열 포함)"""
+    bullets_a, enemies_a = _make_world(seed)
+    bullets_b, enemies_b = _make_world(seed)
+    
+    expected = _brute_force_collision(bullets_a, enemies_a)
+    spatial_hash = None
+    if use_hash:
+        spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+        spatial_hash.rebuild(enemies_b)
+    result = check_bullet_enemy_collision(bullets_b, enemies_b, spatial_hash)
+    
+    assert result[:3] == expected[:3]
+    assert [c.rect.topleft for c in result[3]] == [c.rect.topleft for c in expected[3]]
+    assert [e.hp for e in enemies_b] == [e.hp for e in enemies_a]
+    assert len(bullets_b) == len(bullets_a)
+
+
+def test_swept_paths_agree_on_moving_bullets(pygame_init):
+    """빠르게 움직인 탄환에 대해 공간 해시와 NumPy 커널의 결과가 같은지 테스트"""
+    results = []
+    for use_hash in (True, False):
+        bullets, enemies = _make_world(4)
+        for bullet in bullets:
+            bullet.speed_y *= 6  # 30Hz 이하 시뮬레이션 수준의 이동량
+        bullets.update()
+        
+        spatial_hash = None
+        if use_hash:
+            spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+            spatial_hash.rebuild(enemies)
+        result = check_bullet_enemy_collision(bullets, enemies, spatial_hash)
+        results.append((result[:3], [e.hp for e in enemies], len(bullets)))
+    
+    assert results[0] == results[1]
+    assert results[0][0][0] > 0
+
+
+def test_overlap_pairs_order(pygame_init):
+    """겹침 쌍이 이중 루프 순서(a 우선, b 순서)로 반환되는지 테스트"""
+    a = np.array([[0, 0, 10, 10], [100, 100, 110, 110], [5, 5, 20, 20]], dtype=np.int32)
+    b = np.array([[8, 8, 30, 30], [0, 0, 6, 6], [500, 500, 510, 510]], dtype=np.int32)
+    
+    pairs = overlap_pairs(a, b).tolist()
+    assert pairs == [[0, 0], [0, 1], [2, 0], [2, 1]]
+    assert overlap_pairs(a, b[:0]).shape == (0, 2)
+
+
+def test_sweep_and_prune_tracks_moving_bullets(pygame_init):
+    """이동하는 적 탄환에서 그룹 순서상 첫 충돌 탄환을 찾는지 테스트"""
+    rng = random.Random(7)
+    bullet_image = pygame.Surface((10, 10))
+    bullets = pygame.sprite.Group()
+    for _ in range(200):
+        bullets.add(Bullet(rng.randint(0, 720), rng.randint(0, 960), 'enemy',
+                           bullet_image, angle=rng.choice([0, 30, -30, 120])))
+    player_rect = pygame.Rect(300, 800, 40, 48)
+    sweep = SweepAndPrune()
+    
+    for _ in range(60):
+        bullets.update()
+        sweep.update(bullets)
+        assert sweep.tops == sorted(sweep.tops)
+        assert len(sweep) == len(bullets)
+        
+        expected = next((b for b in bullets if b.rect.colliderect(player_rect)), None)
+        assert sweep.first_overlap(player_rect) is expected
+
+
+def test_enemy_bullet_group_keeps_sweep_in_sync(pygame_init):
+    """적 탄환 그룹의 추가/제거가 sweep-and-prune에 반영되는지 테스트"""
+    bullet_image = pygame.Surface((10, 10))
+    player = pygame.sprite.Sprite()
+    player.image = pygame.Surface((40, 30))
+    player.rect = player.image.get_rect(center=(100, 100))
+    pygame.sprite.Group(player)
+    
+    near = Bullet(100, 90, 'enemy', bullet_image)
+    far = Bullet(400, 90, 'enemy', bullet_image)
+    bullets = EnemyBulletGroup(far, near)
+    bullets.update()
+    assert len(bullets.sweep) == 2
+    
+    near.kill()
+    assert not check_player_bullet_collision(player, bullets)
+    bullets.add(near)
+    bullets.update()
+    assert check_player_bullet_collision(player, bullets)
+    assert len(bullets) == 1
+    bullets.update()
+    assert len(bullets.sweep) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,180 @@
+# tests/test_bullet.py
+"""
+탄환 클래스 테스트
+"""
+import pytest
+import pygame
+import math
+import random
+import numpy as np
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+from bullet import (Bullet, BulletPool, PlayerBulletGroup, WEAPON_LASER,
+                    WEAPON_PLASMA, WEAPON_WAVE, WEAPON_HOMING, steer_homing)
+from broadphase import SpatialHash
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_bullets_share_atlas_images(pygame_init):
+    """같은 (무기, 데미지 단계, 각도) 탄환이 이미지를 공유하는지 테스트"""
+    source = pygame.Surface((10, 10))
+    
+    first = Bullet(100, 100, 'player', source, angle=15, weapon_type=WEAPON_LASER)
+    second = Bullet(300, 300, 'player', source, angle=15, weapon_type=WEAPON_LASER)
+    assert first.image is second.image
+    assert Bullet(0, 0, 'player', source, angle=-15, weapon_type=WEAPON_LASER).image is not first.image
+    
+    # 일반탄은 데미지 2 이상이면 강화 이미지 (회전하지 않음)
+    weak = Bullet(0, 0, 'player', source, damage=1, angle=30)
+    strong = Bullet(0, 0, 'player', source, damage=2, angle=30)
+    assert strong.image is Bullet(0, 0, 'player', source, damage=3, angle=0).image
+    assert weak.image is not strong.image
+    assert strong.image.get_size() == (10, 19)
+    
+    # 적 탄환은 원본 이미지를 그대로 쓰거나 회전 결과를 공유
+    assert Bullet(0, 0, 'enemy', source).image is source
+    assert (Bullet(0, 0, 'enemy', source, angle=120).image is
+            Bullet(5, 5, 'enemy', source, angle=120).image)
+
+
+def test_velocity_table_matches_trig(pygame_init):
+    """각도별 속도 테이블이 직접 계산한 값과 같은지 테스트"""
+    source = pygame.Surface((10, 10))
+    
+    plasma = Bullet(0, 0, 'player', source, angle=-30, weapon_type=WEAPON_PLASMA)
+    base_speed = settings.BULLET_SPEED * 1.2
+    assert plasma.base_speed == base_speed
+    assert plasma.speed_x == math.sin(math.radians(-30)) * base_speed
+    assert plasma.speed_y == -math.cos(math.radians(-30)) * base_speed
+    
+    enemy = Bullet(0, 0, 'enemy', source, angle=45)
+    assert enemy.speed_x == math.sin(math.radians(45)) * settings.ENEMY_BULLET_SPEED
+    assert enemy.speed_y == math.cos(math.radians(45)) * settings.ENEMY_BULLET_SPEED
+
+
+def test_pool_recycles_killed_bullets(pygame_init):
+    """kill()된 탄환이 새 발사 정보로 초기화되어 재사용되는지 테스트"""
+    source = pygame.Surface((10, 10))
+    pool = BulletPool(max_size=2)
+    group = PlayerBulletGroup()
+    
+    laser = pool.acquire(100, 500, 'player', source, damage=2, weapon_type=WEAPON_LASER)
+    laser.register_hit(type('Target', (), {'entity_id': 7})())
+    laser.wave_offset = 3
+    group.add(laser)
+    laser.kill()
+    laser.kill()  # 중복 반납은 무시
+    assert pool.get_stats()['free'] == 1
+    
+    wave = pool.acquire(300, 200, 'enemy', source, angle=30, weapon_type=WEAPON_WAVE)
+    assert wave is laser
+    assert wave.bullet_type == 'enemy' and wave.damage == 1
+    assert wave.hits == set() and wave.wave_offset == 0
+    assert wave.rect.center == (300, 200)
+    assert (wave.prev_float_x, wave.prev_float_y) == (300.0, 200.0)
+    assert not wave.piercing
+    
+    stats = pool.get_stats()
+    assert (stats['hits'], stats['misses'], stats['in_use'], stats['high_water']) == (1, 1, 1, 1)
+
+
+def test_pool_free_list_is_bounded(pygame_init):
+    """빈 목록이 최대 크기를 넘지 않고 최대 사용량이 기록되는지 테스트"""
+    source = pygame.Surface((10, 10))
+    pool = BulletPool(max_size=2)
+    group = PlayerBulletGroup()
+    
+    for _ in range(5):
+        group.add(pool.acquire(100, 100, 'player', source))
+    group.empty()
+    
+    stats = pool.get_stats()
+    assert stats['free'] == 2
+    assert stats['discarded'] == 3
+    assert stats['in_use'] == 0
+    assert stats['high_water'] == 5
+
+
+
+@pytest.mark.parametrize("use_hash", [True, False])
+def test_homing_retargets_when_target_dies_or_on_interval(pygame_init, use_hash):
+    """호밍탄이 매 프레임이 아니라 타겟이 죽거나 주기마다 가장 가까운 적을 다시 찾는지 테스트"""
+    def make_enemy(x, y):
+        enemy = pygame.sprite.Sprite()
+        enemy.rect = pygame.Rect(0, 0, 30, 30)
+        enemy.rect.center = (x, y)
+        return enemy
+    
+    near, far, late = make_enemy(300, 300), make_enemy(500, 100), make_enemy(900, 900)
+    enemies = pygame.sprite.Group(near, far, late)
+    spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE) if use_hash else None
+    bullet = Bullet(300, 600, 'player', pygame.Surface((10, 10)), weapon_type=WEAPON_HOMING)
+    
+    def step():
+        if spatial_hash is not None:
+            spatial_hash.rebuild(enemies)
+        bullet.update(enemies, spatial_hash)
+    
+    step()
+    assert bullet.target is near
+    
+    # 더 가까운 적이 생겨도 주기 전에는 타겟 유지
+    late.rect.center = bullet.rect.center
+    for _ in range(settings.HOMING_RETARGET_FRAMES - 1):
+        step()
+        assert bullet.target is near
+    step()
+    assert bullet.target is late
+    
+    # 타겟이 죽으면 바로 다시 찾음
+    late.kill()
+    step()
+    assert bullet.target is near
+
+
+
+def test_batch_steering_matches_per_sprite(pygame_init):
+    """일괄 조향 커널이 탄환별 steer()와 같은 속도를 계산하는지 테스트 (각도 보정 포함)"""
+    rng = random.Random(0)
+    image = pygame.Surface((10, 10))
+    bullets = []
+    for i in range(500):
+        bullet = Bullet(360, 480, 'player', image, weapon_type=WEAPON_HOMING,
+                        angle=rng.choice((-45, -15, 0, 15, 45)))
+        bullet.speed_x, bullet.speed_y = rng.uniform(-6, 6), rng.uniform(-6, 6)
+        bullet.target = pygame.sprite.Sprite()
+        bullet.target.rect = pygame.Rect(0, 0, 30, 30)
+        # 바로 뒤(-pi/pi 경계)와 같은 위치도 포함
+        bullet.target.rect.center = ((360, 480) if i % 50 == 0 else
+                                     (360, 600) if i % 50 == 1 else
+                                     (rng.randint(0, 720), rng.randint(0, 960)))
+        bullets.append(bullet)
+    
+    dx = np.array([b.target.rect.centerx - b.rect.centerx for b in bullets])
+    dy = np.array([b.target.rect.centery - b.rect.centery for b in bullets])
+    new_x, new_y = steer_homing(np.array([b.speed_x for b in bullets]),
+                                np.array([b.speed_y for b in bullets]),
+                                dx, dy, np.array([b.base_speed for b in bullets]))
+    for bullet in bullets:
+        bullet.steer()
+    
+    # 같은 식이지만 NumPy arctan2와 math.atan2는 마지막 비트가 다를 수 있음
+    assert np.allclose(new_x, [b.speed_x for b in bullets], rtol=0, atol=1e-12)
+    assert np.allclose(new_y, [b.speed_y for b in bullets], rtol=0, atol=1e-12)
+    assert (new_x[0], new_y[0]) == (bullets[0].speed_x, bullets[0].speed_y)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,124 @@
+# tests/test_bullet_engine.py
+"""
+배열 기반 탄환 엔진 테스트
+"""
+import pytest
+import pygame
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+from bullet import Bullet, EnemyBulletGroup, bullet_pool
+from bullet_engine import BulletArray
+from player import Player
+from enemy import Enemy
+from collision import check_player_bullet_collision
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _fan(image):
+    """화면 곳곳에서 여러 각도로 발사된 적 탄환"""
+    return [Bullet(x, y, 'enemy', image, angle=angle)
+            for x in (5, 200, 715) for y in (5, 480, 950) for angle in (-60, -15, 0, 30, 90, 180)]
+
+
+def test_matches_sprite_bullets(pygame_init):
+    """배열 엔진의 이동/화면 밖 정리/그리기가 스프라이트 탄환과 같은지 테스트"""
+    image = pygame.Surface((8, 8), pygame.SRCALPHA)
+    pygame.draw.circle(image, (255, 80, 80), (4, 4), 4)
+    
+    group = pygame.sprite.Group(_fan(image))
+    array = BulletArray(capacity=4)  # 용량 확장도 함께 검사
+    array.add(*_fan(image))
+    
+    for _ in range(120):
+        group.update()
+        array.update()
+        rects, _ = array.pack_rects()
+        assert sorted(map(tuple, rects.tolist())) == sorted(
+            (b.rect.left, b.rect.top, b.rect.right, b.rect.bottom) for b in group)
+    
+    expected = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    actual = expected.copy()
+    group.draw(expected)
+    array.draw(actual)
+    assert len(array) == len(group) > 0
+    assert pygame.image.tostring(actual, 'RGB') == pygame.image.tostring(expected, 'RGB')
+
+
+def test_add_returns_sprites_to_pool(pygame_init):
+    """스프라이트를 배열로 옮기면 탄환 풀에 바로 반납되는지 테스트"""
+    image = pygame.Surface((10, 10))
+    array = BulletArray()
+    in_use = bullet_pool.in_use
+    
+    array.add(*[bullet_pool.acquire(100, 100 + i, 'enemy', image) for i in range(5)])
+    
+    assert len(array) == 5
+    assert bullet_pool.in_use == in_use
+    array.empty()
+    assert len(array) == 0
+
+
+def test_enemy_fan_spawns_without_sprites(pygame_init, monkeypatch):
+    """배열 엔진으로 쏜 적 부채꼴 탄이 스프라이트 없이 들어가고 스프라이트 탄과 같은 위치/이미지인지 테스트"""
+    monkeypatch.setattr(settings, 'ENEMY_SHOT_COUNT', 5)
+    image = pygame.Surface((6, 12), pygame.SRCALPHA)
+    pygame.draw.rect(image, (255, 80, 80), (1, 0, 4, 12))
+    enemy = Enemy(300, 200, Enemy.TYPE_NORMAL, image, image)
+    enemy.in_formation = True
+    expected = pygame.sprite.Group(
+        Bullet(enemy.rect.centerx, enemy.rect.bottom, 'enemy', image, angle=(i - 2) * settings.ENEMY_SHOT_SPREAD)
+        for i in range(5))
+    
+    monkeypatch.setattr(bullet_pool, 'acquire', None)  # 스프라이트를 만들면 실패
+    array = BulletArray()
+    enemy.shoot(array, 0.0)
+    
+    for _ in range(10):
+        expected.update()
+        array.update()
+    rects, _ = array.pack_rects()
+    assert sorted(map(tuple, rects.tolist())) == sorted(
+        (b.rect.left, b.rect.top, b.rect.right, b.rect.bottom) for b in expected)
+    assert sorted(map(id, array.images)) == sorted(set(id(b.image) for b in expected))
+
+
+@pytest.mark.parametrize("precise", [False, True])
+def test_player_hit_matches_sprite_group(pygame_init, monkeypatch, precise):
+    """플레이어 충돌 판정이 EnemyBulletGroup과 같은 탄환을 제거하는지 테스트"""
+    monkeypatch.setattr(settings, 'PRECISE_COLLISION', precise)
+    bullet_image = pygame.Surface((10, 10), pygame.SRCALPHA)
+    pygame.draw.circle(bullet_image, (255, 255, 255), (5, 5), 5)
+    player = Player(100, 100, pygame.Surface((40, 30)), bullet_image)
+    players = pygame.sprite.Group(player)  # alive() 판정용
+    positions = [(300, 300), (76, 81), (100, 100), (110, 112), (76, 81)]  # (76, 81)은 투명 모서리만 겹침
+    
+    group = EnemyBulletGroup(*[Bullet(x, y, 'enemy', bullet_image) for x, y in positions])
+    group.sweep.update()
+    array = BulletArray()
+    array.add(*[Bullet(x, y, 'enemy', bullet_image) for x, y in positions])
+    
+    hits = 0
+    while check_player_bullet_collision(player, group):
+        hits += 1
+        assert check_player_bullet_collision(player, array)
+        rects, _ = array.pack_rects()
+        assert sorted(map(tuple, rects.tolist())) == sorted(
+            (b.rect.left, b.rect.top, b.rect.right, b.rect.bottom) for b in group)
+    assert not check_player_bullet_collision(player, array)
+    assert hits == (2 if precise else 4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -11,7 +11,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import settings
-from bullet import Bullet
+from bullet import Bullet, WEAPON_LASER, WEAPON_RAILGUN, WEAPON_PLASMA
 from enemy import Enemy
 from player import Player
 from collision import *
@@ -25,6 +25,18 @@ def pygame_init():
     pygame.quit()
 
 
+@pytest.fixture(params=[True, False], ids=['hash', 'brute'])
+def broadphase(request):
+    """적 그룹으로 공간 해시를 만드는 함수 (brute면 None을 돌려 전체 순회 경로 검사)"""
+    def build(enemies):
+        if not request.param:
+            return None
+        spatial_hash = SpatialHash(settings.SPATIAL_HASH_CELL_SIZE)
+        spatial_hash.rebuild(enemies)
+        return spatial_hash
+    return build
+
+
 def test_bullet_enemy_collision(pygame_init):
     """탄환과 적 충돌 테스트"""
     # 더미 이미지 생성
@@ -40,9 +52,10 @@ def test_bullet_enemy_collision(pygame_init):
     bullets = pygame.sprite.Group(bullet)
     
     # 충돌 확인
-    score = check_bullet_enemy_collision(bullets, enemies)
+    score, hit_positions, boss_positions, children = check_bullet_enemy_collision(bullets, enemies)
     
     assert score == settings.SCORE_ENEMY
+    assert hit_positions == [(115, 115)] and boss_positions == [] and children == []
     assert len(enemies) == 0  # 적이 제거되었는지
     assert len(bullets) == 0  # 탄환이 제거되었는지
 
@@ -52,8 +65,9 @@ def test_player_bullet_collision(pygame_init):
     bullet_image = pygame.Surface((10, 10))
     player_image = pygame.Surface((40, 30))
     
-    # 플레이어 생성
+    # 플레이어 생성 (alive() 판정용 그룹에 등록)
     player = Player(100, 100, player_image, bullet_image)
+    players = pygame.sprite.Group(player)
     
     # 적 탄환 생성 (플레이어와 같은 위치)
     enemy_bullet = Bullet(100, 100, 'enemy', bullet_image)
@@ -80,12 +94,118 @@ def test_no_collision_when_far(pygame_init):
     bullets = pygame.sprite.Group(bullet)
     
     # 충돌 확인
-    score = check_bullet_enemy_collision(bullets, enemies)
+    score, hit_positions, _, _ = check_bullet_enemy_collision(bullets, enemies)
     
-    assert score == 0
+    assert score == 0 and hit_positions == []
     assert len(enemies) == 1  # 적이 그대로 있는지
     assert len(bullets) == 1  # 탄환이 그대로 있는지
 
 
+def test_precise_collision_ignores_transparent_corner(pygame_init, monkeypatch, broadphase):
+    """정밀 충돌 모드에서 투명한 모서리만 겹치면 충돌하지 않는지 테스트"""
+    bullet_image = pygame.Surface((10, 10))
+    enemy_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+    pygame.draw.circle(enemy_image, (255, 0, 0), (15, 15), 10)
+    
+    def run(x, y):
+        enemies = pygame.sprite.Group(Enemy(100, 100, 'normal', enemy_image, bullet_image))
+        bullets = pygame.sprite.Group(Bullet(x, y, 'player', bullet_image))
+        check_bullet_enemy_collision(bullets, enemies, broadphase(enemies))
+        return len(enemies)
+    
+    assert run(102, 102) == 0  # 사각형만 검사
+    
+    monkeypatch.setattr(settings, 'PRECISE_COLLISION', True)
+    assert run(102, 102) == 1
+    assert run(115, 115) == 0
+
+
+def _coarse_step(bullet, dy):
+    """낮은 시뮬레이션 주기를 흉내내어 한 번에 dy만큼 이동"""
+    bullet.speed_x = 0
+    bullet.speed_y = dy
+    bullet.update()
+
+
+def test_swept_collision_catches_fast_bullet(pygame_init, broadphase):
+    """한 프레임에 적을 건너뛴 레일건 탄환도 맞는지 테스트"""
+    bullet_image = pygame.Surface((10, 10))
+    enemy_image = pygame.Surface((30, 30))
+    
+    enemy = Enemy(100, 300, 'normal', enemy_image, bullet_image)
+    enemies = pygame.sprite.Group(enemy)
+    bullet = Bullet(115, 450, 'player', bullet_image, damage=5, weapon_type=WEAPON_RAILGUN)
+    bullets = pygame.sprite.Group(bullet)
+    _coarse_step(bullet, -250)
+    assert not pygame.sprite.collide_rect(bullet, enemy)
+    
+    score, hit_positions, _, _ = check_bullet_enemy_collision(bullets, enemies, broadphase(enemies))
+    
+    assert score > 0
+    assert hit_positions == [(115, 315)]
+    assert len(bullets) == 1  # 관통 무기
+
+
+def test_swept_collision_orders_hits_by_time_of_impact(pygame_init, broadphase):
+    """관통 탄환이 그룹 순서가 아니라 먼저 닿은 적부터 처리하는지 테스트"""
+    bullet_image = pygame.Surface((10, 10))
+    enemy_image = pygame.Surface((30, 30))
+    
+    far = Enemy(100, 100, 'normal', enemy_image, bullet_image)
+    near = Enemy(100, 300, 'normal', enemy_image, bullet_image)
+    enemies = pygame.sprite.Group(far, near)
+    bullet = Bullet(115, 500, 'player', bullet_image, weapon_type=WEAPON_LASER)
+    bullets = pygame.sprite.Group(bullet)
+    _coarse_step(bullet, -450)
+    
+    _, hit_positions, _, _ = check_bullet_enemy_collision(bullets, enemies, broadphase(enemies))
+    
+    assert hit_positions == [(115, 315), (115, 115)]
+
+
+def test_plasma_splash_damages_nearby_enemies(pygame_init, broadphase):
+    """플라즈마 탄환이 반경 안의 주변 적에게만 범위 피해를 주는지 테스트"""
+    bullet_image = pygame.Surface((10, 10))
+    enemy_image = pygame.Surface((30, 30))
+    
+    target = Enemy(100, 300, 'tank', enemy_image, bullet_image)
+    near = Enemy(140, 300, 'tank', enemy_image, bullet_image)
+    far = Enemy(100 + settings.PLASMA_SPLASH_RADIUS + 40, 300, 'tank', enemy_image, bullet_image)
+    enemies = pygame.sprite.Group(target, near, far)
+    hp = target.hp
+    bullet = Bullet(target.rect.centerx, target.rect.centery, 'player', bullet_image,
+                    damage=2, weapon_type=WEAPON_PLASMA)
+    bullets = pygame.sprite.Group(bullet)
+    
+    check_bullet_enemy_collision(bullets, enemies, broadphase(enemies))
+    
+    splash = max(1, int(2 * settings.PLASMA_SPLASH_DAMAGE_RATIO))
+    assert target.hp == hp - 2
+    assert near.hp == hp - splash
+    assert far.hp == hp
+    assert len(bullets) == 0
+
+
+def test_pierce_registry_uses_stable_entity_ids(pygame_init):
+    """관통 기록이 id() 대신 재사용되지 않는 적 고유 번호를 쓰는지 테스트"""
+    bullet_image = pygame.Surface((10, 10))
+    enemy_image = pygame.Surface((30, 30))
+    
+    first = Enemy(100, 100, 'splitter', enemy_image, bullet_image)
+    children = first.get_split_children()
+    ids = [first.entity_id] + [child.entity_id for child in children]
+    assert len(set(ids)) == 3
+    
+    bullet = Bullet(115, 115, 'player', bullet_image, weapon_type=WEAPON_LASER)
+    bullet.register_hit(first)
+    assert not bullet.can_hit(first)
+    assert all(bullet.can_hit(child) for child in children)
+    
+    del first
+    replacement = Enemy(100, 100, 'normal', enemy_image, bullet_image)
+    assert bullet.can_hit(replacement)
+    assert bullet.hits == {ids[0]}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,110 @@
+# tests/test_emitter.py
+"""
+탄막 발사기 테스트
+"""
+import pytest
+import pygame
+import math
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bullet import Bullet, EnemyBulletGroup
+from bullet_engine import BulletArray
+from emitter import BARRAGES, Emitter, barrage_angles, emit
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _velocities(bullets):
+    """탄환 그룹의 (중심, 속도) 목록"""
+    return sorted((b.rect.center, round(b.speed_x, 9), round(b.speed_y, 9)) for b in bullets)
+
+
+def test_barrage_shapes():
+    """링은 360도를 고르게, 부채꼴은 기준 각도를 가운데로 나누는지 테스트"""
+    ring = {'shape': 'ring', 'count': 8}
+    fan = {'shape': 'fan', 'count': 5, 'spread': 10}
+    
+    assert barrage_angles(ring, 5).tolist() == [5 + i * 45 for i in range(8)]
+    assert barrage_angles(fan, 30).tolist() == [10, 20, 30, 40, 50]
+
+
+def test_emit_matches_single_bullets(pygame_init):
+    """한 번에 넣은 탄막이 각도별로 하나씩 만든 적 탄환과 같은 위치/속도인지 테스트"""
+    image = pygame.Surface((10, 10))
+    barrage = {'shape': 'ring', 'count': 12, 'spacing': 0}
+    
+    group = EnemyBulletGroup()
+    assert emit(group, barrage, 200, 300, 7, image) == 12
+    expected = [Bullet(200, 300, 'enemy', image, angle=7 + i * 30) for i in range(12)]
+    
+    assert _velocities(group) == _velocities(expected)
+    assert all(bullet.image is image for bullet in group)
+    group.empty()
+
+
+def test_emit_into_bullet_array(pygame_init):
+    """배열 탄환 엔진에도 같은 탄막이 한 번에 들어가는지 테스트"""
+    image = pygame.Surface((10, 10))
+    group = EnemyBulletGroup()
+    array = BulletArray()
+    
+    for barrage in BARRAGES.values():
+        emit(group, barrage, 360, 200, 15, image)
+        emit(array, barrage, 360, 200, 15, image)
+    for _ in range(30):
+        group.update()
+        array.update()
+    
+    rects, _ = array.pack_rects()
+    assert len(array) == len(group) == sum(barrage['count'] for barrage in BARRAGES.values())
+    assert sorted(map(tuple, rects.tolist())) == sorted(
+        (b.rect.left, b.rect.top, b.rect.right, b.rect.bottom) for b in group)
+    group.empty()
+
+
+def test_aimed_fan_points_at_target(pygame_init):
+    """조준 부채꼴 가운데 탄이 목표 방향으로 날아가는지 테스트"""
+    image = pygame.Surface((10, 10))
+    group = EnemyBulletGroup()
+    barrage = {'shape': 'aimed_fan', 'count': 3, 'spread': 20, 'speed': 6}
+    
+    emit(group, barrage, 100, 100, 0, image, target=(400, 500))
+    
+    directions = sorted(math.degrees(math.atan2(b.speed_x, b.speed_y)) for b in group)
+    aim = math.degrees(math.atan2(300, 400))
+    assert directions == pytest.approx([aim - 20, aim, aim + 20])
+    assert all(math.hypot(b.speed_x, b.speed_y) == pytest.approx(6) for b in group)
+    group.empty()
+
+
+def test_emitter_cadence_spin_and_sway():
+    """발사 간격, 틱당 회전, 물결 흔들림이 설정대로 진행되는지 테스트"""
+    spiral = Emitter({'shape': 'ring', 'count': 3, 'spin': 5, 'cadence': 150})
+    fired = [(tick, angle) for tick in range(40) for angle in [spiral.tick(dt=16)] if angle is not None]
+    
+    # 150ms 간격 = 16ms 틱으로 10틱마다
+    assert [tick for tick, _ in fired] == [0, 10, 20, 30]
+    assert [angle for _, angle in fired] == [5, 55, 105, 155]
+    
+    # 확률 판정을 통과할 때만 발사하고, 발사 간격은 발사한 틱부터 다시 셈
+    chance = Emitter({'shape': 'fan', 'count': 1, 'cadence': 0, 'chance': 0.1})
+    assert chance.tick(0.5, 16) is None and chance.tick(0.05, 16) == 0
+    
+    wave = Emitter({'shape': 'wave', 'count': 5, 'spread': 8, 'sway': 40, 'sway_period': 64,
+                    'cadence': 16})
+    angles = [wave.tick(dt=16) for _ in range(4)]
+    assert angles == pytest.approx([40, 0, -40, 0], abs=1e-9)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
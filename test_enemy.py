@@ -0,0 +1,79 @@
+# tests/test_enemy.py
+"""
+적 클래스 테스트
+"""
+import pytest
+import pygame
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+from enemy import Enemy
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_type_images_are_shared(pygame_init):
+    """같은 타입의 적이 이미지를 새로 그리지 않고 공유하는지 테스트"""
+    base_image = pygame.Surface((36, 36))
+    bullet_image = pygame.Surface((10, 10))
+    
+    normals = [Enemy(0, 0, Enemy.TYPE_NORMAL, base_image, bullet_image) for _ in range(2)]
+    tanks = [Enemy(0, 0, Enemy.TYPE_TANK, base_image, bullet_image) for _ in range(2)]
+    splitter = Enemy(0, 0, Enemy.TYPE_SPLITTER, base_image, bullet_image)
+    children = splitter.get_split_children()
+    
+    assert normals[0].image is base_image and normals[1].image is base_image
+    assert tanks[0].image is tanks[1].image
+    assert children[0].image is children[1].image
+    assert children[0].image is not splitter.image
+    assert children[0].image.get_size() == (24, 24)
+
+
+def test_hit_flash_keeps_shared_image(pygame_init):
+    """피격 효과가 공유 이미지를 수정하지 않는지 테스트"""
+    base_image = pygame.Surface((36, 36))
+    bullet_image = pygame.Surface((10, 10))
+    
+    hit = Enemy(0, 0, Enemy.TYPE_TANK, base_image, bullet_image)
+    other = Enemy(0, 0, Enemy.TYPE_TANK, base_image, bullet_image)
+    shared = other.image
+    before = pygame.image.tostring(shared, 'RGBA')
+    
+    assert not hit.take_damage(1)
+    assert hit.image is not shared
+    assert pygame.image.tostring(shared, 'RGBA') == before
+
+
+def test_hit_flash_restores_base_image(pygame_init):
+    """피격 효과가 공유된 밝은 이미지로 바뀌었다가 정해진 프레임 뒤 복귀하는지 테스트"""
+    base_image = pygame.Surface((36, 36))
+    bullet_image = pygame.Surface((10, 10))
+    
+    first = Enemy(0, 0, Enemy.TYPE_BOSS, base_image, bullet_image)
+    second = Enemy(0, 0, Enemy.TYPE_BOSS, base_image, bullet_image)
+    first.take_damage(1)
+    second.take_damage(1)
+    assert first.image is second.image is first.flash_image
+    
+    first.take_damage(1)
+    assert first.image is first.flash_image  # 연속 피격에도 더 밝아지지 않음
+    
+    for _ in range(settings.ENEMY_HIT_FLASH_FRAMES - 1):
+        first.update()
+    assert first.image is first.flash_image
+    first.update()
+    assert first.image is base_image
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
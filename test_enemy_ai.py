@@ -0,0 +1,130 @@
+# tests/test_enemy_ai.py
+"""
+적 AI 일괄 난수 판정 테스트
+"""
+import pytest
+import pygame
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from enemy import Enemy
+from bullet import EnemyBulletGroup
+from enemy_ai import EnemyAI, ROLL_MOVE, ROLL_FIRE, ROLL_COUNT, ROLL_SKIP
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _mixed_enemies():
+    """타입이 섞인 적 그룹"""
+    image = pygame.Surface((30, 30))
+    types = [Enemy.TYPE_NORMAL, Enemy.TYPE_FAST, Enemy.TYPE_KAMIKAZE, Enemy.TYPE_TANK, Enemy.TYPE_BOSS]
+    enemies = pygame.sprite.Group()
+    for i in range(40):
+        enemy = Enemy(50 + (i % 10) * 60, 80 + (i // 10) * 50, types[i % len(types)], image, image)
+        enemy.fire_chance = 0.3  # 적은 프레임으로도 발사가 나오도록
+        enemies.add(enemy)
+    return enemies
+
+
+def test_shooters_match_per_enemy_rolls(pygame_init):
+    """발사 후보가 적별 난수와 발사 확률 비교 결과와 같은지 테스트"""
+    enemies = _mixed_enemies()
+    ai = EnemyAI(seed=7, slices={})  # 모든 적이 매 프레임 판정
+    
+    for _ in range(20):
+        listed, rolls, shooters = ai.decide(enemies)
+        assert listed == enemies.sprites()
+        assert len(rolls) == ROLL_COUNT and all(len(column) == len(listed) for column in rolls)
+        expected = [i for i, enemy in enumerate(listed)
+                    if enemy.is_boss or (enemy.enemy_type != Enemy.TYPE_KAMIKAZE
+                                         and rolls[ROLL_FIRE][i] < enemy.fire_chance)]
+        assert shooters == expected
+        
+        # 발사 후보에 같은 난수를 넘기면 일반 적은 반드시 발사
+        for index in shooters:
+            enemy = listed[index]
+            if not enemy.is_boss:
+                bullets = EnemyBulletGroup()
+                enemy.shoot(bullets, rolls[ROLL_FIRE][index])
+                assert len(bullets) > 0
+    
+    # 적 구성이 바뀌면 확률 배열도 다시 구성
+    listed[0].kill()
+    listed, rolls, shooters = ai.decide(enemies)
+    assert len(listed) == len(rolls[ROLL_FIRE]) == len(ai.fire_chances) == 39
+
+
+def test_seeded_stream_is_reproducible(pygame_init):
+    """같은 시드면 돌진/패턴 판정과 발사가 그대로 재현되는지 테스트"""
+    def run(seed):
+        enemies = _mixed_enemies()
+        bullets = EnemyBulletGroup()
+        ai = EnemyAI(seed=seed)
+        history = []
+        for _ in range(60):
+            listed, rolls, shooters = ai.decide(enemies)
+            for enemy, roll in zip(listed, rolls[ROLL_MOVE]):
+                enemy.update(roll)
+            for index in shooters:
+                listed[index].shoot(bullets, rolls[ROLL_FIRE][index])
+            history.append((shooters, [enemy.kamikaze_activated for enemy in listed],
+                            [(enemy.boss_pattern, enemy.dive_target_x) for enemy in listed]))
+        return history, len(bullets)
+    
+    assert run(3) == run(3)
+    assert run(3) != run(4)
+
+
+def test_time_slices_spread_rolls_across_frames(pygame_init):
+    """적 종류별 주기마다 한 번씩만 판정하고 판정 횟수를 기록하는지 테스트"""
+    enemies = _mixed_enemies()
+    ai = EnemyAI(seed=1, slices={'normal': 4, 'tank': 2, 'boss': 2})
+    
+    judged = {}
+    for frame in range(8):
+        listed, rolls, shooters = ai.decide(enemies)
+        due = [i for i, roll in enumerate(rolls[ROLL_MOVE]) if roll != ROLL_SKIP]
+        assert ai.updates == len(due)
+        assert set(shooters) <= set(due)
+        for i in due:
+            judged[i] = judged.get(i, 0) + 1
+    
+    for i, enemy in enumerate(listed):
+        expected = {Enemy.TYPE_NORMAL: 2, Enemy.TYPE_TANK: 4, Enemy.TYPE_BOSS: 4}.get(enemy.enemy_type, 8)
+        assert judged[i] == expected
+    
+    # 공격 패턴 중인 보스는 매 프레임 판정
+    boss = next(enemy for enemy in listed if enemy.is_boss)
+    boss.start_pattern('spiral')
+    for frame in range(4):
+        listed, rolls, shooters = ai.decide(enemies)
+        assert rolls[ROLL_FIRE][listed.index(boss)] != ROLL_SKIP
+
+
+def test_time_slices_preserve_fire_rate(pygame_init):
+    """N프레임에 한 번 판정해도 적 한 기의 프레임당 발사 수가 fire_chance로 유지되는지 테스트"""
+    image = pygame.Surface((30, 30))
+    enemies = pygame.sprite.Group(Enemy(0, 0, Enemy.TYPE_NORMAL, image, image) for _ in range(500))
+    for enemy in enemies:
+        enemy.fire_chance = 0.05
+    ai = EnemyAI(seed=11, slices={'normal': 4})
+    
+    frames = 400
+    fired = 0
+    for _ in range(frames):
+        fired += len(ai.decide(enemies)[2])
+    
+    assert fired / (len(enemies) * frames) == pytest.approx(0.05, abs=0.002)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,182 @@
+# tests/test_formation.py
+"""
+편대 컨트롤러 테스트
+"""
+import pytest
+import pygame
+import math
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+from enemy import Enemy
+from formation import FormationController
+from wave_manager import WaveManager
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _enemies(count):
+    """편대 위치가 정해진 일반 적"""
+    image = pygame.Surface((30, 30))
+    enemies = []
+    for i in range(count):
+        enemy = Enemy(0, -50, Enemy.TYPE_NORMAL, image, image)
+        enemy.formation_x = 50 + (i % 10) * 60
+        enemy.formation_y = 80 + (i // 10) * 50
+        enemies.append(enemy)
+    return enemies
+
+
+def test_idle_matches_per_enemy_sway(pygame_init):
+    """일괄 계산한 슬롯 위치가 적마다 계산하던 흔들림과 같은지 테스트"""
+    enemies = _enemies(35)
+    formation = FormationController(breathing=False)
+    for enemy in enemies:
+        formation.add(enemy)
+        enemy._idle_movement()
+        assert enemy.rect.topleft == (enemy.formation_x, enemy.formation_y)
+    
+    for ticks in (0, 16, 785, 12345, 987654):
+        formation.update(ticks)
+        for enemy in enemies:
+            enemy._idle_movement()
+            offset = math.sin(ticks * 0.002 + enemy.formation_phase) * 2
+            assert enemy.rect.topleft == (int(enemy.formation_x + offset), enemy.formation_y)
+
+
+def test_breathing_scales_around_center(pygame_init, monkeypatch):
+    """숨쉬기 동작이 편대 중심 기준으로 벌어졌다 모이는지 테스트"""
+    monkeypatch.setattr(settings, 'FORMATION_BREATH_AMPLITUDE', 0.1)
+    monkeypatch.setattr(settings, 'FORMATION_BREATH_PERIOD', 4000)
+    enemies = _enemies(20)
+    formation = FormationController(breathing=True)
+    for enemy in enemies:
+        formation.add(enemy)
+    
+    formation.update(1000)  # 최대로 벌어진 시점
+    left, right = enemies[0], enemies[9]
+    assert formation.xs[left.formation_slot] < left.formation_x - 20
+    assert formation.xs[right.formation_slot] > right.formation_x + 20
+    assert formation.ys[enemies[0].formation_slot] < enemies[0].formation_y
+    
+    formation.update(3000)  # 최대로 모인 시점
+    assert formation.xs[left.formation_slot] > left.formation_x + 20
+    assert formation.ys[enemies[19].formation_slot] < enemies[19].formation_y
+
+
+def test_split_children_join_parent_formation(pygame_init):
+    """분열로 생긴 자식도 부모 편대 슬롯에 등록되는지 테스트"""
+    image = pygame.Surface((30, 30))
+    formation = FormationController()
+    parent = Enemy(200, 100, Enemy.TYPE_SPLITTER, image, image)
+    formation.add(parent)
+    
+    children = parent.get_split_children()
+    
+    assert len(formation) == 3
+    assert [child.formation for child in children] == [formation, formation]
+    for child in children:
+        child._idle_movement()
+        assert child.rect.topleft == (child.formation_x, child.formation_y)
+
+
+def test_grid_counts_and_free_slots(pygame_init):
+    """슬롯 점유/반납에 따라 생존 수, 행/열 수, 빈 슬롯이 맞게 바뀌는지 테스트"""
+    formation = FormationController(3, 4, (50, 80), (60, 50))
+    enemies = _enemies(12)
+    for i, enemy in enumerate(enemies):
+        formation.place(enemy, i // 4, i % 4)
+    
+    assert formation.alive_count == 12 and formation.free_slot() is None
+    assert (enemies[6].formation_x, enemies[6].formation_y) == (170, 130)
+    assert formation.enemy_at(1, 2) is enemies[6]
+    
+    enemies[6].kill()
+    enemies[6].kill()  # 두 번 죽어도 한 번만 반납
+    enemies[9].kill()
+    
+    assert formation.alive_count == 10
+    assert formation.row_counts == [4, 3, 3] and formation.column_counts == [3, 2, 2, 3]
+    assert formation.is_free(1, 2) and formation.enemy_at(1, 2) is None
+    assert formation.free_slot() == 6 and formation.free_slot(row=2) == 9
+    assert formation.free_slot(row=0) is None
+
+
+def test_split_children_claim_neighbor_slots(pygame_init):
+    """분열 자식이 부모 옆 빈 슬롯을 차지하고, 격자가 가득 차면 추가 슬롯을 쓰는지 테스트"""
+    image = pygame.Surface((30, 30))
+    formation = FormationController(2, 5, (50, 80), (60, 50))
+    parent = Enemy(0, -50, Enemy.TYPE_SPLITTER, image, image)
+    formation.place(parent, 0, 2)
+    blocker = Enemy(0, -50, Enemy.TYPE_NORMAL, image, image)
+    formation.place(blocker, 0, 1)
+    
+    left, right = parent.get_split_children()
+    
+    assert formation.enemy_at(0, 0) is left and formation.enemy_at(0, 3) is right
+    assert (left.formation_x, left.formation_y) == (50, 80)
+    assert formation.alive_count == 4 and formation.row_count(0) == 4
+    
+    # 격자가 가득 찬 상태에서는 부모 옆 위치에 추가 슬롯 생성
+    for col in range(5):
+        formation.place(Enemy(0, -50, Enemy.TYPE_NORMAL, image, image), 1, col)
+    formation.place(Enemy(0, -50, Enemy.TYPE_NORMAL, image, image), 0, 4)
+    second = Enemy(0, -50, Enemy.TYPE_SPLITTER, image, image)
+    formation.add(second)
+    second.formation_x = 400
+    children = second.get_split_children()
+    
+    assert len(formation) == 13 and formation.alive_count == 13
+    assert [child.formation_x for child in children] == [380, 420]
+    children[0].kill()
+    assert formation.alive_count == 12 and formation.free_slot() is None
+
+
+def test_split_children_stay_near_parent_when_row_full(pygame_init):
+    """부모 주변 칸이 모두 차 있으면 멀리 있는 빈 슬롯 대신 부모 옆 추가 슬롯을 쓰는지 테스트"""
+    image = pygame.Surface((30, 30))
+    formation = FormationController(2, 8, (60, 80), (60, 50))
+    for slot in range(1, 16):
+        enemy_type = Enemy.TYPE_SPLITTER if slot == 14 else Enemy.TYPE_NORMAL
+        formation.place(Enemy(0, -50, enemy_type, image, image), slot // 8, slot % 8)
+    parent = formation.enemy_at(1, 6)
+    
+    children = parent.get_split_children()
+    
+    assert formation.is_free(0, 0)
+    assert [child.formation_slot for child in children] == [16, 17]
+    assert [(child.formation_x, child.formation_y) for child in children] == [(400, 130), (440, 130)]
+
+
+def test_wave_places_enemies_on_grid(pygame_init):
+    """웨이브 생성 시 모든 적이 편대 격자에 배치되는지 테스트"""
+    image = pygame.Surface((30, 30))
+    wave_manager = WaveManager(image, image, image)
+    
+    for wave_number in (1, settings.BONUS_STAGE_INTERVAL):
+        enemies = wave_manager.create_wave(wave_number)
+        formation = wave_manager.formation
+        
+        assert formation.alive_count == len(enemies) == len(formation)
+        assert formation.free_slot() is None
+        for enemy in enemies:
+            assert formation.entities[enemy.formation_slot] is enemy
+            assert (formation.xs[enemy.formation_slot], formation.ys[enemy.formation_slot]) == (
+                enemy.formation_x, enemy.formation_y)
+        for enemy in enemies:
+            enemy.kill()
+        assert formation.alive_count == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
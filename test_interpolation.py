@@ -0,0 +1,83 @@
+# tests/test_interpolation.py
+"""
+렌더 보간 테스트
+"""
+import pytest
+import pygame
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from interpolation import RenderInterpolator
+from bullet import EnemyBulletGroup
+from bullet_engine import BulletArray
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _sprite(x, y):
+    """(x, y)에 있는 10x10 스프라이트"""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((10, 10))
+    sprite.rect = sprite.image.get_rect(topleft=(x, y))
+    return sprite
+
+
+def test_apply_interpolates_and_restores():
+    """직전 스텝과 현재 스텝 사이에 그리고, 순간이동/새 스프라이트는 현재 위치 그대로 두는지 테스트"""
+    interpolator = RenderInterpolator(snap_distance=48)
+    moving, teleported = _sprite(100, 100), _sprite(100, 100)
+    group = pygame.sprite.Group(moving, teleported)
+    interpolator.snapshot([group])
+    
+    moving.rect.topleft = (110, 120)
+    teleported.rect.topleft = (400, 100)
+    spawned = _sprite(50, 50)
+    group.add(spawned)
+    
+    interpolator.apply(0.25, [group])
+    assert moving.rect.topleft == (102, 105)
+    assert teleported.rect.topleft == (400, 100)
+    assert spawned.rect.topleft == (50, 50)
+    
+    interpolator.restore()
+    assert moving.rect.topleft == (110, 120)
+    
+    interpolator.apply(1.0, [group])
+    assert moving.rect.topleft == (110, 120)
+
+
+@pytest.mark.parametrize("alpha", [0.0, 0.4, 1.0])
+def test_bullet_containers_draw_same_interpolated_frame(pygame_init, alpha):
+    """스프라이트 탄환 그룹과 배열 탄환이 같은 보간 위치에 그려지는지 테스트"""
+    image = pygame.Surface((6, 10))
+    image.fill((255, 255, 255))
+    xs, ys = [100.0, 200.0, 300.0], [100.0, 150.0, 200.0]
+    vxs, vys = [3.5, -2.25, 0.0], [5.0, 4.5, 7.75]
+    
+    group = EnemyBulletGroup()
+    array = BulletArray()
+    group.spawn_batch(xs, ys, vxs, vys, image)
+    array.spawn_batch(xs, ys, vxs, vys, image)
+    for _ in range(3):
+        group.update()
+        array.update()
+    
+    surfaces = [pygame.Surface((400, 300)) for _ in range(2)]
+    group.draw(surfaces[0], alpha)
+    array.draw(surfaces[1], alpha)
+    
+    assert pygame.image.tobytes(surfaces[0], 'RGB') == pygame.image.tobytes(surfaces[1], 'RGB')
+    group.empty()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
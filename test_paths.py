@@ -0,0 +1,125 @@
+# tests/test_paths.py
+"""
+진입 경로 테이블 테스트
+"""
+import pytest
+import pygame
+import math
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import settings
+import boss_patterns
+from enemy import Enemy
+from paths import PATH_SHAPES, SPLINE_SAMPLES, PathFollower, catmull_rom, get_path_table
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _polyline_point(points, distance):
+    """웨이포인트를 직접 따라가며 distance 지점 계산 (비교용)"""
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        if distance < length:
+            t = distance / length
+            return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+        distance -= length
+    return points[-1]
+
+
+@pytest.mark.parametrize("path_type", list(PATH_SHAPES))
+def test_follower_matches_polyline(path_type):
+    """공유 테이블 + 평행이동 결과가 웨이포인트를 직접 잇는 경로와 같은지 테스트"""
+    table = get_path_table(path_type)
+    assert get_path_table(path_type) is table
+    
+    start, origin, end = (130.0, -35.0), (115, -50), (415.0, 195.0)
+    offset = origin if table.relative else (0, 0)
+    points = [start] + [(x + offset[0], y + offset[1]) for x, y in table.points] + [end]
+    
+    follower = PathFollower(table, start, origin, end)
+    distance = 0.0
+    while True:
+        x, y, arrived = follower.advance(3.7)
+        distance += 3.7
+        if arrived:
+            break
+        expected = _polyline_point(points, distance)
+        assert x == pytest.approx(expected[0], abs=1e-9)
+        assert y == pytest.approx(expected[1], abs=1e-9)
+    
+    assert (x, y) == end
+    assert distance >= follower.length > distance - 3.7
+
+
+def test_entry_path_arrives_at_formation(pygame_init):
+    """진입 경로가 정해진 프레임 수 뒤 편대 위치에 정확히 도착하는지 테스트"""
+    image = pygame.Surface((30, 30))
+    enemies = []
+    for enemy_type, path_type in ((Enemy.TYPE_NORMAL, 'circle'), (Enemy.TYPE_FAST, 'fast_dive'),
+                                  (Enemy.TYPE_TANK, 'zigzag')):
+        enemy = Enemy(200, -50, enemy_type, image, image)
+        enemy.formation_x, enemy.formation_y = 300, 130
+        enemy.set_entry_path(path_type)
+        assert not enemy.in_formation
+        enemies.append(enemy)
+    
+    for enemy in enemies:
+        speed = enemy.speed * settings.ENEMY_ENTRY_SPEED_SCALE * (1.5 if enemy.enemy_type == Enemy.TYPE_FAST else 1)
+        frames = math.ceil(enemy.path.length / speed)
+        for _ in range(frames - 1):
+            enemy.update()
+            assert not enemy.in_formation
+        enemy.update()
+        assert enemy.rect.topleft == (300, 130)
+        enemy.update()
+        assert enemy.in_formation and enemy.path is None
+
+
+
+def test_catmull_rom_passes_through_control_points():
+    """스플라인 샘플이 모든 제어점을 지나고 구간 사이를 매끄럽게 잇는지 테스트"""
+    controls = [(0, 0), (100, 50), (150, 200), (40, 260), (0, 180)]
+    points = catmull_rom(controls)
+    
+    assert len(points) == (len(controls) - 1) * SPLINE_SAMPLES + 1
+    for i, control in enumerate(controls):
+        assert points[i * SPLINE_SAMPLES] == pytest.approx(control)
+    steps = [math.hypot(x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(points, points[1:])]
+    assert max(steps) < 20
+
+
+def test_boss_dive_follows_spline_and_returns(pygame_init, monkeypatch):
+    """보스 돌진이 목표 지점을 지나 편대 위치로 돌아와 대기 상태가 되는지 테스트"""
+    monkeypatch.setattr(boss_patterns, 'DIVE_DURATION', 10 ** 6)  # 시간 초과 전에 끝까지 돌아오도록
+    image = pygame.Surface((50, 40))
+    boss = Enemy(300, 80, Enemy.TYPE_BOSS, image, image)
+    boss.start_pattern('dive', 50.5 / (settings.SCREEN_WIDTH - 199))  # 목표 x = 150
+    assert (boss.dive_target_x, boss.dive_target_y) == (150, settings.SCREEN_HEIGHT - 150)
+    
+    reached_target = False
+    positions = []
+    for _ in range(1000):
+        boss.update(0.5)
+        reached_target |= boss.rect.center == (150, settings.SCREEN_HEIGHT - 150)
+        if boss.boss_pattern == 'idle':
+            break
+        positions.append(boss.rect.center)
+    
+    assert reached_target
+    assert boss.boss_pattern == 'idle' and boss.pattern is None
+    assert math.dist(positions[-1], (325, 100)) <= boss.speed * 2 + 1  # 편대 위치(중심) 바로 앞까지 복귀
+    assert boss.rect.y == 80 and abs(boss.rect.x - 300) <= 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
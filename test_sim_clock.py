@@ -0,0 +1,93 @@
+# tests/test_sim_clock.py
+"""
+시뮬레이션 시계 테스트
+"""
+import pytest
+import pygame
+import sys
+import os
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sim_clock import SimClock
+from enemy import Enemy
+from effects import ScreenShake, FlashEffect
+from powerup import PowerUp, PlayerPowerUps
+
+
+@pytest.fixture
+def pygame_init():
+    """pygame 초기화"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_fixed_and_measured_steps():
+    """고정 모드는 잰 시간을 무시하고, 측정 모드는 잰 시간을 상한까지 dt로 쓰는지 테스트"""
+    fixed = SimClock(step=10)
+    for elapsed in (3, 250, None):
+        assert fixed.tick(elapsed) == 10
+    assert (fixed.now, fixed.frame) == (30, 3)
+    
+    measured = SimClock(step=10, fixed=False, max_step=50)
+    assert [measured.tick(elapsed) for elapsed in (7, 250, None)] == [7, 50, 10]
+    assert measured.now == 67
+    assert measured.since(7) == 60
+
+
+def test_advance_accumulates_fixed_steps():
+    """렌더 프레임 경과 시간을 누적해 스텝 수와 보간 비율을 나누고, 밀린 시간은 상한에서 버리는지 테스트"""
+    clock = SimClock(step=10)
+    assert [clock.advance(elapsed) for elapsed in (4, 4, 4, 25)] == [0, 0, 1, 2]
+    assert clock.alpha == pytest.approx(0.7)
+    
+    # 상한을 넘게 밀리면 최대 스텝만 진행하고 남은 한 스텝 미만만 유지
+    assert clock.advance(1000, max_steps=5) == 5
+    assert clock.alpha == pytest.approx(0.7)
+    
+    measured = SimClock(step=10, fixed=False)
+    assert measured.advance(123) == 1 and measured.alpha == 1.0
+
+
+@pytest.mark.parametrize("step", [8, 16, 33])
+def test_timers_follow_sim_time(pygame_init, step):
+    """스텝 길이가 달라도 적 쿨다운과 이펙트/파워업 타이머가 같은 시뮬레이션 시각에 끝나는지 테스트"""
+    clock = SimClock(step=step)
+    image = pygame.Surface((30, 30))
+    enemy = Enemy(100, 100, Enemy.TYPE_NORMAL, image, image)
+    enemy.in_formation = True
+    enemy.attack_cooldown = 500
+    shake = ScreenShake()
+    shake.start_shake(4, 300)
+    flash = FlashEffect()
+    flash.trigger_flash(200)
+    powerup = PowerUp(100, 100, PowerUp.SHIELD)
+    powerup.speed = 0
+    group = pygame.sprite.Group(powerup)
+    player_powerups = PlayerPowerUps()
+    player_powerups.apply_powerup(powerup)
+    
+    ended = {}
+    while clock.now < 10000:
+        clock.tick()
+        enemy.update(1.0, clock)
+        shake.update(clock)
+        flash.update(clock)
+        group.update(clock)
+        player_powerups.update(clock)
+        states = {'enemy': enemy.attack_cooldown > 0, 'shake': shake.is_shaking(), 'flash': flash.flashing,
+                  'powerup': powerup.alive(), 'shield': player_powerups.shield_active}
+        for name, running in states.items():
+            if not running:
+                ended.setdefault(name, clock.now)
+    
+    expected = {'enemy': 500, 'shake': 300, 'flash': 200, 'powerup': powerup.lifetime,
+                'shield': PowerUp.DURATIONS[PowerUp.SHIELD]}
+    for name, time in expected.items():
+        assert time <= ended[name] < time + 2 * step
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
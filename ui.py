@@ -215,6 +215,7 @@ class UI:
             ("EASY", settings.GREEN, "5 Lives, Slow Enemies, More Powerups"),
             ("NORMAL", settings.YELLOW, "3 Lives, Balanced Gameplay"),
             ("HARD", settings.RED, "2 Lives, Fast Enemies, Fewer Powerups"),
+            ("BULLET HELL", (255, 128, 0), "5 Lives, 5-Way Shots, Dense Barrages"),
         ]
         
         y_start = settings.SCREEN_HEIGHT // 2 - 60
@@ -8,6 +8,8 @@ import random
 from typing import List
 import settings
 from enemy import Enemy
+from formation import FormationController
+from sim_clock import SimClock
 
 
 class WaveManager:
@@ -26,7 +28,10 @@ class WaveManager:
         self.current_wave = 0
         self.is_bonus_stage = False
         self.bonus_stage_time_limit = 20000
-        self.bonus_stage_start_time = 0
+        self.bonus_stage_elapsed = 0  # 보너스 스테이지 시작 후 지난 시뮬레이션 시간 (ms)
+        
+        # 현재 웨이브 편대 (웨이브마다 새로 생성)
+        self.formation = FormationController()
         
         # 플레이어 참조 (카미카제용)
         self.player = None
@@ -41,7 +46,7 @@ class WaveManager:
         
         if wave_number % settings.BONUS_STAGE_INTERVAL == 0:
             self.is_bonus_stage = True
-            self.bonus_stage_start_time = pygame.time.get_ticks()
+            self.bonus_stage_elapsed = 0
             enemies = self._create_bonus_stage()
         else:
             self.is_bonus_stage = False
@@ -117,16 +122,18 @@ class WaveManager:
         spacing_x = (settings.SCREEN_WIDTH - 2 * settings.FORMATION_PADDING) // enemies_per_row
         spacing_y = 50
         
-        path_types = ['circle', 'zigzag', 'straight', 'fast_dive']
+        self.formation = FormationController(num_rows, enemies_per_row,
+                                             (formation_start_x, formation_start_y),
+                                             (spacing_x, spacing_y))
+        
+        path_types = ['circle', 'zigzag', 'straight', 'fast_dive',
+                      'swoop_left', 'swoop_right', 'loop']
         
         # 적 타입 가중치
         weights = self._get_enemy_type_weights(wave_number)
         
         for row in range(num_rows):
             for col in range(enemies_per_row):
-                formation_x = formation_start_x + col * spacing_x
-                formation_y = formation_start_y + row * spacing_y
-                
                 # 첫 번째 행은 보스
                 if row == 0:
                     enemy_type = Enemy.TYPE_BOSS
@@ -143,8 +150,7 @@ class WaveManager:
                     self.bullet_image
                 )
                 
-                enemy.formation_x = formation_x
-                enemy.formation_y = formation_y
+                self.formation.place(enemy, row, col)
                 
                 # 타입별 진입 경로
                 if enemy_type == Enemy.TYPE_FAST:
@@ -169,6 +175,7 @@ class WaveManager:
         enemies = pygame.sprite.Group()
         
         num_enemies = 20
+        self.formation = FormationController(num_enemies // 5, 5, (100, 120), (150, 60))
         
         for i in range(num_enemies):
             x = (i % 5) * 150 + 100
@@ -183,30 +190,33 @@ class WaveManager:
             )
             
             enemy.fire_chance = 0
-            enemy.formation_x = x
-            enemy.formation_y = 120 + (i // 5) * 60
+            self.formation.place(enemy, i // 5, i % 5)
             enemy.set_entry_path('zigzag')
             
             enemies.add(enemy)
         
         return enemies
     
+    def update(self, clock: SimClock) -> None:
+        """편대 슬롯 위치와 보너스 스테이지 시간 진행 (프레임당 한 번)"""
+        self.formation.update(clock.now)
+        if self.is_bonus_stage:
+            self.bonus_stage_elapsed += clock.dt
+    
     def is_bonus_stage_timeout(self) -> bool:
         """보너스 스테이지 시간 초과 확인"""
         if not self.is_bonus_stage:
             return False
         
-        elapsed = pygame.time.get_ticks() - self.bonus_stage_start_time
-        return elapsed >= self.bonus_stage_time_limit
+        return self.bonus_stage_elapsed >= self.bonus_stage_time_limit
     
     def get_bonus_stage_remaining_time(self) -> int:
         """보너스 스테이지 남은 시간"""
         if not self.is_bonus_stage:
             return 0
         
-        elapsed = pygame.time.get_ticks() - self.bonus_stage_start_time
-        remaining = max(0, self.bonus_stage_time_limit - elapsed)
-        return remaining // 1000
+        remaining = max(0, self.bonus_stage_time_limit - self.bonus_stage_elapsed)
+        return int(remaining) // 1000
     
     def next_wave(self) -> pygame.sprite.Group:
         """다음 웨이브로 진행"""